@@ -0,0 +1,125 @@
+"""Benchmark disk usage of daily runs with and without the artifact blob store, and retention GC.
+
+Usage:
+    python benchmarks/bench_blob_store.py --runs 30 --change-every 3 --file-mb 20 --keep-last 7 --output blob_store.json
+
+Each synthetic run writes what the pipeline writes: a feature store, train
+and test splits (each ``--file-mb``) and a model (a quarter of that). The
+data only changes every ``--change-every`` runs, and the model with it, as
+for daily runs on a collection that is refreshed less often. Every run's
+files are stored in the blob store as a completed stage would do it, then
+retention GC keeps ``--keep-last`` runs. Reported: bytes the runs wrote
+against bytes on disk, throughput of storing the files (hashing and
+linking), and what GC removed.
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from networksecurity.constants.train_pipeline import ARTIFACT_TIMESTAMP_FORMAT, PIPELINE_STATE_FILE_NAME
+from networksecurity.entity.artifact_entity import DataIngestionArtifact, ModelTrainerArtifact
+from networksecurity.entity.config_entity import BlobStoreConfig, RetentionConfig
+from networksecurity.pipelines.blob_store import BlobStore
+from networksecurity.pipelines.retention import collect_garbage
+from networksecurity.pipelines.run_state import PipelineRunState
+
+
+def write_file(path: str, size: int, seed: int):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    block = seed.to_bytes(8, "little") * (1 << 17)
+    with open(path, "wb") as file:
+        for offset in range(0, size, len(block)):
+            file.write(block[:size - offset])
+
+
+def disk_usage(root: str) -> int:
+    """Bytes the files under ``root`` take on disk; hardlinked files count once."""
+    inodes = {}
+    for directory, _, names in os.walk(root):
+        for name in names:
+            stat = os.stat(os.path.join(directory, name))
+            inodes[(stat.st_dev, stat.st_ino)] = stat.st_size
+    return sum(inodes.values())
+
+
+def make_run(run_dir: str, version: int, file_bytes: int, blob_store: BlobStore) -> float:
+    paths = {name: os.path.join(run_dir, "DataIngestion", f"{name}.parquet")
+             for name in ("feature_store", "train", "test")}
+    for i, path in enumerate(paths.values()):
+        write_file(path, file_bytes, version * 10 + i)
+    model_path = os.path.join(run_dir, "model_trainer", "trained_model", "model.pkl")
+    write_file(model_path, file_bytes // 4, version * 10 + 9)
+
+    ingestion = DataIngestionArtifact(train_path=paths["train"], test_path=paths["test"],
+                                      feature_store_path=paths["feature_store"])
+    trainer = ModelTrainerArtifact(trained_model_file_path=model_path, metrics_file_path=None,
+                                   best_model_name="RandomForestClassifier", best_model_params={},
+                                   train_f1_score=0.99, test_f1_score=0.97)
+    state = PipelineRunState(os.path.join(run_dir, PIPELINE_STATE_FILE_NAME))
+    start = time.perf_counter()
+    for stage_name, artifact in (("data_ingestion", ingestion), ("model_trainer", trainer)):
+        if blob_store is not None:
+            artifact.blobs = blob_store.intern_artifact(artifact)
+        state.mark_completed(stage_name, artifact)
+    return time.perf_counter() - start
+
+
+def run_case(runs: int, change_every: int, file_bytes: int, keep_last: int, use_store: bool) -> dict:
+    with tempfile.TemporaryDirectory() as artifact_root:
+        blob_store = BlobStore(BlobStoreConfig(artifact_root)) if use_store else None
+        start = datetime(2025, 1, 1)
+        store_seconds = 0.0
+        for i in range(runs):
+            run_dir = os.path.join(artifact_root, (start + timedelta(days=i)).strftime(ARTIFACT_TIMESTAMP_FORMAT))
+            store_seconds += make_run(run_dir, i // change_every, file_bytes, blob_store)
+        on_disk = disk_usage(artifact_root)
+
+        retention_config = RetentionConfig(artifact_root)
+        retention_config.keep_last_runs = keep_last
+        retention_config.keep_validated_runs = 0
+        gc_start = time.perf_counter()
+        result = collect_garbage(retention_config)
+        gc_seconds = time.perf_counter() - gc_start
+        after_gc = disk_usage(artifact_root)
+
+    stored_bytes = runs * file_bytes * 3.25
+    return {
+        "blob_store": use_store, "runs": runs,
+        "written_mb": round(stored_bytes / 1e6, 1), "on_disk_mb": round(on_disk / 1e6, 1),
+        "store_mb_per_s": round(stored_bytes / 1e6 / store_seconds, 1) if use_store else None,
+        "gc_seconds": round(gc_seconds, 3), "runs_removed": len(result["runs_removed"]),
+        "blobs_removed": result["blobs_removed"], "after_gc_mb": round(after_gc / 1e6, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--change-every", type=int, default=3)
+    parser.add_argument("--file-mb", type=float, default=20)
+    parser.add_argument("--keep-last", type=int, default=7)
+    parser.add_argument("--output", help="optional path of a JSON results file")
+    args = parser.parse_args()
+
+    file_bytes = int(args.file_mb * 1e6)
+    results = [run_case(args.runs, args.change_every, file_bytes, args.keep_last, use_store)
+               for use_store in (False, True)]
+
+    print(f"{'blob store':>11}{'written MB':>12}{'on disk MB':>12}{'store MB/s':>12}"
+          f"{'gc s':>8}{'runs gc':>9}{'blobs gc':>10}{'after gc MB':>13}")
+    for row in results:
+        store_rate = f"{row['store_mb_per_s']:.0f}" if row["store_mb_per_s"] else "-"
+        print(f"{'yes' if row['blob_store'] else 'no':>11}{row['written_mb']:>12.0f}{row['on_disk_mb']:>12.0f}"
+              f"{store_rate:>12}{row['gc_seconds']:>8.3f}{row['runs_removed']:>9}{row['blobs_removed']:>10}"
+              f"{row['after_gc_mb']:>13.0f}")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
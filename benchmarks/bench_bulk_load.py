@@ -0,0 +1,108 @@
+"""Benchmark push_data.py loaders: one insert_many of the whole file vs. the chunked bulk loader.
+
+Usage:
+    python benchmarks/bench_bulk_load.py --rows 100000 --workers 1 2 4 8 --latency-ms 5 --output bulk_load.json
+
+Writes go to the in-process stand-in in ``local_mongo.py``; ``--latency-ms`` is added
+per round trip to model a remote server. Compute runs under the GIL, so worker
+scaling here reflects overlapped round trips only; run against a real server
+(``--mongodb-uri``) for end-to-end numbers.
+"""
+import argparse
+import importlib.util
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from local_mongo import LocalMongoClient, patched_mongo_client
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_CSV = os.path.join(REPO_ROOT, "Network_Data", "phisingData.csv")
+
+
+def _load_push_data():
+    spec = importlib.util.spec_from_file_location("push_data", os.path.join(REPO_ROOT, "push_data.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_csv(rows: int, directory: str) -> str:
+    """Resample the phishing dataset to ``rows`` rows."""
+    source = pd.read_csv(SOURCE_CSV)
+    indices = np.random.default_rng(0).integers(0, len(source), size=rows)
+    path = os.path.join(directory, f"bulk_{rows}.csv")
+    source.iloc[indices].to_csv(path, index=False)
+    return path
+
+
+def _timed_load(push_data, client, mongodb_uri, load):
+    collection = f"run_{time.monotonic_ns()}"
+    if client is None:
+        extractor = push_data.NetworkDataExtract("bench", collection, mongodb_uri=mongodb_uri)
+    else:
+        with patched_mongo_client(client):
+            extractor = push_data.NetworkDataExtract("bench", collection, mongodb_uri="local")
+    start = time.perf_counter()
+    load(extractor)
+    return time.perf_counter() - start
+
+
+def run(rows: int, workers_list: list, chunk_size: int, latency_ms: float, mongodb_uri: str = None) -> list:
+    push_data = _load_push_data()
+    client = LocalMongoClient(latency_ms=latency_ms) if mongodb_uri is None else None
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = make_csv(rows, directory)
+
+        def record(loader, workers, upsert, seconds):
+            results.append({
+                "loader": loader, "rows": rows, "workers": workers, "upsert": upsert,
+                "seconds": round(seconds, 3), "rows_per_s": round(rows / seconds, 1),
+            })
+
+        record("insert_many", 1, False,
+               _timed_load(push_data, client, mongodb_uri, lambda e: e.insert_from_csv(csv_path)))
+        for upsert in (False, True):
+            for workers in workers_list:
+                seconds = _timed_load(
+                    push_data, client, mongodb_uri,
+                    lambda e: e.bulk_load_from_csv(csv_path, chunk_size=chunk_size, workers=workers, upsert=upsert)
+                )
+                record("bulk_load", workers, upsert, seconds)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="simulated round-trip latency")
+    parser.add_argument("--mongodb-uri", help="benchmark against a real server instead of the stand-in")
+    parser.add_argument("--output", help="optional path of a JSON results file")
+    args = parser.parse_args()
+    output = os.path.abspath(args.output) if args.output else None
+
+    # Relative paths in the pipeline constants (schema.yaml) resolve against the repository root
+    os.chdir(REPO_ROOT)
+
+    results = run(args.rows, args.workers, args.chunk_size, args.latency_ms, args.mongodb_uri)
+
+    print(f"{'loader':>12}{'upsert':>8}{'workers':>9}{'seconds':>10}{'rows/s':>12}")
+    for row in results:
+        print(f"{row['loader']:>12}{str(row['upsert']):>8}{row['workers']:>9}"
+              f"{row['seconds']:>10.3f}{row['rows_per_s']:>12,.0f}")
+
+    if output:
+        with open(output, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Measure how far packed-row deduplication shrinks the data and the profiling work.
+
+Usage:
+    python benchmarks/bench_dedup.py --rows 1000000 10000000 --output dedup.json
+
+Every dataset (``Network_Data/phisingData.csv`` and synthetic data at each ``--rows``)
+is packed into uint64 keys with ``RowCodec`` and collapsed into a ``DedupIndex``.
+Reported: distinct rows and dedup ratio, the memory of the index vs. the int8 frame,
+the packing throughput, and the time to profile the rows from the frame vs. the index.
+"""
+import argparse
+import json
+import time
+
+import pandas as pd
+
+from synthetic import SOURCE_CSV, SyntheticPhishingData
+
+from networksecurity.utilities.data_profile import DataProfile
+from networksecurity.utilities.packed_rows import DedupIndex, RowCodec
+from networksecurity.utilities.schema import apply_schema_dtypes
+
+
+def _timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def measure(name: str, df: pd.DataFrame, schema_config: dict) -> dict:
+    codec = RowCodec.from_schema(schema_config)
+    (keys, packable), encode_s = _timed(codec.encode, df)
+    index = DedupIndex(codec)
+    _, index_s = _timed(index.add, keys[packable])
+    _, frame_profile_s = _timed(DataProfile.from_dataframe, df, schema_config)
+    _, index_profile_s = _timed(DataProfile.from_dedup_index, index, schema_config)
+    return {
+        "dataset": name,
+        "rows": len(df),
+        "unpacked_rows": int((~packable).sum()),
+        "unique_rows": index.unique_rows,
+        "dedup_ratio": index.dedup_ratio,
+        "frame_bytes": int(df.memory_usage(index=False).sum()),
+        "index_bytes": index.nbytes,
+        "encode_rows_per_s": len(df) / encode_s,
+        "index_build_s": index_s,
+        "frame_profile_s": frame_profile_s,
+        "index_profile_s": index_profile_s,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="optional path of a JSON results file")
+    args = parser.parse_args()
+
+    generator = SyntheticPhishingData(seed=args.seed)
+    schema_config = generator.schema_config
+    source = apply_schema_dtypes(pd.read_csv(SOURCE_CSV, na_values=["na"]).dropna(), schema_config)
+    results = [measure("phisingData.csv", source[generator.columns], schema_config)]
+    for rows in args.rows:
+        results.append(measure(f"synthetic_{rows}", generator.frame(rows), schema_config))
+
+    print(f"{'dataset':>20}{'rows':>12}{'distinct':>12}{'ratio':>8}{'frame MB':>10}{'index MB':>10}"
+          f"{'Mrows/s':>9}{'profile frame':>15}{'profile index':>15}")
+    for row in results:
+        print(f"{row['dataset']:>20}{row['rows']:>12}{row['unique_rows']:>12}{row['dedup_ratio']:>8.2f}"
+              f"{row['frame_bytes'] / 1e6:>10.1f}{row['index_bytes'] / 1e6:>10.1f}"
+              f"{row['encode_rows_per_s'] / 1e6:>9.1f}{row['frame_profile_s']:>14.3f}s{row['index_profile_s']:>14.3f}s")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
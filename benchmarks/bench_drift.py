@@ -0,0 +1,83 @@
+"""Benchmark the vectorized drift engine against the per-column ks_2samp loop.
+
+Usage:
+    python benchmarks/bench_drift.py --rows 1000000 10000000 --columns 300 --output drift.json
+
+The legacy loop is only timed up to ``--legacy-max-rows`` rows, it takes minutes beyond that.
+"""
+import argparse
+import json
+import time
+
+import numpy as np
+import pandas as pd
+from scipy.stats import ks_2samp
+
+from networksecurity.utilities.drift import detect_drift
+
+
+def legacy_drift_checking(base_df: pd.DataFrame, current_df: pd.DataFrame, threshold: float = 0.05):
+    """The per-column KS loop DataValidation.drift_checking used before the vectorized engine."""
+    drift_report = {}
+    for col in base_df.columns:
+        _, p_val = ks_2samp(current_df[col], base_df[col])
+        drift_report[col] = {"p_val": float(p_val), "drift_detected": bool(p_val < threshold)}
+    return any(v["drift_detected"] for v in drift_report.values()), drift_report
+
+
+def make_frame(rows: int, columns: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    data = rng.integers(-1, 2, size=(rows, columns), dtype=np.int8)
+    return pd.DataFrame(data, columns=[f"feature_{i}" for i in range(columns)])
+
+
+def _timed(func, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def run(rows_list: list, columns: int, legacy_max_rows: int) -> list:
+    results = []
+    for rows in rows_list:
+        base_df = make_frame(rows, columns, seed=0)
+        current_df = make_frame(rows, columns, seed=1)
+
+        vectorized_s = _timed(detect_drift, base_df, current_df, value_range=(-1, 1))
+        legacy_s = None
+        if rows <= legacy_max_rows:
+            legacy_s = _timed(legacy_drift_checking, base_df, current_df)
+
+        results.append({
+            "rows": rows,
+            "columns": columns,
+            "vectorized_s": round(vectorized_s, 4),
+            "legacy_ks_s": round(legacy_s, 4) if legacy_s is not None else None,
+            "speedup": round(legacy_s / vectorized_s, 1) if legacy_s is not None else None,
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000, 10_000_000])
+    parser.add_argument("--columns", type=int, default=300)
+    parser.add_argument("--legacy-max-rows", type=int, default=1_000_000)
+    parser.add_argument("--output", help="optional path of a JSON results file")
+    args = parser.parse_args()
+
+    results = run(args.rows, args.columns, args.legacy_max_rows)
+
+    print(f"{'rows':>12}{'columns':>9}{'vectorized_s':>14}{'legacy_ks_s':>13}{'speedup':>9}")
+    for row in results:
+        legacy = f"{row['legacy_ks_s']:.3f}" if row["legacy_ks_s"] is not None else "-"
+        speedup = f"{row['speedup']}x" if row["speedup"] is not None else "-"
+        print(f"{row['rows']:>12}{row['columns']:>9}{row['vectorized_s']:>14.3f}{legacy:>13}{speedup:>9}")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark the streaming drift monitor (DriftMonitor) on a long synthetic record stream.
+
+Usage:
+    python benchmarks/bench_drift_monitor.py --records 1000000 --window 10000 --slide 2000 --output drift_monitor.json
+
+The baseline is profiled from ``Network_Data/phisingData.csv``; the stream is
+``--records`` synthetic rows. Reported: records/s fed one record at a time
+(``update``, timed on ``--single-records``) and in batches (``update_frame``),
+the number of window reports, and the monitor's window state and peak RSS
+sampled along the stream, which should stay flat however long it runs.
+"""
+import argparse
+import json
+import resource
+import time
+
+import pandas as pd
+
+from synthetic import SOURCE_CSV, SyntheticPhishingData
+
+from networksecurity.components.drift_monitor import DriftMonitor
+from networksecurity.entity.config_entity import DriftMonitorConfig
+from networksecurity.utilities.data_profile import DataProfile
+
+
+def _peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=1_000_000)
+    parser.add_argument("--single-records", type=int, default=50_000)
+    parser.add_argument("--window", type=int, default=10_000)
+    parser.add_argument("--slide", type=int, default=2_000)
+    parser.add_argument("--batch-records", type=int, default=1_000)
+    parser.add_argument("--output", help="optional path of a JSON results file")
+    args = parser.parse_args()
+
+    generator = SyntheticPhishingData()
+    source = pd.read_csv(SOURCE_CSV, na_values=["na"])
+    baseline = DataProfile.from_dataframe(source, generator.schema_config)
+    config = DriftMonitorConfig(window_records=args.window, slide_records=args.slide)
+    config.report_file_path = None
+
+    monitor = DriftMonitor(config, baseline)
+    records = generator.frame(args.single_records).to_dict("records")
+    start = time.perf_counter()
+    for record in records:
+        monitor.update(record)
+    single_elapsed = time.perf_counter() - start
+
+    monitor = DriftMonitor(config, baseline)
+    samples = []
+    elapsed = 0.0
+    for chunk in generator.iter_chunks(args.records, chunk_size=100_000):
+        start = time.perf_counter()
+        for offset in range(0, len(chunk), args.batch_records):
+            monitor.update_frame(chunk.iloc[offset:offset + args.batch_records])
+        elapsed += time.perf_counter() - start
+        samples.append({"records": monitor.windows.records, "state_bytes": monitor.windows.nbytes,
+                        "peak_rss_mb": round(_peak_rss_mb(), 1)})
+
+    result = {
+        "window": args.window, "slide": args.slide, "batch_records": args.batch_records,
+        "single_records_per_s": len(records) / single_elapsed,
+        "batch_records_per_s": monitor.windows.records / elapsed,
+        "records": monitor.windows.records,
+        "reports": monitor.reports,
+        "drifted_reports": monitor.drifted_reports,
+        "memory": samples,
+    }
+    print(f"update():       {result['single_records_per_s']:>12,.0f} records/s")
+    print(f"update_frame(): {result['batch_records_per_s']:>12,.0f} records/s "
+          f"({result['reports']} reports, {result['drifted_reports']} drifted)")
+    print(f"{'records':>12}{'state bytes':>14}{'peak RSS MB':>14}")
+    for sample in samples:
+        print(f"{sample['records']:>12,}{sample['state_bytes']:>14,}{sample['peak_rss_mb']:>14}")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(result, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Compare feature store backends on a scaled-up copy of phisingData.csv.
+
+Usage:
+    python benchmarks/bench_feature_store.py --scale 100 --output feature_store.json
+"""
+import argparse
+import json
+import os
+import shutil
+import tempfile
+import time
+
+import pandas as pd
+
+from networksecurity.constants.train_pipeline import SCHEMA_FILE_PATH
+from networksecurity.utilities.feature_store import FEATURE_STORE_BACKENDS, get_feature_store
+from networksecurity.utilities.schema import read_csv_with_schema
+from networksecurity.utilities.utils import read_yaml_file
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DATA_FILE_PATH = os.path.join("Network_Data", "phisingData.csv")
+PROJECTED_COLUMNS = ["SSLfinal_State", "URL_of_Anchor", "Result"]
+
+
+def _timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def run(scale: int, formats: list, repeat: int) -> list:
+    schema_config = read_yaml_file(SCHEMA_FILE_PATH)
+    base_df = read_csv_with_schema(DATA_FILE_PATH, schema_config)
+    df = pd.concat([base_df] * scale, ignore_index=True)
+
+    results = []
+    work_dir = tempfile.mkdtemp(prefix="feature_store_bench_")
+    try:
+        for file_format in formats:
+            store = get_feature_store(file_format, schema_config)
+            file_path = os.path.join(work_dir, "data" + store.extension)
+
+            write_s = min(_timed(store.write, df, file_path)[0] for _ in range(repeat))
+            read_s = min(_timed(store.read, file_path)[0] for _ in range(repeat))
+            projected_read_s = min(
+                _timed(store.read, file_path, columns=PROJECTED_COLUMNS)[0] for _ in range(repeat)
+            )
+            results.append({
+                "format": file_format,
+                "rows": len(df),
+                "write_s": round(write_s, 4),
+                "read_s": round(read_s, 4),
+                "projected_read_s": round(projected_read_s, 4),
+                "size_bytes": store.size_on_disk(file_path),
+            })
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, default=100, help="number of copies of the dataset to stack")
+    parser.add_argument("--formats", nargs="+", default=list(FEATURE_STORE_BACKENDS))
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement, best one is kept")
+    parser.add_argument("--output", help="optional path of a JSON results file")
+    args = parser.parse_args()
+    output = os.path.abspath(args.output) if args.output else None
+
+    # Relative paths in the pipeline constants (schema.yaml) resolve against the repository root
+    os.chdir(REPO_ROOT)
+
+    results = run(args.scale, args.formats, args.repeat)
+
+    print(f"{'format':<10}{'rows':>12}{'write_s':>10}{'read_s':>10}{'proj_s':>10}{'size_MB':>10}")
+    for row in results:
+        print(f"{row['format']:<10}{row['rows']:>12}{row['write_s']:>10.3f}{row['read_s']:>10.3f}"
+              f"{row['projected_read_s']:>10.3f}{row['size_bytes'] / 1e6:>10.2f}")
+
+    if output:
+        with open(output, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Benchmark of handing a split from one pipeline stage to the next: through files vs. FrameHandle.
+
+Usage:
+    python benchmarks/bench_handoff.py --rows 2000000 --formats csv parquet --output handoff.json
+
+``file`` is the old path: the producer writes the split and the consumer reads it
+back. ``handle`` passes the frame in memory while it is written on a background
+thread; ``consumer_ready_s`` is when the consumer has the frame and ``end_to_end_s``
+includes the finished write. The ``process`` rows hand a frame to a worker process,
+pickled through the pipe vs. through a FrameHandle's shared memory block.
+"""
+import argparse
+import json
+import os
+import pickle
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from synthetic import SyntheticPhishingData, REPO_ROOT
+
+from networksecurity.utilities.feature_store import get_feature_store
+from networksecurity.utilities.frame_handle import FrameHandle
+
+
+def _checksum(frame) -> int:
+    return int(frame.iloc[:, 0].sum())
+
+
+def _checksum_handle(handle: FrameHandle) -> int:
+    return _checksum(handle.frame)
+
+
+def bench_file(df, feature_store, path: str) -> dict:
+    start = time.perf_counter()
+    feature_store.write(df, path)
+    _checksum(feature_store.read(path))
+    seconds = time.perf_counter() - start
+    return {"consumer_ready_s": seconds, "end_to_end_s": seconds}
+
+
+def bench_handle(df, feature_store, path: str) -> dict:
+    start = time.perf_counter()
+    handle = FrameHandle(df).persist(feature_store.write, path)
+    _checksum(handle.frame)
+    ready = time.perf_counter() - start
+    handle.wait()
+    return {"consumer_ready_s": ready, "end_to_end_s": time.perf_counter() - start}
+
+
+def _pickled_size(payload) -> int:
+    data = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+    pickle.loads(data)  # a FrameHandle's shared memory block is released by the receiver
+    return len(data)
+
+
+def bench_process(df, pool) -> list:
+    results = []
+    for method, func, payload in (("pickle", _checksum, df), ("shared_memory", _checksum_handle, FrameHandle(df))):
+        start = time.perf_counter()
+        pool.submit(func, payload).result()
+        seconds = time.perf_counter() - start
+        results.append({"handoff": f"process_{method}", "consumer_ready_s": seconds, "end_to_end_s": seconds,
+                        "pickled_bytes": _pickled_size(payload)})
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--formats", nargs="+", default=["csv", "parquet", "numpy"])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="optional path of a JSON results file")
+    args = parser.parse_args()
+    output = os.path.abspath(args.output) if args.output else None
+
+    # Relative paths in the pipeline constants (schema.yaml) resolve against the repository root
+    os.chdir(REPO_ROOT)
+
+    generator = SyntheticPhishingData(seed=args.seed)
+    df = generator.frame(args.rows)
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for name in args.formats:
+            feature_store = get_feature_store(name, generator.schema_config)
+            for handoff, bench in (("file", bench_file), ("handle", bench_handle)):
+                path = os.path.join(directory, f"{handoff}_train{feature_store.extension}")
+                results.append({"handoff": handoff, "format": name, **bench(df, feature_store, path)})
+
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        pool.submit(int).result()  # start the worker outside the measurement
+        results.extend({"format": None, **row} for row in bench_process(df, pool))
+
+    print(f"{'handoff':>22}{'format':>9}{'consumer ready':>16}{'end to end':>12}")
+    for row in results:
+        row["rows"] = args.rows
+        print(f"{row['handoff']:>22}{row['format'] or '-':>9}{row['consumer_ready_s']:>15.3f}s"
+              f"{row['end_to_end_s']:>11.3f}s")
+
+    if output:
+        with open(output, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
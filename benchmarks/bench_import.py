@@ -0,0 +1,110 @@
+"""Import-time budget check for the package's entry points, based on ``python -X importtime``.
+
+Usage:
+    python benchmarks/bench_import.py --repeat 5 --output import.json
+
+Every module is imported in a fresh interpreter, in an empty working directory and
+without ``MONGODB_URI``. A module fails the check if its median cumulative import
+time is over budget, if it pulls in a dependency that must load lazily, or if the
+import raises or leaves files behind. The exit status is 1 when any check fails.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cumulative import time budgets in milliseconds; pandas and numpy alone take ~500 ms
+BUDGETS_MS = {
+    "networksecurity.utilities.logger": 50,
+    "networksecurity.constants.train_pipeline": 20,
+    "networksecurity.entity.config_entity": 900,
+    "networksecurity.components.data_ingestion": 1000,
+    "networksecurity.components.data_validation": 1000,
+    "networksecurity.pipelines.training_pipeline": 1100,
+}
+
+# Heavy or environment-dependent modules that must only be imported at first use
+LAZY_MODULES = ["sklearn", "scipy", "pymongo", "bson", "certifi", "dotenv", "jupyter_lsp"]
+
+
+def import_profile(module: str, work_dir: str) -> dict:
+    """Import ``module`` in a fresh interpreter and return ``{imported module: cumulative us}``."""
+    env = {key: value for key, value in os.environ.items() if key != "MONGODB_URI"}
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [REPO_ROOT, env.get("PYTHONPATH")]))
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=work_dir, env=env, capture_output=True, text=True,
+    )
+    if process.returncode != 0:
+        raise RuntimeError(process.stderr.strip().splitlines()[-1])
+
+    profile = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            profile[name.strip()] = int(cumulative)
+    return profile
+
+
+def check_module(module: str, budget_ms: float, repeat: int, startup_modules: set) -> dict:
+    with tempfile.TemporaryDirectory() as work_dir:
+        try:
+            profiles = [import_profile(module, work_dir) for _ in range(repeat)]
+        except RuntimeError as e:
+            return {"module": module, "passed": False, "error": str(e)}
+        leftovers = sorted(os.listdir(work_dir))
+
+    median_ms = statistics.median(profile[module] for profile in profiles) / 1000
+    # Ignore modules the interpreter already loads at startup (e.g. from .pth files)
+    imported = {name.split(".")[0] for name in profiles[0] if name not in startup_modules}
+    loaded_lazy = sorted(imported & set(LAZY_MODULES))
+    return {
+        "module": module,
+        "median_ms": round(median_ms, 1),
+        "budget_ms": budget_ms,
+        "eager_heavy_imports": loaded_lazy,
+        "files_created": leftovers,
+        "passed": median_ms <= budget_ms and not loaded_lazy and not leftovers,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--modules", nargs="+", default=list(BUDGETS_MS))
+    parser.add_argument("--output", help="optional path of a JSON results file")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        startup_modules = set(import_profile("sys", work_dir))
+    results = [
+        check_module(module, BUDGETS_MS.get(module, float("inf")), args.repeat, startup_modules)
+        for module in args.modules
+    ]
+
+    for row in results:
+        status = "ok" if row["passed"] else "FAIL"
+        if "error" in row:
+            print(f"{status:>4}  {row['module']}: import failed: {row['error']}")
+            continue
+        problems = [f"eager: {', '.join(row['eager_heavy_imports'])}"] if row["eager_heavy_imports"] else []
+        if row["files_created"]:
+            problems.append(f"created: {', '.join(row['files_created'])}")
+        print(f"{status:>4}  {row['module']:<46}{row['median_ms']:>8.1f} ms / {row['budget_ms']:.0f} ms  "
+              + "; ".join(problems))
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+    sys.exit(0 if all(row["passed"] for row in results) else 1)
+
+
+if __name__ == "__main__":
+    main()
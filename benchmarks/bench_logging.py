@@ -0,0 +1,99 @@
+"""Micro-benchmark of logging throughput: the old synchronous setup vs. the queue-based one.
+
+Usage:
+    python benchmarks/bench_logging.py --records 200000 --output logging.json
+
+Both setups write colored lines to a console stream (``os.devnull`` here) and plain
+lines to a log file. ``caller_records_per_s`` is what a hot loop sees;
+``end_to_end_records_per_s`` includes draining the queue to the handlers.
+"""
+import argparse
+import json
+import logging
+import os
+import tempfile
+import time
+
+from networksecurity.utilities.logger import configure_logging, log_format, date_format
+
+
+class LegacyColorFormatter(logging.Formatter):
+    """The formatter logger.py used before: builds a new Formatter for every record."""
+    FORMATS = {level: "\033[92m%s\033[0m" for level in (logging.DEBUG, logging.INFO, logging.WARNING,
+                                                       logging.ERROR, logging.CRITICAL)}
+
+    def format(self, record):
+        log_fmt = self.FORMATS.get(record.levelno) % self._fmt
+        return logging.Formatter(log_fmt, datefmt=self.datefmt).format(record)
+
+
+def _make_logger(name: str) -> logging.Logger:
+    target = logging.getLogger(name)
+    target.propagate = False
+    for handler in list(target.handlers):
+        target.removeHandler(handler)
+    return target
+
+
+def _emit(target: logging.Logger, records: int) -> float:
+    start = time.perf_counter()
+    for i in range(records):
+        target.info("Processed batch %d of %d", i, records)
+    return time.perf_counter() - start
+
+
+def bench_legacy(records: int, log_file: str, console) -> dict:
+    target = _make_logger("bench.legacy")
+    target.setLevel(logging.INFO)
+    console_handler = logging.StreamHandler(console)
+    console_handler.setFormatter(LegacyColorFormatter(log_format, date_format))
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setFormatter(logging.Formatter(log_format, date_format))
+    target.addHandler(console_handler)
+    target.addHandler(file_handler)
+
+    seconds = _emit(target, records)
+    file_handler.close()
+    return {"setup": "sync", "records": records, "caller_s": seconds, "end_to_end_s": seconds}
+
+
+def bench_queue(records: int, log_file: str, console, json_format: bool) -> dict:
+    target = _make_logger("bench.queue" + (".json" if json_format else ""))
+    listener = configure_logging(target, json_format=json_format, log_file=log_file, stream=console)
+
+    start = time.perf_counter()
+    caller_s = _emit(target, records)
+    listener.stop()
+    end_to_end_s = time.perf_counter() - start
+    for handler in listener.handlers:
+        handler.close()
+    return {"setup": "queue_json" if json_format else "queue", "records": records,
+            "caller_s": caller_s, "end_to_end_s": end_to_end_s}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--records", type=int, default=200_000)
+    parser.add_argument("--output", help="optional path of a JSON results file")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory, open(os.devnull, "w") as console:
+        results.append(bench_legacy(args.records, os.path.join(directory, "legacy.log"), console))
+        results.append(bench_queue(args.records, os.path.join(directory, "queue.log"), console, False))
+        results.append(bench_queue(args.records, os.path.join(directory, "json.log"), console, True))
+
+    print(f"{'setup':>12}{'records':>10}{'caller rec/s':>15}{'end-to-end rec/s':>19}")
+    for row in results:
+        row["caller_records_per_s"] = round(row["records"] / row["caller_s"], 1)
+        row["end_to_end_records_per_s"] = round(row["records"] / row["end_to_end_s"], 1)
+        print(f"{row['setup']:>12}{row['records']:>10}{row['caller_records_per_s']:>15,.0f}"
+              f"{row['end_to_end_records_per_s']:>19,.0f}")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Benchmark the model trainer's hyperparameter search: worker scaling and the fitted-candidate cache.
+
+Usage:
+    python benchmarks/bench_model_search.py --rows 100000 --workers 1 2 4 --output model_search.json
+
+For every ``--workers`` count the configured search space (MODEL_TRAINER_SEARCH_SPACE)
+is run on synthetic data against an empty candidate cache (``cold``) and again
+against the cache it filled (``warm``, no candidate is refitted).
+"""
+import argparse
+import json
+import tempfile
+import time
+
+from synthetic import SyntheticPhishingData
+
+from networksecurity.constants.train_pipeline import (
+    MODEL_TRAINER_CV_FOLDS, MODEL_TRAINER_SEARCH_SPACE, TARGET_COLUMN
+)
+from networksecurity.utilities.frame_handle import FrameHandle, frame_digest
+from networksecurity.utilities.model_search import expand_search_space, search_candidates
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="optional path of a JSON results file")
+    args = parser.parse_args()
+
+    df = SyntheticPhishingData(seed=args.seed).frame(args.rows)
+    digest = frame_digest(df)
+    candidates = len(expand_search_space(MODEL_TRAINER_SEARCH_SPACE))
+    results = []
+    for workers in args.workers:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            for cache in ("cold", "warm"):
+                start = time.perf_counter()
+                search = search_candidates(FrameHandle(df), TARGET_COLUMN, digest, MODEL_TRAINER_SEARCH_SPACE,
+                                           cache_dir, cv_folds=MODEL_TRAINER_CV_FOLDS, workers=workers)
+                results.append({
+                    "rows": args.rows, "workers": workers, "cache": cache, "candidates": candidates,
+                    "fitted": sum(not result["cached"] for result in search),
+                    "seconds": time.perf_counter() - start,
+                    "best": f"{search[0]['estimator']} {search[0]['params']}",
+                })
+
+    print(f"{'workers':>8}{'cache':>7}{'fitted':>8}{'seconds':>10}  best")
+    for row in results:
+        print(f"{row['workers']:>8}{row['cache']:>7}{row['fitted']:>8}{row['seconds']:>10.2f}  {row['best']}")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""Benchmark the parallel ``_id``-range scan of DataIngestion against the single cursor.
+
+Usage:
+    python benchmarks/bench_parallel_scan.py --rows 200000 --workers 1 2 4 8 --latency-ms 5 --output parallel_scan.json
+
+The collection is ``--rows`` synthetic documents in the in-process stand-in of
+``local_mongo.py``, which adds ``--latency-ms`` per round trip (every cursor
+batch) to model a remote server. ``--workers 1`` is the single-cursor scan;
+higher counts read ``_id`` ranges of ``--partition-rows`` documents
+concurrently (in ``_id`` order, as in the pipeline). Decoding runs under the
+GIL, so scaling here reflects overlapped round trips only.
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from local_mongo import LocalMongoClient, patched_mongo_client
+from synthetic import SyntheticPhishingData, REPO_ROOT
+
+from networksecurity.components.data_ingestion import DataIngestion
+from networksecurity.entity.config_entity import DataIngestionConfig, TrainingPipelineConfig
+
+
+def load_collection(client: LocalMongoClient, rows: int, config: DataIngestionConfig):
+    collection = client[config.database_name][config.collection_name]
+    for chunk in SyntheticPhishingData().iter_chunks(rows, chunk_size=100_000):
+        collection.insert_many(chunk.astype(int).to_dict("records"))
+
+
+def time_scan(data_ingestion: DataIngestion) -> tuple:
+    start = time.perf_counter()
+    rows = sum(len(chunk) for chunk in data_ingestion.iter_data_from_mongodb())
+    return rows, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--latency-ms", type=float, default=5.0)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--partition-rows", type=int, default=25_000)
+    parser.add_argument("--output", help="optional path of a JSON results file")
+    args = parser.parse_args()
+    output = os.path.abspath(args.output) if args.output else None
+
+    # Relative paths in the pipeline constants (schema.yaml) resolve against the repository root
+    os.chdir(REPO_ROOT)
+
+    os.environ.setdefault("MONGODB_URI", "mongodb://localhost:27017")
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        training_pipeline_config = TrainingPipelineConfig()
+        training_pipeline_config.artifact_name = directory
+        training_pipeline_config.artifact_dir = os.path.join(directory, training_pipeline_config.timestamp)
+        config = DataIngestionConfig(training_pipeline_config=training_pipeline_config)
+        config.batch_size = args.batch_size
+        config.scan_partition_rows = args.partition_rows
+
+        client = LocalMongoClient(latency_ms=args.latency_ms)
+        load_collection(client, args.rows, config)
+        with patched_mongo_client(client):
+            for workers in args.workers:
+                config.scan_workers = workers
+                rows, seconds = time_scan(DataIngestion(config))
+                results.append({"workers": workers, "rows": rows, "seconds": round(seconds, 3),
+                                "rows_per_s": round(rows / seconds, 1)})
+
+    baseline = results[0]["rows_per_s"]
+    print(f"{'workers':>8}{'seconds':>10}{'rows/s':>12}{'speedup':>9}")
+    for row in results:
+        print(f"{row['workers']:>8}{row['seconds']:>10.3f}{row['rows_per_s']:>12,.0f}"
+              f"{row['rows_per_s'] / baseline:>9.2f}")
+
+    if output:
+        with open(output, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
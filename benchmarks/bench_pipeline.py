@@ -0,0 +1,195 @@
+"""End-to-end scale benchmark of the ingestion and validation stages on synthetic data.
+
+Usage:
+    python benchmarks/bench_pipeline.py --rows 1000000 10000000 100000000 --output pipeline.json
+
+For every scale it times, and records throughput and peak RSS of:
+  - ingestion: ``DataIngestion.get_data_from_mongodb`` + ``export_data_to_feature_store``
+    against the in-process Mongo stand-in (only up to ``--ingestion-max-rows``; the
+    stand-in holds every document as a dict, so larger scales would measure it, not us)
+  - split: ``DataIngestion.split_and_store_train_test``
+  - validate: ``DataValidation.validate_dataset`` on the train and test splits
+  - drift: ``DataValidation.drift_checking`` between the splits
+
+The JSON output carries the git commit, library versions and host so that runs can be
+compared over time. Artifacts are written to a temporary directory unless ``--work-dir`` is set.
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from local_mongo import LocalMongoClient, patched_mongo_client
+from synthetic import SyntheticPhishingData, REPO_ROOT
+
+os.environ.setdefault("MONGODB_URI", "mongodb://localhost:27017")
+
+from networksecurity.components.data_ingestion import DataIngestion
+from networksecurity.components.data_validation import DataValidation
+from networksecurity.entity.config_entity import TrainingPipelineConfig, DataIngestionConfig, DataValidationConfig
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def current_rss() -> int:
+    """Resident set size of this process in bytes (Linux), else the peak so far."""
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * PAGE_SIZE
+    except OSError:
+        scale = 1 if sys.platform == "darwin" else 1024
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+
+
+class PeakRSS:
+    """Sample RSS on a background thread while the ``with`` block runs."""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.start = self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, current_rss())
+
+    def __enter__(self):
+        self.start = self.peak = current_rss()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, current_rss())
+
+
+def measure(stage: str, rows: int, func, *args, **kwargs):
+    """Run ``func`` and return its result with a result row for ``stage``."""
+    with PeakRSS() as rss:
+        cpu_start, wall_start = time.process_time(), time.perf_counter()
+        result = func(*args, **kwargs)
+        wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+    row = {
+        "stage": stage,
+        "rows": rows,
+        "seconds": round(wall, 4),
+        "cpu_seconds": round(cpu, 4),
+        "rows_per_s": round(rows / wall, 1) if wall else None,
+        "peak_rss_mb": round(rss.peak / 2**20, 1),
+        "rss_delta_mb": round((rss.peak - rss.start) / 2**20, 1),
+    }
+    print(f"{rows:>12}  {stage:<10}{row['seconds']:>10.3f}s{row['rows_per_s'] or 0:>14,.0f} rows/s"
+          f"{row['peak_rss_mb']:>10.0f} MB peak")
+    return result, row
+
+
+def _load_collection(client: LocalMongoClient, config: DataIngestionConfig, generator: SyntheticPhishingData,
+                     rows: int):
+    collection = client[config.database_name][config.collection_name]
+    for chunk in generator.iter_chunks(rows, chunk_size=100_000):
+        collection.insert_many(chunk.to_dict("records"))
+
+
+def _ingest(data_ingestion: DataIngestion) -> pd.DataFrame:
+    df = data_ingestion.get_data_from_mongodb()
+    data_ingestion.export_data_to_feature_store(df)
+    return df
+
+
+def run_scale(rows: int, generator: SyntheticPhishingData, work_dir: str, ingestion_max_rows: int) -> list:
+    training_pipeline_config = TrainingPipelineConfig()
+    training_pipeline_config.artifact_name = os.path.join(work_dir, f"rows_{rows}")
+    training_pipeline_config.artifact_dir = os.path.join(training_pipeline_config.artifact_name,
+                                                         training_pipeline_config.timestamp)
+    data_ingestion_config = DataIngestionConfig(training_pipeline_config=training_pipeline_config)
+    data_ingestion = DataIngestion(data_ingestion_config=data_ingestion_config)
+    results = []
+
+    if rows <= ingestion_max_rows:
+        client = LocalMongoClient()
+        _load_collection(client, data_ingestion_config, generator, rows)
+        with patched_mongo_client(client):
+            df, row = measure("ingestion", rows, _ingest, data_ingestion)
+        results.append(row)
+        del client
+    else:
+        df = generator.frame(rows)
+
+    artifact, row = measure("split", rows, data_ingestion.split_and_store_train_test, df)
+    results.append(row)
+    del df
+
+    data_validation = DataValidation(
+        data_validation_config=DataValidationConfig(training_pipeline_config=training_pipeline_config),
+        data_ingestion_artifact=artifact
+    )
+    train_df = data_ingestion._feature_store.read(artifact.train_path)
+    test_df = data_ingestion._feature_store.read(artifact.test_path)
+
+    def validate_both():
+        return data_validation.validate_dataset(train_df) and data_validation.validate_dataset(test_df)
+
+    _, row = measure("validate", rows, validate_both)
+    results.append(row)
+    _, row = measure("drift", rows, DataValidation.drift_checking, train_df, test_df)
+    results.append(row)
+    return results
+
+
+def run_metadata(seed: int) -> dict:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "git_commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "seed": seed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000, 10_000_000, 100_000_000])
+    parser.add_argument("--ingestion-max-rows", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--work-dir", help="directory for artifacts (default: a temporary directory)")
+    parser.add_argument("--output", help="optional path of a JSON results file")
+    args = parser.parse_args()
+    output = os.path.abspath(args.output) if args.output else None
+
+    # Relative paths in the pipeline constants (schema.yaml) resolve against the repository root
+    os.chdir(REPO_ROOT)
+    generator = SyntheticPhishingData(seed=args.seed)
+    report = {"meta": run_metadata(args.seed), "results": []}
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        work_dir = os.path.abspath(args.work_dir) if args.work_dir else temp_dir
+        for rows in args.rows:
+            report["results"].extend(run_scale(rows, generator, work_dir, args.ingestion_max_rows))
+
+    if output:
+        with open(output, "w") as file:
+            json.dump(report, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Benchmark memoized batch prediction (BatchPrediction) against plain ``model.predict``.
+
+Usage:
+    python benchmarks/bench_prediction.py --rows 1000000 10000000 --policies lru lfu --output prediction.json
+
+Two kinds of traffic at every ``--rows``: ``synthetic`` rows (features drawn
+independently, so few vectors repeat) and ``resampled`` rows drawn with replacement
+from the records of ``Network_Data/phisingData.csv`` (every vector repeats). Each
+policy is timed on a cold cache and again on the cache warmed by the first pass.
+The model is ``--model`` or a random forest fitted on phisingData.csv.
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from synthetic import SOURCE_CSV, SyntheticPhishingData, REPO_ROOT
+
+from networksecurity.components.batch_prediction import BatchPrediction
+from networksecurity.constants.train_pipeline import PREDICTION_BATCH_ROWS, TARGET_COLUMN
+from networksecurity.entity.config_entity import BatchPredictionConfig
+from networksecurity.utilities.utils import save_object, load_object
+
+
+def fit_model(source: pd.DataFrame, features: list):
+    from sklearn.ensemble import RandomForestClassifier
+    model = RandomForestClassifier(n_estimators=64, max_depth=16, random_state=0)
+    return model.fit(source[features].to_numpy(dtype=np.float32), source[TARGET_COLUMN].to_numpy())
+
+
+def plain_predict(model, df: pd.DataFrame, features: list, batch_rows: int) -> np.ndarray:
+    return np.concatenate([
+        model.predict(df[features].iloc[start:start + batch_rows].to_numpy(dtype=np.float32))
+        for start in range(0, len(df), batch_rows)
+    ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000_000])
+    parser.add_argument("--policies", nargs="+", default=["lru", "lfu"])
+    parser.add_argument("--capacity", type=int, help="cache capacity (default PREDICTION_CACHE_CAPACITY)")
+    parser.add_argument("--batch-rows", type=int, default=PREDICTION_BATCH_ROWS)
+    parser.add_argument("--model", help="pickled model to score with")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="optional path of a JSON results file")
+    args = parser.parse_args()
+    output = os.path.abspath(args.output) if args.output else None
+
+    # Relative paths in the pipeline constants (schema.yaml) resolve against the repository root
+    os.chdir(REPO_ROOT)
+
+    generator = SyntheticPhishingData(seed=args.seed)
+    features = generator.features
+    source = pd.read_csv(SOURCE_CSV, na_values=["na"]).dropna()[generator.columns].astype(np.int8)
+    rng = np.random.default_rng(args.seed)
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        model_path = args.model or os.path.join(directory, "model.pkl")
+        if not args.model:
+            save_object(model_path, fit_model(source, features))
+        model = load_object(model_path)
+
+        for rows in args.rows:
+            traffic = {
+                "synthetic": generator.frame(rows),
+                "resampled": source.iloc[rng.integers(0, len(source), rows)].reset_index(drop=True),
+            }
+            for name, df in traffic.items():
+                start = time.perf_counter()
+                expected = plain_predict(model, df, features, args.batch_rows)
+                plain_s = time.perf_counter() - start
+                results.append({"traffic": name, "rows": rows, "method": "model.predict", "pass": "-",
+                                "seconds": plain_s, "hit_rate": None, "model_row_ratio": 1.0})
+
+                for policy in args.policies:
+                    config = BatchPredictionConfig(model_file_path=model_path, cache_policy=policy)
+                    config.batch_rows = args.batch_rows
+                    if args.capacity:
+                        config.cache_capacity = args.capacity
+                    predictor = BatchPrediction(config)
+                    for run in ("cold", "warm"):
+                        before = predictor.stats()
+                        start = time.perf_counter()
+                        predictions = predictor.predict(df)
+                        seconds = time.perf_counter() - start
+                        if not np.array_equal(predictions, expected):
+                            raise AssertionError(f"{policy} {run}: memoized predictions differ from model.predict")
+                        after = predictor.stats()
+                        lookups = after["lookups"] - before["lookups"]
+                        results.append({
+                            "traffic": name, "rows": rows, "method": f"memoized_{policy}", "pass": run,
+                            "seconds": seconds,
+                            "hit_rate": (after["hits"] - before["hits"]) / lookups if lookups else 0.0,
+                            "model_row_ratio": (after["predicted_rows"] - before["predicted_rows"]) / rows,
+                            "cache_size": after["size"], "cache_bytes": after["bytes"],
+                            "speedup": plain_s / seconds,
+                        })
+
+    print(f"{'traffic':>10}{'rows':>11}{'method':>15}{'pass':>6}{'seconds':>9}{'hit rate':>10}"
+          f"{'to model':>10}{'speedup':>9}")
+    for row in results:
+        hit_rate = "-" if row["hit_rate"] is None else f"{row['hit_rate']:.1%}"
+        speedup = f"{row['speedup']:.1f}x" if "speedup" in row else "-"
+        print(f"{row['traffic']:>10}{row['rows']:>11}{row['method']:>15}{row['pass']:>6}{row['seconds']:>9.3f}"
+              f"{hit_rate:>10}{row['model_row_ratio']:>10.1%}{speedup:>9}")
+
+    if output:
+        with open(output, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""Benchmark history queries on the run registry against walking the Artifacts tree.
+
+Usage:
+    python benchmarks/bench_run_registry.py --runs 1000 5000 --output run_registry.json
+
+For every ``--runs`` a synthetic Artifacts tree is written: one run directory per
+run with ``pipeline_state.json`` and a drift report of the schema's features
+(each feature drifts in about ``--drift-rate`` of the runs; about 1 in 10 runs
+fails validation). Timed: backfilling the registry (``index_all``), a no-op
+re-index, and three questions answered both by the registry and by walking the
+tree and parsing every run's YAML: which runs passed validation, when did a
+feature first drift, and a feature's full drift history.
+"""
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from synthetic import SyntheticPhishingData
+
+from networksecurity.constants.train_pipeline import ARTIFACT_TIMESTAMP_FORMAT, PIPELINE_STATE_FILE_NAME
+from networksecurity.entity.config_entity import RunRegistryConfig
+from networksecurity.pipelines.run_registry import RunRegistry
+from networksecurity.pipelines.run_state import PipelineRunState
+from networksecurity.utilities.utils import read_yaml_file, write_yaml_file
+
+
+def make_runs(artifact_root: str, runs: int, features: list, drift_rate: float, seed: int = 0):
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1)
+    model_path = os.path.join(artifact_root, "model.pkl")
+    os.makedirs(artifact_root, exist_ok=True)
+    with open(model_path, "wb") as file:
+        file.write(os.urandom(1 << 16))
+
+    for i in range(runs):
+        run_dir = os.path.join(artifact_root, (start + timedelta(hours=i)).strftime(ARTIFACT_TIMESTAMP_FORMAT))
+        report_path = os.path.join(run_dir, "data_validation", "drift_report", "report.yaml")
+        report = {}
+        for feature in features:
+            drifted = rng.random() < drift_rate
+            p_val = rng.random() * 1e-4 if drifted else rng.random()
+            report[feature] = {"p_val": p_val, "drift_detected": drifted, "chi2": rng.random() * 10,
+                               "psi": rng.random() / 10, "js_divergence": rng.random() / 100}
+        is_drift = any(stats["drift_detected"] for stats in report.values())
+        report["overall_drift_status"] = {"is_drift_detected": is_drift, "baseline": "Artifacts/baseline/profile.yaml"}
+        os.makedirs(os.path.dirname(report_path))
+        write_yaml_file(report_path, report)
+
+        finished_at = (start + timedelta(hours=i, minutes=5)).timestamp()
+        state = {
+            "stages": {
+                "data_validation": {"status": "completed", "finished_at": finished_at, "cached": False,
+                                    "artifact": {"validation_status": not is_drift,
+                                                 "drift_report_file_path": report_path}},
+                "model_trainer": {"status": "completed", "finished_at": finished_at, "cached": False,
+                                  "artifact": {"trained_model_file_path": model_path,
+                                               "best_model_name": "RandomForestClassifier",
+                                               "test_f1_score": 0.95 + rng.random() / 20}},
+            },
+            "timings": {},
+        }
+        with open(os.path.join(run_dir, PIPELINE_STATE_FILE_NAME), "w") as file:
+            json.dump(state, file)
+
+
+def walk_runs(artifact_root: str):
+    """``(run_id, state, drift report)`` of every run, the way it is done without a registry."""
+    for _, state_path in sorted(PipelineRunState._runs(artifact_root)):
+        state = PipelineRunState(state_path)
+        validation = state.stages.get("data_validation", {}).get("artifact", {})
+        report = read_yaml_file(validation["drift_report_file_path"]) if validation else {}
+        yield os.path.basename(os.path.dirname(state_path)), validation, report
+
+
+def timed(function, repeat: int = 1) -> tuple:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = function()
+    return result, (time.perf_counter() - start) / repeat * 1000
+
+
+def run_scale(runs: int, features: list, drift_rate: float) -> dict:
+    feature = features[0]
+    with tempfile.TemporaryDirectory() as artifact_root:
+        make_runs(artifact_root, runs, features, drift_rate)
+        registry = RunRegistry(RunRegistryConfig(artifact_root))
+        _, backfill_ms = timed(registry.index_all)
+        _, reindex_ms = timed(registry.index_all)
+
+        passed, registry_passed_ms = timed(lambda: registry.runs(validation_status=True), repeat=20)
+        first, registry_first_ms = timed(lambda: registry.first_drift(feature), repeat=20)
+        history, registry_history_ms = timed(lambda: registry.feature_history(feature), repeat=20)
+
+        walk_passed, walk_passed_ms = timed(
+            lambda: [run_id for run_id, validation, _ in walk_runs(artifact_root) if validation["validation_status"]]
+        )
+        walk_first, walk_first_ms = timed(
+            lambda: next(run_id for run_id, _, report in walk_runs(artifact_root) if report[feature]["drift_detected"])
+        )
+        assert len(walk_passed) == len(passed) and walk_first == first["run_id"]
+
+    return {
+        "runs": runs,
+        "backfill_ms": round(backfill_ms, 1), "reindex_ms": round(reindex_ms, 1),
+        "registry_passed_ms": round(registry_passed_ms, 3), "walk_passed_ms": round(walk_passed_ms, 1),
+        "registry_first_drift_ms": round(registry_first_ms, 3), "walk_first_drift_ms": round(walk_first_ms, 1),
+        "registry_history_ms": round(registry_history_ms, 3), "history_rows": len(history),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, nargs="+", default=[1000])
+    parser.add_argument("--drift-rate", type=float, default=0.005)
+    parser.add_argument("--output", help="optional path of a JSON results file")
+    args = parser.parse_args()
+
+    features = SyntheticPhishingData().features
+    results = [run_scale(runs, features, args.drift_rate) for runs in args.runs]
+
+    print(f"{'runs':>7}{'backfill ms':>13}{'reindex ms':>12}  {'passed: registry / walk ms':>28}"
+          f"  {'first drift: registry / walk ms':>33}{'history ms':>12}")
+    for row in results:
+        print(f"{row['runs']:>7}{row['backfill_ms']:>13.0f}{row['reindex_ms']:>12.0f}"
+              f"  {row['registry_passed_ms']:>13.2f} / {row['walk_passed_ms']:>10.0f}"
+              f"  {row['registry_first_drift_ms']:>18.2f} / {row['walk_first_drift_ms']:>10.0f}"
+              f"{row['registry_history_ms']:>12.2f}")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
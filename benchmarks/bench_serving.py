@@ -0,0 +1,143 @@
+"""Load generator for the micro-batching prediction server (serve.py).
+
+Usage:
+    python benchmarks/bench_serving.py --windows 0 1 2 5 10 --concurrency 64 --duration 10 --output serving.json
+
+For every batch window a server is started in a subprocess and ``--concurrency``
+keep-alive clients post feature vectors (records of ``Network_Data/phisingData.csv``)
+as fast as they get answers, for ``--duration`` seconds. Reported: throughput,
+client-side latency percentiles, refused (503) requests and the server's batch sizes.
+Client and server share the machine, so compare windows rather than absolute numbers.
+"""
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from bench_prediction import fit_model
+from synthetic import REPO_ROOT, SOURCE_CSV, SyntheticPhishingData
+
+from networksecurity.utilities.utils import save_object
+
+
+async def _request(reader, writer, method: str, path: str, body: bytes = b""):
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    status = int((await reader.readuntil(b"\r\n")).split(b" ", 2)[1])
+    length = 0
+    while True:
+        line = await reader.readuntil(b"\r\n")
+        if line == b"\r\n":
+            break
+        name, _, value = line.decode().partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    return status, await reader.readexactly(length)
+
+
+async def _wait_ready(port: int, timeout: float = 60.0):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            status, _ = await _request(reader, writer, "GET", "/health")
+            writer.close()
+            if status == 200:
+                return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+        await asyncio.sleep(0.2)
+
+
+async def _client(port: int, payloads: list, stop_at: float, offset: int, latencies: list, statuses: dict):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    i = offset
+    while time.perf_counter() < stop_at:
+        start = time.perf_counter()
+        status, _ = await _request(reader, writer, "POST", "/predict", payloads[i % len(payloads)])
+        if status == 200:
+            latencies.append(time.perf_counter() - start)
+        statuses[status] = statuses.get(status, 0) + 1
+        i += 1
+    writer.close()
+
+
+async def run_load(port: int, payloads: list, concurrency: int, duration: float) -> dict:
+    await _wait_ready(port)
+    latencies, statuses = [], {}
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _client(port, payloads, start + duration, k * 997, latencies, statuses) for k in range(concurrency)
+    ))
+    elapsed = time.perf_counter() - start
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    _, stats = await _request(reader, writer, "GET", "/stats")
+    writer.close()
+    stats = json.loads(stats)
+    p50, p99 = np.percentile(latencies, [50, 99]) * 1000 if latencies else (float("nan"),) * 2
+    return {
+        "requests_per_s": len(latencies) / elapsed,
+        "p50_ms": float(p50), "p99_ms": float(p99),
+        "refused": statuses.get(503, 0),
+        "errors": sum(count for status, count in statuses.items() if status not in (200, 503)),
+        "mean_batch_size": stats["mean_batch_size"],
+        "batch_sizes": stats["batch_sizes"],
+        "server_latency": stats["latency"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--windows", type=float, nargs="+", default=[0, 1, 2, 5, 10], help="batch windows in ms")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--max-batch-size", type=int, default=512)
+    parser.add_argument("--port", type=int, default=18080)
+    parser.add_argument("--model", help="pickled model to serve")
+    parser.add_argument("--output", help="optional path of a JSON results file")
+    args = parser.parse_args()
+
+    generator = SyntheticPhishingData()
+    source = pd.read_csv(SOURCE_CSV, na_values=["na"]).dropna()[generator.columns].astype(np.int8)
+    payloads = [json.dumps(record).encode() for record in source[generator.features].to_dict("records")]
+
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        model_path = args.model or os.path.join(directory, "model.pkl")
+        if not args.model:
+            save_object(model_path, fit_model(source, generator.features))
+
+        for window in args.windows:
+            server = subprocess.Popen(
+                [sys.executable, "serve.py", "--model", model_path, "--port", str(args.port),
+                 "--batch-window-ms", str(window), "--max-batch-size", str(args.max_batch_size)],
+                cwd=REPO_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            )
+            try:
+                row = asyncio.run(run_load(args.port, payloads, args.concurrency, args.duration))
+            finally:
+                server.terminate()
+                server.wait()
+            results.append({"batch_window_ms": window, "concurrency": args.concurrency, **row})
+
+    print(f"{'window ms':>10}{'req/s':>10}{'p50 ms':>9}{'p99 ms':>9}{'refused':>9}{'mean batch':>12}  batch sizes")
+    for row in results:
+        print(f"{row['batch_window_ms']:>10g}{row['requests_per_s']:>10.0f}{row['p50_ms']:>9.2f}{row['p99_ms']:>9.2f}"
+              f"{row['refused']:>9}{row['mean_batch_size']:>12.1f}  {row['batch_sizes']}")
+
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
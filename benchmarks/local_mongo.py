@@ -0,0 +1,215 @@
+"""In-process stand-in for the subset of pymongo used by the pipeline.
+
+It keeps documents in memory in ``_id`` order and can add a fixed ``latency_ms``
+per round trip (each write call and each cursor batch), which is what makes
+batching and concurrent workers measurable without a server. Not a general
+MongoDB emulator: only the queries and operations the pipeline issues are supported.
+"""
+import bisect
+import contextlib
+import copy
+import random
+import threading
+import time
+from types import SimpleNamespace
+
+import pymongo
+from bson import ObjectId
+
+from networksecurity.utilities.mongo import close_mongo_clients
+
+
+def _match_id(query: dict, oid) -> bool:
+    condition = query.get("_id")
+    if condition is None:
+        return True
+    if not isinstance(condition, dict):
+        return oid == condition
+    checks = {"$gt": oid.__gt__, "$gte": oid.__ge__, "$lt": oid.__lt__, "$lte": oid.__le__}
+    return all(checks[op](value) for op, value in condition.items())
+
+
+def _project(document: dict, projection: dict) -> dict:
+    if not projection:
+        return dict(document)
+    included = {key for key, flag in projection.items() if flag and key != "_id"}
+    if included:
+        result = {key: document[key] for key in included if key in document}
+        if projection.get("_id", 1):
+            result["_id"] = document["_id"]
+        return result
+    excluded = {key for key, flag in projection.items() if not flag}
+    return {key: value for key, value in document.items() if key not in excluded}
+
+
+class LocalCursor:
+    def __init__(self, collection, query, projection, batch_size):
+        self._collection = collection
+        self._query = query or {}
+        self._projection = projection
+        self._batch_size = batch_size or 101
+        self._descending = False
+
+    def sort(self, key_or_list, direction=None):
+        keys = key_or_list if isinstance(key_or_list, list) else [(key_or_list, direction)]
+        if [key for key, _ in keys] != ["_id"]:
+            raise NotImplementedError("LocalCursor only sorts on _id")
+        self._descending = keys[0][1] == pymongo.DESCENDING
+        return self
+
+    def __iter__(self):
+        documents = self._collection._select(self._query)
+        if self._descending:
+            documents = documents[::-1]
+        for start in range(0, len(documents), self._batch_size):
+            self._collection._round_trip()
+            for document in documents[start:start + self._batch_size]:
+                yield _project(document, self._projection)
+
+
+class LocalCollection:
+    def __init__(self, latency_s: float):
+        self._latency_s = latency_s
+        self._lock = threading.Lock()
+        self._random = random.Random(0)
+        self._ids = []
+        self._documents = []
+        self._unique = {}
+
+    def _round_trip(self):
+        if self._latency_s:
+            time.sleep(self._latency_s)
+
+    def _select(self, query: dict) -> list:
+        with self._lock:
+            condition = (query or {}).get("_id")
+            if isinstance(condition, dict):
+                low, high = 0, len(self._ids)
+                if "$gt" in condition:
+                    low = max(low, bisect.bisect_right(self._ids, condition["$gt"]))
+                if "$gte" in condition:
+                    low = max(low, bisect.bisect_left(self._ids, condition["$gte"]))
+                if "$lt" in condition:
+                    high = min(high, bisect.bisect_left(self._ids, condition["$lt"]))
+                if "$lte" in condition:
+                    high = min(high, bisect.bisect_right(self._ids, condition["$lte"]))
+                return self._documents[low:high]
+            return [doc for doc in self._documents if _match_id(query or {}, doc["_id"])]
+
+    def _insert(self, document: dict):
+        document = copy.copy(document)
+        document.setdefault("_id", ObjectId())
+        for field, index in self._unique.items():
+            if field in document:
+                if document[field] in index:
+                    raise pymongo.errors.DuplicateKeyError(f"duplicate {field}: {document[field]}")
+                index[document[field]] = document
+        self._ids.append(document["_id"])
+        self._documents.append(document)
+        return document["_id"]
+
+    def create_index(self, key, unique=False, **kwargs):
+        with self._lock:
+            if unique and key not in self._unique:
+                self._unique[key] = {doc[key]: doc for doc in self._documents if key in doc}
+        return f"{key}_1"
+
+    def insert_one(self, document):
+        self._round_trip()
+        with self._lock:
+            return SimpleNamespace(inserted_id=self._insert(document))
+
+    def insert_many(self, documents, ordered=True):
+        self._round_trip()
+        with self._lock:
+            return SimpleNamespace(inserted_ids=[self._insert(document) for document in documents])
+
+    def bulk_write(self, operations, ordered=True):
+        """Supports ``UpdateOne(filter, {"$setOnInsert": doc}, upsert=True)`` keyed on a unique field."""
+        self._round_trip()
+        upserted, matched = 0, 0
+        with self._lock:
+            for operation in operations:
+                (field, value), = operation._filter.items()
+                index = self._unique.get(field)
+                if index is not None and value in index:
+                    matched += 1
+                    continue
+                self._insert({**operation._doc.get("$setOnInsert", {}), field: value})
+                upserted += 1
+        return SimpleNamespace(upserted_count=upserted, matched_count=matched)
+
+    def find(self, filter=None, projection=None, batch_size=0, **kwargs):
+        return LocalCursor(self, filter, projection, batch_size)
+
+    def find_one(self, filter=None, projection=None, sort=None):
+        cursor = LocalCursor(self, filter, projection, 1)
+        if sort:
+            cursor.sort(sort)
+        return next(iter(cursor), None)
+
+    def aggregate(self, pipeline):
+        """Supports ``$match`` on ``_id``, ``$sample`` and ``$project``, in that order (split point sampling)."""
+        self._round_trip()
+        documents = self._documents
+        for stage in pipeline:
+            (operator, argument), = stage.items()
+            if operator == "$match":
+                documents = self._select(argument)
+            elif operator == "$sample":
+                indices = self._random.sample(range(len(documents)), min(argument["size"], len(documents)))
+                documents = [documents[i] for i in indices]
+            elif operator == "$project":
+                documents = [_project(document, argument) for document in documents]
+            else:
+                raise NotImplementedError(f"LocalCollection.aggregate does not support {operator}")
+        return iter(documents)
+
+    def count_documents(self, filter):
+        return len(self._select(filter))
+
+    def estimated_document_count(self):
+        return len(self._documents)
+
+
+class LocalMongoClient:
+    def __init__(self, latency_ms: float = 0.0):
+        self._latency_s = latency_ms / 1000.0
+        self._databases = {}
+        self.admin = SimpleNamespace(command=lambda *args, **kwargs: {"ok": 1.0})
+
+    def __getitem__(self, name):
+        database = self._databases.setdefault(name, {})
+        return _LocalDatabase(database, self._latency_s)
+
+    def server_info(self):
+        return {"version": "local"}
+
+    def close(self):
+        pass
+
+
+class _LocalDatabase:
+    def __init__(self, collections: dict, latency_s: float):
+        self._collections = collections
+        self._latency_s = latency_s
+
+    def __getitem__(self, name):
+        return self._collections.setdefault(name, LocalCollection(self._latency_s))
+
+
+@contextlib.contextmanager
+def patched_mongo_client(client: LocalMongoClient):
+    """Make every ``pymongo.MongoClient(...)`` call in the pipeline return ``client``.
+
+    The process-wide pooled clients are dropped on entry and exit, so the
+    pipeline picks up ``client`` and later runs do not keep reusing it.
+    """
+    original = pymongo.MongoClient
+    close_mongo_clients()
+    pymongo.MongoClient = lambda *args, **kwargs: client
+    try:
+        yield client
+    finally:
+        pymongo.MongoClient = original
+        close_mongo_clients()
@@ -0,0 +1,92 @@
+"""Synthetic phishing data at arbitrary scale, with the schema.yaml columns and dtypes.
+
+Every feature is drawn from its empirical distribution in ``Network_Data/phisingData.csv``
+conditioned on the target, so per-column value frequencies and the feature/target
+association match the real data (correlations between features are not modelled).
+Generation is chunked and seeded: the same ``seed`` and ``chunk_size`` always give the same rows.
+
+Usage:
+    python benchmarks/synthetic.py --rows 10000000 --output synthetic_10m.parquet
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from networksecurity.constants.train_pipeline import SCHEMA_FILE_PATH, TARGET_COLUMN
+from networksecurity.utilities.feature_store import get_feature_store_for_path
+from networksecurity.utilities.schema import get_domain_range, apply_schema_dtypes
+from networksecurity.utilities.utils import read_yaml_file
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_CSV = os.path.join(REPO_ROOT, "Network_Data", "phisingData.csv")
+
+
+class SyntheticPhishingData:
+    """Sampler of schema-conformant rows fitted to a source dataset."""
+
+    def __init__(self, source_csv: str = SOURCE_CSV, schema_path: str = None, seed: int = 0):
+        self.schema_config = read_yaml_file(schema_path or os.path.join(REPO_ROOT, SCHEMA_FILE_PATH))
+        self.columns = list(self.schema_config["columns"])
+        self.features = [col for col in self.columns if col != TARGET_COLUMN]
+        self.seed = seed
+
+        source = pd.read_csv(source_csv, na_values=["na"]).dropna()
+        low, high = get_domain_range(self.schema_config) or (
+            int(source[self.columns].min().min()), int(source[self.columns].max().max())
+        )
+        self.values = np.arange(low, high + 1, dtype=np.int8)
+
+        target = source[TARGET_COLUMN].to_numpy()
+        self.classes = np.unique(target).astype(np.int8)
+        self.class_probs = np.array([(target == cls).mean() for cls in self.classes])
+
+        # cumulative[c, j, v]: P(feature j <= values[v] | target == classes[c])
+        matrix = source[self.features].to_numpy()
+        counts = np.stack([
+            np.stack([(matrix[target == cls] == value).sum(axis=0) for value in self.values], axis=-1)
+            for cls in self.classes
+        ]).astype(np.float64)
+        self.cumulative = np.cumsum(counts / counts.sum(axis=-1, keepdims=True), axis=-1)
+
+    def _sample_chunk(self, rng: np.random.Generator, rows: int) -> pd.DataFrame:
+        class_index = rng.choice(len(self.classes), size=rows, p=self.class_probs)
+        data = {}
+        for j, col in enumerate(self.features):
+            # Inverse-CDF sampling against the class-conditional distribution of this column
+            uniform = rng.random(rows)
+            value_index = (uniform[:, None] > self.cumulative[class_index, j, :-1]).sum(axis=1)
+            data[col] = self.values[value_index]
+        data[TARGET_COLUMN] = self.classes[class_index]
+        return pd.DataFrame(data, columns=self.columns)
+
+    def iter_chunks(self, rows: int, chunk_size: int = 1_000_000):
+        """Yield DataFrames with ``rows`` rows in total."""
+        rng = np.random.default_rng(self.seed)
+        for start in range(0, rows, chunk_size):
+            yield apply_schema_dtypes(self._sample_chunk(rng, min(chunk_size, rows - start)), self.schema_config)
+
+    def frame(self, rows: int, chunk_size: int = 1_000_000) -> pd.DataFrame:
+        chunks = list(self.iter_chunks(rows, chunk_size))
+        return chunks[0] if len(chunks) == 1 else pd.concat(chunks, ignore_index=True)
+
+    def write(self, path: str, rows: int, chunk_size: int = 1_000_000):
+        """Write ``rows`` rows with the feature store backend matching the file extension."""
+        store = get_feature_store_for_path(path, self.schema_config)
+        store.write(self.frame(rows, chunk_size), path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, required=True)
+    parser.add_argument("--output", required=True, help="destination file (.csv, .parquet or a _npy directory)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-size", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    SyntheticPhishingData(seed=args.seed).write(args.output, args.rows, args.chunk_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,17 @@
-from networksecurity.components.data_validation import DataValidation
-from networksecurity.components.data_ingestion import DataIngestion
+from networksecurity.pipelines.training_pipeline import TrainingPipeline
 from networksecurity.utilities.exception import NetworkSecurityException
 from networksecurity.utilities.logger import logger
-from networksecurity.entity.config_entity import TrainingPipelineConfig, DataIngestionConfig, DataValidationConfig
+import argparse
 import sys
 
 def main():
+    parser = argparse.ArgumentParser(description="Network Security Training Pipeline")
+    parser.add_argument("--resume", action="store_true",
+                        help="continue the most recent run from its last successful stage")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="rerun every stage instead of reusing cached artifacts")
+    args = parser.parse_args()
+
     try:
         logger.info("="*50)
         logger.info("Starting Network Security Training Pipeline")
@@ -13,30 +19,13 @@ def main():
         
         # Initialize configurations
         logger.info("Initializing pipeline configurations...")
-        training_pipeline_config = TrainingPipelineConfig()
-        
-        # Data Ingestion
-        logger.info("\n" + "="*30 + " DATA INGESTION " + "="*30)
-        data_ingestion_config = DataIngestionConfig(training_pipeline_config=training_pipeline_config)
-        data_ingestion = DataIngestion(data_ingestion_config=data_ingestion_config)
-        data_ingestion_artifact = data_ingestion.initiate_data_ingestion()
-        logger.info("Data ingestion completed successfully")
+        training_pipeline = TrainingPipeline(resume=args.resume, use_cache=not args.no_cache)
+        model_trainer_artifact = training_pipeline.run_pipeline()
 
-        # Data Validation
-        logger.info("\n" + "="*30 + " DATA VALIDATION " + "="*30)
-        data_validation_config = DataValidationConfig(training_pipeline_config=training_pipeline_config)
-        data_validation = DataValidation(
-            data_validation_config=data_validation_config,
-            data_ingestion_artifact=data_ingestion_artifact
-        )
-        data_validation_artifact = data_validation.initiate_data_validation()
-        
-        if data_validation_artifact.validation_status:
-            logger.info("Data validation successful")
-        else:
-            logger.warning("! Data validation completed with issues. Check the validation report.")
-            if data_validation_artifact.drift_report_file_path:
-                logger.info(f"Drift report available at: {data_validation_artifact.drift_report_file_path}")
+        logger.info(f"Trained {model_trainer_artifact.best_model_name} "
+                    f"(test f1: {model_trainer_artifact.test_f1_score:.4f})")
+        logger.info(f"Model: {model_trainer_artifact.trained_model_file_path}")
+        logger.info(f"Metrics: {model_trainer_artifact.metrics_file_path}")
         
         logger.info("\n" + "="*50)
         logger.info("Training pipeline completed successfully")
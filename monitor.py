@@ -0,0 +1,44 @@
+from networksecurity.entity.config_entity import DriftMonitorConfig
+from networksecurity.constants import train_pipeline
+from networksecurity.utilities.exception import NetworkSecurityException
+from networksecurity.utilities.logger import logger
+import argparse
+import sys
+
+def main():
+    parser = argparse.ArgumentParser(description="Network Security Streaming Drift Monitor")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--file", help=".jsonl or .csv file of incoming records")
+    source.add_argument("--mongo", action="store_true",
+                        help="watch inserts into the ingestion collection (needs a replica set)")
+    parser.add_argument("--follow", action="store_true", help="keep tailing the file for appended records")
+    parser.add_argument("--window", type=int, default=train_pipeline.DRIFT_MONITOR_WINDOW_RECORDS,
+                        help="records per drift window")
+    parser.add_argument("--slide", type=int, default=train_pipeline.DRIFT_MONITOR_SLIDE_RECORDS,
+                        help="records between reports (equal to --window for tumbling windows)")
+    args = parser.parse_args()
+
+    try:
+        from networksecurity.components.drift_monitor import DriftMonitor
+        from networksecurity.utilities.record_streams import tail_file, mongo_change_stream
+
+        config = DriftMonitorConfig(window_records=args.window, slide_records=args.slide)
+        drift_monitor = DriftMonitor(config)
+        if args.mongo:
+            from networksecurity.utilities.mongo import get_mongo_client
+
+            collection = get_mongo_client()[train_pipeline.DATA_INGESTION_DATABASE_NAME][train_pipeline.DATA_INGESTION_COLLECTION_NAME]
+            batches = mongo_change_stream(collection, config.batch_records)
+        else:
+            batches = tail_file(args.file, follow=args.follow, poll_interval_s=config.poll_interval_s,
+                                batch_records=config.batch_records)
+        summary = drift_monitor.run(batches)
+        logger.info(f"Drift monitor finished: {summary}; reports in {config.report_file_path}")
+    except KeyboardInterrupt:
+        pass
+    except Exception as e:
+        logger.critical("!!! Drift monitor failed !!!")
+        raise NetworkSecurityException(e, sys)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+from networksecurity.entity.artifact_entity import BatchPredictionArtifact, ModelTrainerArtifact
+from networksecurity.entity.config_entity import BatchPredictionConfig
+from networksecurity.constants.train_pipeline import SCHEMA_FILE_PATH
+from networksecurity.pipelines.run_state import PipelineRunState
+from networksecurity.utilities.utils import read_yaml_file, load_object
+from networksecurity.utilities.feature_store import get_feature_store_for_path
+from networksecurity.utilities.packed_rows import RowCodec
+from networksecurity.utilities.prediction_cache import PredictionCache
+from networksecurity.utilities.tracing import trace_span
+from networksecurity.utilities.exception import NetworkSecurityException
+from networksecurity.utilities.logger import logger
+
+import os, sys
+import numpy as np
+import pandas as pd
+
+
+class BatchPrediction:
+    """Scores feature vectors with the trained model, memoizing predictions by packed vector.
+
+    The model is loaded once. Each batch is packed into uint64 keys (see
+    ``RowCodec``); every distinct vector of the batch is looked up in a
+    bounded ``PredictionCache`` and only vectors seen neither in the cache nor
+    earlier in the batch reach ``model.predict``. Rows that cannot be packed
+    (nulls, values outside the schema domains) are always passed to the model.
+    """
+
+    def __init__(self, batch_prediction_config: BatchPredictionConfig):
+        try:
+            logger.info("Initializing BatchPrediction component.")
+            self.batch_prediction_config = batch_prediction_config
+            self._schema_config = read_yaml_file(SCHEMA_FILE_PATH)
+            self.columns = list(self._schema_config["columns"])
+            self.features = [col for col in self.columns if col != batch_prediction_config.target_column]
+            self.codec = RowCodec.from_schema(self._schema_config, self.features)
+            self.cache = PredictionCache(batch_prediction_config.cache_capacity, batch_prediction_config.cache_policy)
+            self.model_file_path = batch_prediction_config.model_file_path or self.latest_model_path(
+                batch_prediction_config.artifact_dir
+            )
+            self.model = load_object(self.model_file_path)
+            logger.info(f"Loaded model from {self.model_file_path}")
+            # Rows of the processed batches: through the cache, duplicated in their batch, or predicted
+            self.rows = 0
+            self.batch_duplicate_rows = 0
+            self.predicted_rows = 0
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    @staticmethod
+    def latest_model_path(artifact_dir: str) -> str:
+        artifact = PipelineRunState.latest_completed_artifact(artifact_dir, "model_trainer", ModelTrainerArtifact)
+        if artifact is None:
+            raise FileNotFoundError(f"No trained model under {artifact_dir}; run the training pipeline first")
+        return artifact.trained_model_file_path
+
+    def _model_predict(self, features: pd.DataFrame) -> np.ndarray:
+        self.predicted_rows += len(features)
+        return self.model.predict(features.to_numpy(dtype=np.float32))
+
+    def _predict_batch(self, batch: pd.DataFrame) -> np.ndarray:
+        keys, packable = self.codec.encode(batch)
+        unique_keys, first_rows, inverse, counts = np.unique(
+            keys[packable], return_index=True, return_inverse=True, return_counts=True
+        )
+        found, values = self.cache.lookup(unique_keys, counts)
+        missing = ~found
+        self.batch_duplicate_rows += int(counts[missing].sum() - missing.sum())
+        if missing.any():
+            packed_rows = np.flatnonzero(packable)
+            predicted = self._model_predict(batch.iloc[packed_rows[first_rows[missing]]])
+            if values is None:
+                values = np.zeros(len(unique_keys), dtype=predicted.dtype)
+            values[missing] = predicted
+            self.cache.insert(unique_keys[missing], predicted, counts[missing])
+
+        if packable.all():
+            return values[inverse]
+        predictions = self._model_predict(batch[~packable])
+        result = np.zeros(len(batch), dtype=predictions.dtype)
+        result[~packable] = predictions
+        if packable.any():
+            result[packable] = values[inverse]
+        return result
+
+    def predict(self, data) -> np.ndarray:
+        """Predictions for a DataFrame with the feature columns, or a 2D array of them in schema order."""
+        try:
+            if isinstance(data, pd.DataFrame):
+                features = data[self.features]
+            else:
+                features = pd.DataFrame(np.asarray(data), columns=self.features, copy=False)
+            batch_rows = self.batch_prediction_config.batch_rows
+            batches = []
+            for start in range(0, len(features), batch_rows):
+                batches.append(self._predict_batch(features.iloc[start:start + batch_rows]))
+            self.rows += len(features)
+            if not batches:
+                return np.zeros(0, dtype=np.int8)
+            return np.concatenate(batches)
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def predict_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """``df``'s features with the predictions as the target column, in schema.yaml column order."""
+        try:
+            predictions = self.predict(df)
+            target_column = self.batch_prediction_config.target_column
+            return pd.DataFrame(
+                {col: predictions if col == target_column else df[col].to_numpy() for col in self.columns},
+                copy=False,
+            )
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def stats(self) -> dict:
+        """Cache statistics plus how the processed rows were answered."""
+        return {
+            **self.cache.stats(),
+            "rows": self.rows,
+            "batch_duplicate_rows": self.batch_duplicate_rows,
+            "predicted_rows": self.predicted_rows,
+            "model_row_ratio": self.predicted_rows / self.rows if self.rows else 0.0,
+        }
+
+    def initiate_batch_prediction(self, input_file_path: str, output_file_path: str = None) -> BatchPredictionArtifact:
+        """Score ``input_file_path`` chunk by chunk into ``output_file_path`` (CSV, parquet or numpy by extension)."""
+        try:
+            output_file_path = output_file_path or self.batch_prediction_config.prediction_output_file_path
+            logger.info(f"Scoring {input_file_path} into {output_file_path}")
+            reader = get_feature_store_for_path(input_file_path, self._schema_config)
+            writer_store = get_feature_store_for_path(output_file_path, self._schema_config)
+            os.makedirs(os.path.dirname(output_file_path) or ".", exist_ok=True)
+            rows = self.rows
+            with trace_span("batch_prediction", path=input_file_path) as span:
+                with writer_store.open_writer(output_file_path, self.columns) as writer:
+                    for chunk in reader.iter_chunks(input_file_path, self.batch_prediction_config.batch_rows,
+                                                    columns=self.features):
+                        writer.write(self.predict_frame(chunk))
+                span.set(rows=self.rows - rows)
+
+            stats = self.stats()
+            logger.info(f"Scored {self.rows - rows} rows; cache hit rate {stats['hit_rate']:.1%}, "
+                        f"{stats['model_row_ratio']:.1%} of rows reached the model")
+            return BatchPredictionArtifact(
+                prediction_file_path=output_file_path,
+                rows=self.rows - rows,
+                cache_stats=stats,
+            )
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
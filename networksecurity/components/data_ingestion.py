@@ -2,70 +2,273 @@ from networksecurity.utilities.exception import NetworkSecurityException
 from networksecurity.utilities.logger import logger
 from networksecurity.entity.config_entity import DataIngestionConfig, TrainingPipelineConfig
 from networksecurity.entity.artifact_entity import DataIngestionArtifact
+from networksecurity.constants.train_pipeline import SCHEMA_FILE_PATH, DATA_INGESTION_ROW_HASH_FIELD
+from networksecurity.utilities.utils import read_yaml_file
+from networksecurity.utilities.schema import apply_schema_dtypes
+from networksecurity.utilities.feature_store import get_feature_store, FeatureStoreManifest, RecentIdWindow
+from networksecurity.utilities.frame_handle import FrameHandle, frame_digest
+from networksecurity.utilities.split import StratifiedHashSplit
+from networksecurity.utilities.packed_rows import RowCodec, DedupIndex
+from networksecurity.utilities.tracing import trace_span
+
+from networksecurity.utilities.mongo import get_mongo_client
+from networksecurity.utilities.partitioned_scan import (
+    PartitionMap, sample_split_points, id_ranges, range_query, scan_partitions
+)
 
 import os
 import sys
+import itertools
+from typing import Iterator
 import numpy as np
 import pandas as pd
-from sklearn.model_selection import train_test_split
-from dotenv import load_dotenv
-import certifi
-import pymongo
 
-load_dotenv()
-MONGODB_URI = os.getenv("MONGODB_URI")
-if not MONGODB_URI:
-    raise ValueError("MONGODB_URI environment variable is not set")
+# pymongo and certifi are imported where they are used, so importing this
+# module stays cheap and does not need MONGODB_URI to be set
+ASCENDING, DESCENDING = 1, -1
 
 class DataIngestion:
     def __init__(self, data_ingestion_config: DataIngestionConfig):
         try:
             self.data_ingestion_config = data_ingestion_config
+            self._schema_config = read_yaml_file(SCHEMA_FILE_PATH)
+            self._feature_store = get_feature_store(data_ingestion_config.feature_store_format, self._schema_config)
         except Exception as e:
             raise NetworkSecurityException(e, sys)
 
-    def get_data_from_mongodb(self):
-        client = None
+    @staticmethod
+    def _to_column_array(values: list) -> np.ndarray:
+        """Convert one column of a record batch into a typed numpy array."""
+        array = np.array(values)
+        if array.dtype.kind in "biuf":
+            return array
+
+        values = [np.nan if value is None or value == "na" else value for value in values]
         try:
-            client = pymongo.MongoClient(
-                MONGODB_URI,
-                tlsCAFile=certifi.where(),
-                serverSelectionTimeoutMS=5000  # 5 second timeout
-            )
-            # Test the connection
-            client.server_info()
+            return np.array(values, dtype=np.float64)
+        except (TypeError, ValueError):
+            return np.array(values, dtype=object)
+
+    @staticmethod
+    def _records_to_frame(records: list, columns: list) -> pd.DataFrame:
+        """Build a DataFrame from a batch of documents, one typed array per column."""
+        data = {
+            col: DataIngestion._to_column_array([record.get(col) for record in records])
+            for col in columns
+        }
+        return pd.DataFrame(data, columns=columns, copy=False)
+
+    @staticmethod
+    def _merge_columns(columns: list, records: list) -> list:
+        """Keep the column order of earlier batches and append any newly seen keys."""
+        seen = dict.fromkeys(columns)
+        for record in records:
+            seen.update(dict.fromkeys(record))
+        seen.pop("_id", None)
+        return list(seen)
+
+    def _get_collection(self):
+        """The configured collection on the process-wide pooled client."""
+        db_name = self.data_ingestion_config.database_name
+        collection_name = self.data_ingestion_config.collection_name
+        return get_mongo_client()[db_name][collection_name]
+
+    def source_fingerprint(self) -> dict:
+        """Cheap summary of the collection's contents (document count and newest ``_id``)."""
+        try:
+            collection = self._get_collection()
+            newest = collection.find_one({}, projection={"_id": 1}, sort=[("_id", DESCENDING)])
+            return {
+                "count": collection.count_documents({}),
+                "max_id": str(newest["_id"]) if newest else None,
+            }
+        except Exception as e:
+            raise NetworkSecurityException(f"Error fetching data from MongoDB: {str(e)}", sys)
+
+    def _iter_record_batches(self, batch_size: int, query: dict = None, projection: dict = None,
+                             sort: list = None) -> Iterator[list]:
+        """Run ``find`` on the configured collection and yield lists of at most ``batch_size`` documents."""
+        try:
+            collection = self._get_collection()
 
-            db_name = self.data_ingestion_config.database_name
-            collection_name = self.data_ingestion_config.collection_name
-            collection = client[db_name][collection_name]
+            cursor = collection.find(query or {}, projection=projection, batch_size=batch_size)
+            if sort:
+                cursor = cursor.sort(sort)
 
-            # Get data with a reasonable timeout
-            cursor = collection.find()
-            df = pd.DataFrame(list(cursor))
+            records = []
+            for document in cursor:
+                records.append(document)
+                if len(records) >= batch_size:
+                    yield records
+                    records = []
 
-            if df.empty:
-                raise NetworkSecurityException("No data found in MongoDB collection", sys)
+            if records:
+                yield records
+
+        except Exception as e:
+            raise NetworkSecurityException(f"Error fetching data from MongoDB: {str(e)}", sys)
 
-            if "_id" in df.columns:
-                df = df.drop(columns=["_id"], axis=1)
-            df.replace({"na": np.nan}, inplace=True)
+    def _iter_frames(self, batch_size: int, query: dict = None, projection: dict = None,
+                     skip_ids: set = None, recent: RecentIdWindow = None) -> Iterator[tuple]:
+        """``(chunk, last_id)`` pairs of the documents matching ``query``, read by one cursor in ``_id`` order.
+
+        Documents whose ``_id`` (as 12 bytes) is in ``skip_ids`` are left out;
+        the ``_id`` of every other document is fed to ``recent``.
+        """
+        columns = []
+        for records in self._iter_record_batches(batch_size, query=query, projection=projection,
+                                                 sort=[("_id", ASCENDING)]):
+            if skip_ids:
+                records = [record for record in records if record["_id"].binary not in skip_ids]
+                if not records:
+                    continue
+            if recent is not None:
+                recent.extend([record["_id"].binary for record in records])
+            columns = self._merge_columns(columns, records)
+            frame = apply_schema_dtypes(self._records_to_frame(records, columns), self._schema_config)
+            yield frame, str(records[-1]["_id"]) if "_id" in records[-1] else None
+
+    def _partition_count(self, documents: int) -> int:
+        config = self.data_ingestion_config
+        return max(config.scan_workers, -(-documents // config.scan_partition_rows))
+
+    def _id_ranges(self, collection, query: dict = None) -> list:
+        """``_id`` ranges for a parallel scan: the stored partition map for the whole
+        collection, freshly sampled split points for the documents matching ``query``."""
+        config = self.data_ingestion_config
+        if query:
+            split_points = sample_split_points(collection, self._partition_count(collection.count_documents(query)),
+                                               query)
+        else:
+            split_points = PartitionMap.for_collection(
+                config.partition_map_file_path, collection,
+                self._partition_count(collection.estimated_document_count()), config.partition_map_max_growth
+            ).split_points
+        return id_ranges(split_points)
+
+    @staticmethod
+    def _rechunk(chunks, rows: int) -> Iterator[pd.DataFrame]:
+        """Re-cut a stream of frames into chunks of exactly ``rows`` rows (the last one may be shorter)."""
+        buffered, count = [], 0
+        for chunk in chunks:
+            buffered.append(chunk)
+            count += len(chunk)
+            while count >= rows:
+                merged = buffered[0] if len(buffered) == 1 else pd.concat(buffered, ignore_index=True)
+                yield merged.iloc[:rows].reset_index(drop=True)
+                rest = merged.iloc[rows:]
+                buffered, count = ([rest] if len(rest) else []), len(rest)
+        if count:
+            merged = buffered[0] if len(buffered) == 1 else pd.concat(buffered, ignore_index=True)
+            yield merged.reset_index(drop=True)
+
+    def iter_data_partitioned(self, batch_size: int = None, workers: int = None,
+                              preserve_order: bool = None) -> Iterator[pd.DataFrame]:
+        """Stream the collection by reading ``_id`` ranges concurrently on ``workers`` threads.
+
+        Each range has its own cursor on the shared pooled client, so the
+        scan is no longer capped by one connection's round trips. With
+        ``preserve_order`` the ranges' chunks are put back together in ``_id``
+        order and re-cut to ``batch_size`` rows, i.e. exactly the chunks of the
+        single-cursor scan; otherwise chunks come out as their ranges finish.
+        """
+        config = self.data_ingestion_config
+        batch_size = batch_size or config.batch_size
+        workers = workers or config.scan_workers
+        preserve_order = config.scan_preserve_order if preserve_order is None else preserve_order
+        ranges = self._id_ranges(self._get_collection())
+        logger.info(f"Scanning {len(ranges)} _id ranges with {workers} workers")
+
+        def read_range(bounds) -> list:
+            query = range_query(None, *bounds)
+            projection = {"_id": 0, DATA_INGESTION_ROW_HASH_FIELD: 0}
+            return [chunk for chunk, _ in self._iter_frames(batch_size, query=query, projection=projection)]
+
+        chunks = itertools.chain.from_iterable(scan_partitions(read_range, ranges, workers, preserve_order))
+        yield from self._rechunk(chunks, batch_size) if preserve_order else chunks
+
+    def iter_data_from_mongodb(self, batch_size: int = None) -> Iterator[pd.DataFrame]:
+        """Stream the collection as DataFrame chunks of at most ``batch_size`` rows.
+
+        ``_id`` and the bulk loader's row hash are excluded by a server-side projection and every batch of documents
+        is converted straight into typed column arrays (cast to the compact schema
+        dtypes), so only one batch of BSON documents is held in memory at a time.
+        With ``scan_workers`` above 1 the collection is read by ``iter_data_partitioned``.
+        """
+        batch_size = batch_size or self.data_ingestion_config.batch_size
+        if self.data_ingestion_config.scan_workers > 1:
+            yield from self.iter_data_partitioned(batch_size)
+            return
+        projection = {"_id": 0, DATA_INGESTION_ROW_HASH_FIELD: 0}
+        # _id order makes the stream, and so the train/test split, the same on every read
+        for chunk, _ in self._iter_frames(batch_size, projection=projection):
+            yield chunk
+
+    @staticmethod
+    def _new_data_query(after_id: str = None, rescan_window_s: int = 0) -> dict:
+        """Documents whose ``_id`` was generated at most ``rescan_window_s`` seconds before ``after_id``, or later."""
+        from bson import ObjectId
+        from datetime import timedelta
+
+        if not after_id:
+            return {}
+        if not rescan_window_s:
+            return {"_id": {"$gt": ObjectId(after_id)}}
+        start = ObjectId(after_id).generation_time - timedelta(seconds=rescan_window_s)
+        return {"_id": {"$gte": ObjectId.from_datetime(start)}}
+
+    def iter_new_data_from_mongodb(self, after_id: str = None, batch_size: int = None, skip_ids: set = None,
+                                   recent: RecentIdWindow = None) -> Iterator[tuple]:
+        """Stream documents not yet ingested in ``_id`` order.
+
+        Reads from ``rescan_window_s`` before ``after_id`` on and leaves out
+        ``skip_ids``, the ids already ingested from that window. Yields
+        ``(chunk, last_id)`` pairs, where ``last_id`` is the hex ObjectId of the
+        last document in the chunk. Without ``after_id`` the whole collection is read.
+        """
+        batch_size = batch_size or self.data_ingestion_config.batch_size
+        projection = {DATA_INGESTION_ROW_HASH_FIELD: 0}
+        query = self._new_data_query(after_id, self.data_ingestion_config.rescan_window_s)
+        yield from self._iter_frames(batch_size, query=query, projection=projection,
+                                     skip_ids=skip_ids, recent=recent)
+
+    def get_data_from_mongodb(self, materialize: bool = True, batch_size: int = None):
+        """Read the collection from MongoDB.
+
+        Args:
+            materialize: If True, return a single DataFrame. Otherwise return the
+                generator of DataFrame chunks from ``iter_data_from_mongodb``.
+            batch_size: Cursor batch size and rows per chunk. Defaults to the config value.
+        """
+        chunks = self.iter_data_from_mongodb(batch_size=batch_size)
+        if not materialize:
+            return chunks
 
+        try:
+            with trace_span("mongo_fetch") as span:
+                chunks = list(chunks)
+                if not chunks:
+                    raise ValueError("No data found in MongoDB collection")
+
+                df = chunks[0] if len(chunks) == 1 else pd.concat(chunks, ignore_index=True)
+                span.record_output(df)
             return df
 
         except Exception as e:
             raise NetworkSecurityException(f"Error fetching data from MongoDB: {str(e)}", sys)
-        finally:
-            if client:
-                client.close()
 
-    def export_data_to_feature_store(self, df: pd.DataFrame):
+    def _write_traced(self, df: pd.DataFrame, file_path: str):
+        with trace_span("feature_store_write", path=file_path, rows=len(df)) as span:
+            self._feature_store.write(df, file_path)
+            span.set(bytes=self._feature_store.size_on_disk(file_path))
+
+    def export_data_to_feature_store(self, df: pd.DataFrame) -> FrameHandle:
+        """Write ``df`` to the feature store in the background; ``wait()`` on the returned handle."""
         try:
             feature_store_path = self.data_ingestion_config.feature_store_file_path
 
-            # Skip if feature store already exists
             if os.path.exists(feature_store_path):
-                logger.info(f"Feature store already exists at: {feature_store_path}")
-                return
+                logger.info(f"Overwriting existing feature store at: {feature_store_path}")
 
             dir_path = os.path.dirname(feature_store_path)
             os.makedirs(dir_path, exist_ok=True)
@@ -74,31 +277,249 @@ class DataIngestion:
             if df.empty:
                 raise ValueError("Cannot save empty DataFrame to feature store")
 
-            df.to_csv(feature_store_path, index=False)
-            logger.info(f"Feature store created at: {feature_store_path}")
+            handle = FrameHandle(df).persist(self._write_traced, feature_store_path)
+            logger.info(f"Writing feature store to: {feature_store_path}")
+            return handle
 
         except Exception as e:
             raise NetworkSecurityException(f"Error exporting data to feature store: {str(e)}", sys)
 
-    def split_and_store_train_test(self, df: pd.DataFrame):
+    def ingest_new_data(self) -> FeatureStoreManifest:
+        """Append documents newer than the stored high-water mark to the segment store.
+
+        All new documents of one run become a single segment, streamed to disk
+        batch by batch; the manifest's high-water mark is then moved to the last
+        ingested ``_id``. ObjectIds do not follow commit order: push_data.py's
+        parallel writers (or any client) generate them before the insert, so a
+        document can be committed after one with a higher ``_id`` has been
+        ingested. Each run therefore re-reads ``rescan_window_s`` seconds of
+        ``_id`` time below the mark and skips the ids the manifest recorded as
+        ingested there. A document committed later than that behind the mark
+        is missed; the window must exceed the longest insert delay of a writer.
+        """
         try:
-            train_path = self.data_ingestion_config.train_file_path
-            test_path = self.data_ingestion_config.test_file_path
-
-            train_dir_path = os.path.dirname(train_path)
-            test_dir_path = os.path.dirname(test_path)
-
-            os.makedirs(train_dir_path, exist_ok=True)
-            os.makedirs(test_dir_path, exist_ok=True)
-
-            train_df, test_df = train_test_split(df, test_size=0.2, random_state=42)
+            store_dir = self.data_ingestion_config.segment_store_dir
+            manifest = FeatureStoreManifest(store_dir)
+            logger.info(f"Fetching documents after high-water mark: {manifest.high_water_mark}")
+
+            os.makedirs(store_dir, exist_ok=True)
+            if self.data_ingestion_config.scan_workers > 1:
+                return self._ingest_new_data_partitioned(manifest)
+            segment_path = manifest.next_segment_path(self._feature_store.extension)
+            high_water_mark = manifest.high_water_mark
+            recent = RecentIdWindow(self.data_ingestion_config.rescan_window_s)
+            writer = None
+            with trace_span("mongo_fetch", incremental=True) as span:
+                for chunk, last_id in self.iter_new_data_from_mongodb(after_id=manifest.high_water_mark,
+                                                                      skip_ids=manifest.recent_ids, recent=recent):
+                    if writer is None:
+                        writer = self._feature_store.open_writer(segment_path, list(chunk.columns))
+                    writer.write(self._align_columns(chunk, writer.columns))
+                    high_water_mark = last_id
+                span.set(rows=writer.rows if writer else 0)
+
+            if writer is None:
+                logger.info(f"No new documents since last ingestion ({manifest.total_rows} rows stored)")
+                return manifest
+
+            writer.close()
+            manifest.add_segment(segment_path, writer.rows, high_water_mark)
+            manifest.update_recent_ids(recent.ids, self.data_ingestion_config.rescan_window_s)
+            manifest.save()
+
+            logger.info(f"Appended {writer.rows} new rows as segment {segment_path} "
+                        f"({manifest.total_rows} rows stored)")
+            return manifest
 
-            train_df.to_csv(train_path, index=False)
-            test_df.to_csv(test_path, index=False)
+        except Exception as e:
+            raise NetworkSecurityException(f"Error during incremental ingestion: {str(e)}", sys)
+
+    def _ingest_new_data_partitioned(self, manifest: FeatureStoreManifest) -> FeatureStoreManifest:
+        """Write the new documents as one segment per ``_id`` range, the ranges read and written concurrently.
+
+        Segments are added to the manifest in ``_id`` order (renumbered past
+        empty ranges), and only once all of them are on disk.
+        """
+        workers = self.data_ingestion_config.scan_workers
+        window_s = self.data_ingestion_config.rescan_window_s
+        extension = self._feature_store.extension
+        query = self._new_data_query(manifest.high_water_mark, window_s)
+        ranges = self._id_ranges(self._get_collection(), query)
+        partitions = [(manifest.next_segment_path(extension, offset=i), low, high)
+                      for i, (low, high) in enumerate(ranges)]
+        batch_size = self.data_ingestion_config.batch_size
+
+        def write_range(partition):
+            segment_path, low, high = partition
+            writer, last_id = None, None
+            recent = RecentIdWindow(window_s)
+            # One projection per cursor: drivers and stand-ins may annotate the dict they are given
+            projection = {DATA_INGESTION_ROW_HASH_FIELD: 0}
+            for chunk, last_id in self._iter_frames(batch_size, query=range_query(query, low, high),
+                                                    projection=projection, skip_ids=manifest.recent_ids,
+                                                    recent=recent):
+                if writer is None:
+                    writer = self._feature_store.open_writer(segment_path, list(chunk.columns))
+                writer.write(self._align_columns(chunk, writer.columns))
+            if writer is None:
+                return None
+            writer.close()
+            return segment_path, writer.rows, last_id, recent.ids
+
+        with trace_span("mongo_fetch", incremental=True, workers=workers) as span:
+            written = [result for result in scan_partitions(write_range, partitions, workers, preserve_order=False)
+                       if result is not None]
+            span.set(rows=sum(result[1] for result in written))
+
+        if not written:
+            logger.info(f"No new documents since last ingestion ({manifest.total_rows} rows stored)")
+            return manifest
+
+        # Zero-padded names sort in _id order; renaming moves each file to an equal or lower number
+        rows = 0
+        for segment_path, segment_rows, last_id, _ in sorted(written, key=lambda result: result[0]):
+            final_path = manifest.next_segment_path(extension)
+            if final_path != segment_path:
+                os.replace(segment_path, final_path)
+            manifest.add_segment(final_path, segment_rows, last_id)
+            rows += segment_rows
+        manifest.update_recent_ids(itertools.chain.from_iterable(result[3] for result in written), window_s)
+        manifest.save()
+
+        logger.info(f"Appended {rows} new rows as {len(written)} segments from {len(ranges)} _id ranges "
+                    f"({manifest.total_rows} rows stored)")
+        return manifest
+
+    @staticmethod
+    def _align_columns(chunk: pd.DataFrame, columns: list) -> pd.DataFrame:
+        """Give a chunk the columns of the first one, so that every chunk fits the same output file."""
+        if list(chunk.columns) == columns:
+            return chunk
+        extra = [col for col in chunk.columns if col not in columns]
+        if extra:
+            logger.warning(f"Dropping columns that first appeared after the first batch: {extra}")
+        return chunk.reindex(columns=columns)
+
+    @staticmethod
+    def _iter_frame_chunks(df: pd.DataFrame, chunk_rows: int):
+        for start in range(0, len(df), chunk_rows):
+            yield df.iloc[start:start + chunk_rows]
+
+    def _tee_to_feature_store(self, chunks):
+        """Write every chunk to the feature store file while passing it on."""
+        feature_store_path = self.data_ingestion_config.feature_store_file_path
+        if os.path.exists(feature_store_path):
+            logger.info(f"Overwriting existing feature store at: {feature_store_path}")
+        os.makedirs(os.path.dirname(feature_store_path), exist_ok=True)
+
+        writer = None
+        for chunk in chunks:
+            if writer is None:
+                writer = self._feature_store.open_writer(feature_store_path, list(chunk.columns))
+            chunk = self._align_columns(chunk, writer.columns)
+            with trace_span("feature_store_write", path=feature_store_path, rows=len(chunk)):
+                writer.write(chunk)
+            yield chunk
+        if writer is not None:
+            writer.close()
+            logger.info(f"Feature store created at: {feature_store_path}")
 
+    def split_and_store_train_test(self, data):
+        """Split ``data`` into the train and test files in one pass.
+
+        ``data`` is a DataFrame or an iterable of DataFrame chunks, so the input
+        never has to fit in memory. Rows are assigned by ``StratifiedHashSplit``:
+        every class of the target column is split in ``train_test_split_ratio``
+        and the same input gives the same split on every rerun.
+        Splits of up to ``handoff_max_rows`` rows are also handed to validation
+        in memory.
+
+        Rows are packed into 64-bit keys on the way (see ``RowCodec``): the keys
+        drive the split hash, and each split's duplicate-collapsing
+        ``DedupIndex`` is saved next to it for validation's drift profile. The
+        indexes are dropped if they outgrow ``dedup_max_keys`` distinct rows.
+        """
+        try:
+            config = self.data_ingestion_config
+            train_path = config.train_file_path
+            test_path = config.test_file_path
+            os.makedirs(os.path.dirname(train_path), exist_ok=True)
+            os.makedirs(os.path.dirname(test_path), exist_ok=True)
+
+            chunks = self._iter_frame_chunks(data, config.batch_size) if isinstance(data, pd.DataFrame) else data
+            train_writer = test_writer = None
+            splitter = StratifiedHashSplit(config.train_test_split_ratio, config.target_column, config.split_seed)
+            kept = {"train": [], "test": []}
+            keep_in_memory = True
+            codec = RowCodec.from_schema(self._schema_config)
+            indexes = {"train": DedupIndex(codec), "test": DedupIndex(codec)}
+
+            with trace_span("split") as span:
+                for chunk in chunks:
+                    if train_writer is None:
+                        columns = list(chunk.columns)
+                        train_writer = self._feature_store.open_writer(train_path, columns)
+                        test_writer = self._feature_store.open_writer(test_path, columns)
+                    chunk = self._align_columns(chunk, train_writer.columns)
+
+                    keys, packable = codec.encode(chunk)
+                    is_test = splitter.assign(chunk, keys, packable)
+                    parts = {"train": chunk[~is_test], "test": chunk[is_test]}
+                    if indexes is not None:
+                        for name, in_split in (("train", ~is_test), ("test", is_test)):
+                            indexes[name].add(keys[in_split & packable],
+                                              unpacked_rows=int((in_split & ~packable).sum()))
+                        if indexes["train"].unique_rows + indexes["test"].unique_rows > config.dedup_max_keys:
+                            logger.info(f"Over {config.dedup_max_keys} distinct rows; not indexing duplicates")
+                            indexes = None
+                    train_writer.write(parts["train"])
+                    test_writer.write(parts["test"])
+                    keep_in_memory = keep_in_memory and train_writer.rows + test_writer.rows <= config.handoff_max_rows
+                    if keep_in_memory:
+                        kept["train"].append(parts["train"])
+                        kept["test"].append(parts["test"])
+                    else:
+                        kept = {"train": [], "test": []}
+
+                if train_writer is None:
+                    raise ValueError("No data found in MongoDB collection")
+                train_writer.close()
+                test_writer.close()
+                span.set(rows=train_writer.rows + test_writer.rows, test_rows=test_writer.rows)
+
+            for label, (train_rows, test_rows) in sorted(splitter.counts.items(), key=lambda item: str(item[0])):
+                logger.info(f"{config.target_column}={label}: {train_rows} train / {test_rows} test rows "
+                            f"({test_rows / (train_rows + test_rows):.3f} test)")
             logger.info(f"Train and test datasets saved at: {train_path} and {test_path}")
 
-            return DataIngestionArtifact(train_path=train_path, test_path=test_path)
+            index_paths = {"train": None, "test": None}
+            if indexes is not None:
+                for name, index_path in (("train", config.train_index_file_path),
+                                         ("test", config.test_index_file_path)):
+                    indexes[name].save(index_path)
+                    index_paths[name] = index_path
+                    logger.info(f"{name} split: {indexes[name].rows} packed rows, {indexes[name].unique_rows} "
+                                f"distinct (dedup ratio {indexes[name].dedup_ratio:.2f}), "
+                                f"{indexes[name].unpacked_rows} not packable")
+
+            train_frame = test_frame = None
+            if keep_in_memory:
+                train_df = pd.concat(kept["train"], ignore_index=True)
+                test_df = pd.concat(kept["test"], ignore_index=True)
+                train_frame, test_frame = FrameHandle(train_df, train_path), FrameHandle(test_df, test_path)
+                with trace_span("frame_digest", rows=len(train_df) + len(test_df)):
+                    train_digest, test_digest = frame_digest(train_df), frame_digest(test_df)
+            else:
+                logger.info(f"Split exceeds {config.handoff_max_rows} rows; passing it on as files only")
+                train_digest, test_digest = None, None
+
+            return DataIngestionArtifact(
+                train_path=train_path, test_path=test_path,
+                train_digest=train_digest, test_digest=test_digest,
+                train_index_path=index_paths["train"], test_index_path=index_paths["test"],
+                train_rows=train_writer.rows, test_rows=test_writer.rows,
+                train_frame=train_frame, test_frame=test_frame,
+            )
 
         except Exception as e:
             raise NetworkSecurityException(e, sys)
@@ -107,18 +528,23 @@ class DataIngestion:
         try:
             logger.info("Starting data ingestion process")
 
-            # Get data from MongoDB
-            logger.info("Fetching data from MongoDB...")
-            df = self.get_data_from_mongodb()
-            logger.info(f"Successfully retrieved {len(df)} records from MongoDB")
-
-            # Export to feature store
-            logger.info("Exporting data to feature store...")
-            self.export_data_to_feature_store(df)
+            if self.data_ingestion_config.incremental:
+                # Fetch only new documents, then stream the full history from the segment store
+                logger.info("Fetching new data from MongoDB...")
+                manifest = self.ingest_new_data()
+                logger.info(f"Splitting {manifest.total_rows} records from {len(manifest.segments)} "
+                            f"feature store segments")
+                chunks = manifest.iter_segment_chunks(self.data_ingestion_config.batch_size, self._schema_config)
+            else:
+                # Stream the collection into the feature store and the split in one pass
+                logger.info("Fetching data from MongoDB into the feature store...")
+                chunks = self._tee_to_feature_store(self.iter_data_from_mongodb())
 
             # Split and store train/test data
             logger.info("Splitting data into training and test sets...")
-            ingestion_artifact: DataIngestionArtifact = self.split_and_store_train_test(df)
+            ingestion_artifact: DataIngestionArtifact = self.split_and_store_train_test(chunks)
+            if not self.data_ingestion_config.incremental:
+                ingestion_artifact.feature_store_path = self.data_ingestion_config.feature_store_file_path
 
             logger.info("Data ingestion completed successfully")
             return ingestion_artifact
@@ -1,10 +1,18 @@
 from networksecurity.entity.artifact_entity import DataValidationArtifact, DataIngestionArtifact
 from networksecurity.entity.config_entity import DataValidationConfig
-from networksecurity.constants.train_pipeline import SCHEMA_FILE_PATH
-from networksecurity.utilities.utils import read_yaml_file, write_yaml_file
+from networksecurity.constants.train_pipeline import SCHEMA_FILE_PATH, TRAIN_FILE_NAME, TEST_FILE_NAME
+from networksecurity.utilities.utils import read_yaml_file, write_yaml_file, link_or_copy_file
+from networksecurity.utilities.feature_store import get_feature_store_for_path
+from networksecurity.utilities.drift import detect_drift
+from networksecurity.utilities.data_profile import DataProfile
+from networksecurity.utilities.tracing import trace_span
+from networksecurity.utilities.validation import validate_chunk, validate_file, validate_frame
+from networksecurity.utilities.frame_handle import FrameHandle, frame_digest
+from networksecurity.utilities.packed_rows import DedupIndex
+from networksecurity.utilities.schema import get_schema_domains, get_schema_dtypes
+from networksecurity.pipelines.executor import PipelineExecutor, Stage
 from networksecurity.utilities.exception import NetworkSecurityException
 from networksecurity.utilities.logger import logger
-from scipy.stats import ks_2samp
 
 import os, sys
 import pandas as pd
@@ -24,27 +32,16 @@ class DataValidation:
             raise NetworkSecurityException(e, sys)
 
     @staticmethod
-    def drift_checking(base_df, current_df, threshold=0.05):
+    def drift_checking(base_df, current_df, threshold=0.05, value_range=None):
         try:
             logger.info("Starting data drift checking between base and current datasets.")
-            is_drift = False
-            drift_report = {}
+            with trace_span("drift_test", rows=len(base_df) + len(current_df), columns=base_df.shape[1]):
+                is_drift, drift_report = detect_drift(base_df, current_df, threshold, value_range)
 
-            for col in base_df.columns:
-                d1 = current_df[col]
-                d2 = base_df[col]
-                stat, p_val = ks_2samp(d1, d2)
+            for col, stats in drift_report.items():
+                if stats["drift_detected"]:
+                    logger.warning(f"Data drift detected in feature: {col} (p-value: {stats['p_val']:.5f})")
 
-                drift_detected = bool(p_val < threshold)
-                drift_report[col] = {
-                    "p_val": float(p_val),  # ✅ convert numpy.float64 -> float
-                    "drift_detected": drift_detected  # ✅ convert numpy.bool_ -> bool
-                }
-
-                if drift_detected:
-                    logger.warning(f"Data drift detected in feature: {col} (p-value: {p_val:.5f})")
-
-            is_drift = any(v["drift_detected"] for v in drift_report.values())
             logger.info(f"Data drift checking complete. Drift detected: {is_drift}")
 
             return is_drift, drift_report
@@ -53,6 +50,7 @@ class DataValidation:
             raise NetworkSecurityException(e, sys)
 
     def validate_dataset(self, df: pd.DataFrame):
+        """Check the column set and every value against the schema's dtypes and domains."""
         try:
             logger.info("Validating dataset schema.")
             df_col = set(df.columns)
@@ -64,43 +62,176 @@ class DataValidation:
                 logger.warning(f"Schema mismatch detected. Missing: {missing_cols}, Extra: {extra_cols}")
                 return False
 
+            _, invalid_df, counts = validate_chunk(df, self._schema_config)
+            if len(invalid_df):
+                logger.warning(f"{len(invalid_df)} rows violate the schema: {self._violation_summary(counts)}")
+                return False
+
             logger.info("Dataset schema validation successful.")
             return True
         except Exception as e:
             logger.error("Error occurred during schema validation.")
             raise NetworkSecurityException(e, sys)
 
-    def initiate_data_validation(self) -> DataValidationArtifact:
+    @staticmethod
+    def _violation_summary(counts: dict) -> str:
+        return ", ".join(
+            f"{col} ({', '.join(f'{kind}: {n}' for kind, n in col_counts.items() if n)})"
+            for col, col_counts in counts.items() if any(col_counts.values())
+        )
+
+    def load_dedup_index(self, index_path: str):
+        """The ingestion's DedupIndex of a split, or None if there is none usable for the drift profile.
+
+        Rows that could not be packed are left out of the index, which is only
+        exact for the clean rows if every schema column has a domain (so that
+        all of those rows are quarantined).
+        """
         try:
-            logger.info("Initiating data validation process.")
+            if not index_path or not os.path.exists(index_path):
+                return None
+            columns = list(self._schema_config["columns"])
+            index = DedupIndex.load(index_path)
+            if index.codec.columns != columns or not set(columns) <= set(get_schema_domains(self._schema_config)):
+                logger.warning(f"Dedup index {index_path} does not match the schema; ignoring it.")
+                return None
+            return index
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
 
-            train_file_path = self.data_ingestion_artifact.train_path
-            test_file_path = self.data_ingestion_artifact.test_path
+    def _in_schema_layout(self, input_frame: pd.DataFrame) -> bool:
+        """Whether a split has exactly the schema's columns, in order, with its dtypes."""
+        columns = list(self._schema_config["columns"])
+        dtypes = get_schema_dtypes(self._schema_config)
+        return list(input_frame.columns) == columns and all(
+            str(input_frame[col].dtype) == dtypes[col] for col in columns if col in dtypes
+        )
+
+    def _passes_unchanged(self, report: dict, input_frame: pd.DataFrame) -> bool:
+        """Whether the clean rows of a split are all of its rows, in the schema's columns and dtypes,
+        i.e. the validated file would hold what the input file holds."""
+        if not report["rows"] or report["quarantined_rows"] or report["missing_columns"] or report["extra_columns"]:
+            return False
+        return self._in_schema_layout(input_frame)
+
+    def validate_split(self, file_path: str, valid_path: str, quarantine_path: str, frame: FrameHandle = None,
+                       index_path: str = None, workers: int = None):
+        """Validate one split chunk by chunk; clean rows go to ``valid_path``, offending rows to ``quarantine_path``.
+
+        With ``frame``, the in-memory handle of ``file_path`` handed over by
+        ingestion, the file is not read and the clean rows are written in the
+        background. With ``index_path``, the split's DedupIndex, the drift
+        profile is computed from its distinct rows. Chunks are validated by
+        ``workers`` processes (default: the config's). If the split passes
+        unchanged, ``valid_path`` becomes a link to ``file_path``. Returns
+        ``(report, profile, valid_frame)``; ``valid_frame`` is None when the
+        split was read from disk.
+        """
+        try:
+            workers = workers or self.data_validation_config.workers
+            feature_store = get_feature_store_for_path(file_path, self._schema_config)
+            dedup_index = self.load_dedup_index(index_path)
+            valid_frame = None
+            with trace_span("validate_file", path=file_path, in_memory=frame is not None) as span:
+                if frame is None:
+                    logger.info(f"Validating values of {file_path}")
+                    first_row = next(feature_store.iter_chunks(file_path, 1), None)
+                    report, profile = validate_file(
+                        file_path,
+                        feature_store=feature_store,
+                        schema_config=self._schema_config,
+                        valid_path=valid_path,
+                        quarantine_path=quarantine_path,
+                        chunk_rows=self.data_validation_config.chunk_rows,
+                        workers=workers,
+                        dedup_index=dedup_index,
+                        link_unchanged=first_row is not None and self._in_schema_layout(first_row),
+                    )
+                else:
+                    logger.info(f"Validating values of {file_path} from memory")
+                    valid_df, report, profile = validate_frame(
+                        frame.frame,
+                        schema_config=self._schema_config,
+                        quarantine_path=quarantine_path,
+                        chunk_rows=self.data_validation_config.chunk_rows,
+                        workers=workers,
+                        dedup_index=dedup_index,
+                    )
+                    os.makedirs(os.path.dirname(valid_path), exist_ok=True)
+                    if self._passes_unchanged(report, frame.frame):
+                        # Linked once ingestion has written the split
+                        valid_frame = FrameHandle(valid_df).persist(
+                            lambda df, path: link_or_copy_file(frame.wait(), path), valid_path
+                        )
+                    else:
+                        valid_frame = FrameHandle(valid_df).persist(
+                            lambda df, path: self._write_traced(feature_store, df, path), valid_path
+                        )
+                span.set(rows=report["rows"], quarantined_rows=report["quarantined_rows"])
+
+            if report["missing_columns"] or report["extra_columns"]:
+                logger.warning(f"Schema mismatch detected. Missing: {report['missing_columns']}, "
+                               f"Extra: {report['extra_columns']}")
+            if report["quarantined_rows"]:
+                logger.warning(f"Quarantined {report['quarantined_rows']} of {report['rows']} rows to "
+                               f"{quarantine_path}: {self._violation_summary(report['columns'])}")
+            return report, profile, valid_frame
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    @staticmethod
+    def _write_traced(feature_store, df: pd.DataFrame, file_path: str):
+        with trace_span("feature_store_write", path=file_path, rows=len(df)) as span:
+            feature_store.write(df, file_path)
+            span.set(bytes=feature_store.size_on_disk(file_path))
+
+    def load_baseline_profile(self, data_profile: DataProfile):
+        """Load the accepted baseline profile, or None if there is none usable for ``data_profile``."""
+        try:
+            baseline_path = self.data_validation_config.baseline_profile_file_path
+            if not os.path.exists(baseline_path):
+                logger.info("No baseline profile found; the training split is used as drift baseline.")
+                return None
+
+            baseline_profile = DataProfile.load(baseline_path)
+            if (baseline_profile.columns, baseline_profile.low, baseline_profile.high) != \
+                    (data_profile.columns, data_profile.low, data_profile.high):
+                logger.warning(f"Baseline profile at {baseline_path} does not match the current schema; ignoring it.")
+                return None
 
-            # Read data
-            logger.info(f"Reading training data from {train_file_path}")
-            train_df = pd.read_csv(train_file_path)
-            logger.info(f"Reading test data from {test_file_path}")
-            test_df = pd.read_csv(test_file_path)
+            logger.info(f"Loaded baseline profile ({baseline_profile.row_count} rows) from {baseline_path}")
+            return baseline_profile
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
 
-            # Validate schema
-            logger.info("Validating training dataset schema.")
-            train_valid = self.validate_dataset(train_df)
-            logger.info(f"Training dataset valid: {train_valid}")
+    def check_drift(self, train_profile: DataProfile, test_profile: DataProfile):
+        """Save the dataset profile, compare it with the baseline and write the drift report.
 
-            logger.info("Validating test dataset schema.")
-            test_valid = self.validate_dataset(test_df)
-            logger.info(f"Test dataset valid: {test_valid}")
+        Returns ``(is_drifted, data_profile, baseline_profile)``.
+        """
+        try:
+            data_profile = train_profile.merge(test_profile)
+            with trace_span("yaml_write", path=self.data_validation_config.data_profile_file_path):
+                data_profile.save(self.data_validation_config.data_profile_file_path)
+            logger.info(f"Data profile saved to {self.data_validation_config.data_profile_file_path}")
 
-            # Check for data drift
+            # Check for data drift against the stored baseline, or train vs test without one
             logger.info("Performing data drift analysis.")
-            is_drifted, drift_report = self.drift_checking(train_df, test_df)
+            baseline_profile = self.load_baseline_profile(data_profile)
+            with trace_span("drift_test", columns=len(data_profile.columns)):
+                if baseline_profile is not None:
+                    is_drifted, drift_report = baseline_profile.compare(data_profile)
+                    baseline = self.data_validation_config.baseline_profile_file_path
+                else:
+                    is_drifted, drift_report = train_profile.compare(test_profile)
+                    baseline = "train split"
 
             # Add overall drift status to the report
             drift_report["overall_drift_status"] = {
                 "is_drift_detected": bool(is_drifted),
                 "message": "Significant drift detected in one or more features"
-                if is_drifted else "No significant drift detected across features"
+                if is_drifted else "No significant drift detected across features",
+                "baseline": baseline
             }
 
             # Log drift summary
@@ -116,51 +247,122 @@ class DataValidation:
             # Save drift report
             drift_dir = os.path.dirname(self.data_validation_config.drift_report_file_path)
             os.makedirs(drift_dir, exist_ok=True)
-            write_yaml_file(
-                file_path=self.data_validation_config.drift_report_file_path,
-                content=drift_report
-            )
+            with trace_span("yaml_write", path=self.data_validation_config.drift_report_file_path):
+                write_yaml_file(
+                    file_path=self.data_validation_config.drift_report_file_path,
+                    content=drift_report
+                )
             logger.info(f"Drift report saved successfully to {self.data_validation_config.drift_report_file_path}")
 
-            # Prepare output directories
-            base_dir = os.path.dirname(self.data_validation_config.drift_report_file_path)
-            valid_dir = os.path.join(base_dir, "validated")
-            invalid_dir = os.path.join(base_dir, "invalid")
+            return is_drifted, data_profile, baseline_profile
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
 
-            os.makedirs(valid_dir, exist_ok=True)
-            os.makedirs(invalid_dir, exist_ok=True)
+    def _test_share(self) -> float:
+        """The test split's share of the ingested rows."""
+        artifact = self.data_ingestion_artifact
+        if artifact.train_rows is not None and artifact.test_rows is not None:
+            sizes = (artifact.train_rows, artifact.test_rows)
+        else:
+            # Artifacts of earlier runs do not record their row counts
+            feature_store = get_feature_store_for_path(artifact.train_path, self._schema_config)
+            sizes = (feature_store.size_on_disk(artifact.train_path), feature_store.size_on_disk(artifact.test_path))
+        return sizes[1] / sum(sizes) if sum(sizes) else 0.5
 
-            # Decide where to save files
-            if not train_valid or not test_valid or is_drifted:
-                logger.warning("Invalid dataset detected — saving to invalid folder.")
-                invalid_train_file_path = os.path.join(invalid_dir, "train.csv")
-                invalid_test_file_path = os.path.join(invalid_dir, "test.csv")
-                valid_train_file_path = None
-                valid_test_file_path = None
+    def initiate_data_validation(self) -> DataValidationArtifact:
+        try:
+            logger.info("Initiating data validation process.")
+            config = self.data_validation_config
 
-                # Save invalid data
-                train_df.to_csv(invalid_train_file_path, index=False)
-                test_df.to_csv(invalid_test_file_path, index=False)
+            train_file_path = self.data_ingestion_artifact.train_path
+            test_file_path = self.data_ingestion_artifact.test_path
 
-            else:
-                logger.info("All datasets validated successfully — saving to validated folder.")
-                valid_train_file_path = os.path.join(valid_dir, "train.csv")
-                valid_test_file_path = os.path.join(valid_dir, "test.csv")
-                invalid_train_file_path = None
-                invalid_test_file_path = None
+            # Clean rows keep the format ingestion wrote; quarantined rows are CSV for inspection
+            feature_store = get_feature_store_for_path(train_file_path, self._schema_config)
+            valid_train_file_path = os.path.join(
+                config.valid_data_dir, os.path.splitext(TRAIN_FILE_NAME)[0] + feature_store.extension
+            )
+            valid_test_file_path = os.path.join(
+                config.valid_data_dir, os.path.splitext(TEST_FILE_NAME)[0] + feature_store.extension
+            )
+            quarantine_train_file_path = os.path.join(config.invalid_data_dir, TRAIN_FILE_NAME)
+            quarantine_test_file_path = os.path.join(config.invalid_data_dir, TEST_FILE_NAME)
+
+            # The splits are validated concurrently and share the chunk workers in proportion to their size;
+            # drift analysis needs the profiles of both
+            workers = config.workers or os.cpu_count() or 1
+            test_workers = max(1, round(workers * self._test_share()))
+            train_workers = max(1, workers - test_workers)
+            executor = PipelineExecutor([
+                Stage("validate_train", lambda: self.validate_split(
+                    train_file_path, valid_train_file_path, quarantine_train_file_path,
+                    frame=self.data_ingestion_artifact.train_frame,
+                    index_path=self.data_ingestion_artifact.train_index_path, workers=train_workers
+                )),
+                Stage("validate_test", lambda: self.validate_split(
+                    test_file_path, valid_test_file_path, quarantine_test_file_path,
+                    frame=self.data_ingestion_artifact.test_frame,
+                    index_path=self.data_ingestion_artifact.test_index_path, workers=test_workers
+                )),
+                Stage("check_drift", lambda train, test: self.check_drift(train[1], test[1]),
+                      inputs={"train": "validate_train", "test": "validate_test"}),
+            ], max_workers=2)
+            results = executor.run()
+            train_report, train_profile, valid_train_frame = results["validate_train"]
+            test_report, test_profile, valid_test_frame = results["validate_test"]
+            is_drifted, data_profile, baseline_profile = results["check_drift"]
+
+            schema_valid = not any(
+                report["missing_columns"] or report["extra_columns"] for report in (train_report, test_report)
+            )
+            total_rows = train_report["rows"] + test_report["rows"]
+            quarantined_rows = train_report["quarantined_rows"] + test_report["quarantined_rows"]
+            quarantined_ratio = quarantined_rows / total_rows if total_rows else 0.0
+            logger.info(f"Schema valid: {schema_valid}; quarantined {quarantined_rows} of {total_rows} rows")
+
+            validation_report = {
+                "schema_valid": schema_valid,
+                "quarantined_ratio": round(quarantined_ratio, 6),
+                "max_quarantined_ratio": config.max_quarantined_ratio,
+                "train": train_report,
+                "test": test_report,
+            }
+            with trace_span("yaml_write", path=config.validation_report_file_path):
+                write_yaml_file(file_path=config.validation_report_file_path, content=validation_report)
+            logger.info(f"Validation report saved to {config.validation_report_file_path}")
+
+            # Drift is reported rather than failed on, as the trainer only refuses data the schema checks reject
+            validation_status = bool(schema_valid and quarantined_ratio <= config.max_quarantined_ratio)
+            if not validation_status:
+                logger.warning(f"Dataset failed validation; see {config.validation_report_file_path}")
+            if is_drifted:
+                logger.warning(f"Dataset drifted; see {config.drift_report_file_path}")
+            if validation_status and not is_drifted and baseline_profile is None:
+                with trace_span("yaml_write", path=config.baseline_profile_file_path):
+                    data_profile.save(config.baseline_profile_file_path)
+                logger.info(f"Accepted dataset as drift baseline: {config.baseline_profile_file_path}")
 
-                # Save valid data
-                train_df.to_csv(valid_train_file_path, index=False)
-                test_df.to_csv(valid_test_file_path, index=False)
+            # Digests of in-memory splits let the next stage fingerprint them before their files are written
+            valid_train_digest = valid_test_digest = None
+            if valid_train_frame is not None and valid_test_frame is not None:
+                with trace_span("frame_digest", rows=train_report["valid_rows"] + test_report["valid_rows"]):
+                    valid_train_digest = frame_digest(valid_train_frame.frame)
+                    valid_test_digest = frame_digest(valid_test_frame.frame)
 
             # Create final artifact
             data_validation_artifact = DataValidationArtifact(
-                validation_status=bool(all([train_valid, test_valid, not is_drifted])),
+                validation_status=validation_status,
                 valid_train_file_path=valid_train_file_path,
                 valid_test_file_path=valid_test_file_path,
-                invalid_train_file_path=invalid_train_file_path,
-                invalid_test_file_path=invalid_test_file_path,
-                drift_report_file_path=self.data_validation_config.drift_report_file_path,
+                invalid_train_file_path=quarantine_train_file_path if train_report["quarantined_rows"] else None,
+                invalid_test_file_path=quarantine_test_file_path if test_report["quarantined_rows"] else None,
+                drift_report_file_path=config.drift_report_file_path,
+                validation_report_file_path=config.validation_report_file_path,
+                drift_detected=bool(is_drifted),
+                valid_train_digest=valid_train_digest,
+                valid_test_digest=valid_test_digest,
+                valid_train_frame=valid_train_frame,
+                valid_test_frame=valid_test_frame,
             )
 
             logger.info("Data validation process completed successfully.")
@@ -0,0 +1,115 @@
+from networksecurity.entity.config_entity import DriftMonitorConfig
+from networksecurity.utilities.data_profile import DataProfile
+from networksecurity.utilities.drift import WindowedHistograms, compare_histograms
+from networksecurity.utilities.exception import NetworkSecurityException
+from networksecurity.utilities.logger import logger
+from typing import Callable
+import os, sys
+import json
+import time
+import numpy as np
+import pandas as pd
+
+
+class DriftMonitor:
+    """Continuous drift check of a record stream against the accepted baseline profile.
+
+    Records are counted into ``WindowedHistograms`` over the baseline's
+    features (the target column is left out): a window of
+    ``window_records`` that slides by ``slide_records``. Every time the
+    window advances it is compared with the baseline by the same test as
+    ``DataValidation.drift_checking``; the per-feature ``p_val`` /
+    ``drift_detected`` report is appended to ``report_file_path`` as one JSON
+    line and passed to ``on_report``. Memory does not grow with the stream.
+    """
+
+    def __init__(self, drift_monitor_config: DriftMonitorConfig, baseline: DataProfile = None,
+                 on_report: Callable = None):
+        try:
+            self.drift_monitor_config = drift_monitor_config
+            if baseline is None:
+                if not os.path.exists(drift_monitor_config.baseline_profile_file_path):
+                    raise FileNotFoundError(f"No baseline profile at {drift_monitor_config.baseline_profile_file_path}; "
+                                            "run the training pipeline first")
+                baseline = DataProfile.load(drift_monitor_config.baseline_profile_file_path)
+            self.columns = [col for col in baseline.columns if col != drift_monitor_config.target_column]
+            self._baseline_counts = baseline.histograms[[baseline.columns.index(col) for col in self.columns]]
+            self.windows = WindowedHistograms(
+                len(self.columns), baseline.low, baseline.high,
+                drift_monitor_config.window_records, drift_monitor_config.slide_records
+            )
+            self.on_report = on_report
+            self.reports = 0
+            self.drifted_reports = 0
+            self.last_report = None
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def _codes(self, df: pd.DataFrame) -> np.ndarray:
+        values = np.column_stack([
+            pd.to_numeric(df[col], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+            if col in df.columns else np.full(len(df), np.nan)
+            for col in self.columns
+        ])
+        return self.windows.codes(values)
+
+    def update(self, record: dict):
+        """Count one record (missing or non-numeric features count as nulls); O(features)."""
+        try:
+            values = np.array([record.get(col) for col in self.columns], dtype=np.float64)
+            if self.windows.add_record(self.windows.codes(values)):
+                self._report(self.windows.window_counts())
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def update_frame(self, df: pd.DataFrame):
+        """Count a batch of records, reporting every window it completes."""
+        try:
+            for counts in self.windows.add_records(self._codes(df)):
+                self._report(counts)
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def _report(self, counts: np.ndarray):
+        is_drift, drift_report = compare_histograms(
+            self.columns, self._baseline_counts, counts, self.drift_monitor_config.threshold
+        )
+        drifted = [col for col, stats in drift_report.items() if stats["drift_detected"]]
+        report = {
+            "timestamp": time.time(),
+            "window_end": self.windows.records,
+            "window_records": self.windows.window,
+            "is_drift": is_drift,
+            "drifted_features": drifted,
+            "drift_report": drift_report,
+        }
+        self.reports += 1
+        self.drifted_reports += is_drift
+        self.last_report = report
+        if is_drift:
+            logger.warning(f"Drift in window ending at record {report['window_end']}: {drifted}")
+        else:
+            logger.info(f"No drift in window ending at record {report['window_end']}")
+
+        report_file_path = self.drift_monitor_config.report_file_path
+        if report_file_path:
+            os.makedirs(os.path.dirname(report_file_path), exist_ok=True)
+            with open(report_file_path, "a", encoding="utf-8") as file:
+                file.write(json.dumps(report) + "\n")
+        if self.on_report is not None:
+            self.on_report(report)
+
+    def run(self, batches) -> dict:
+        """Consume a stream of DataFrame batches (see ``utilities.record_streams``) until it ends."""
+        try:
+            config = self.drift_monitor_config
+            logger.info(f"Monitoring drift over windows of {config.window_records} records, "
+                        f"sliding by {config.slide_records}")
+            for batch in batches:
+                self.update_frame(batch)
+            logger.info(f"Stream ended after {self.windows.records} records: "
+                        f"{self.drifted_reports} of {self.reports} windows drifted")
+            return {"records": self.windows.records, "reports": self.reports,
+                    "drifted_reports": self.drifted_reports}
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
@@ -0,0 +1,142 @@
+from networksecurity.entity.artifact_entity import DataValidationArtifact, ModelTrainerArtifact
+from networksecurity.entity.config_entity import ModelTrainerConfig
+from networksecurity.constants.train_pipeline import SCHEMA_FILE_PATH
+from networksecurity.utilities.utils import read_yaml_file, write_yaml_file, save_object
+from networksecurity.utilities.feature_store import get_feature_store_for_path
+from networksecurity.utilities.frame_handle import FrameHandle, frame_digest
+from networksecurity.utilities.model_search import CandidateCache, search_candidates
+from networksecurity.utilities.tracing import trace_span
+from networksecurity.utilities.exception import NetworkSecurityException
+from networksecurity.utilities.logger import logger
+
+import os, sys
+import numpy as np
+import pandas as pd
+
+
+class ModelTrainer:
+    def __init__(self, model_trainer_config: ModelTrainerConfig, data_validation_artifact: DataValidationArtifact):
+        try:
+            logger.info("Initializing ModelTrainer component.")
+            self.model_trainer_config = model_trainer_config
+            self.data_validation_artifact = data_validation_artifact
+            self._schema_config = read_yaml_file(SCHEMA_FILE_PATH)
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def load_split(self, file_path: str, frame: FrameHandle = None) -> FrameHandle:
+        """The validated split, from the handle validation passed along or else from its file.
+
+        Columns are put in schema.yaml order, the feature order the model is fitted and used with.
+        """
+        try:
+            columns = list(self._schema_config["columns"])
+            if frame is None:
+                with trace_span("feature_store_read", path=file_path):
+                    df = get_feature_store_for_path(file_path, self._schema_config).read(file_path)
+                logger.info(f"Loaded {len(df)} rows from {file_path}")
+                frame = FrameHandle(df, file_path)
+            if list(frame.frame.columns) != columns:
+                frame = FrameHandle(frame.frame[columns], frame.file_path)
+            return frame
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def classification_metrics(self, model, df: pd.DataFrame) -> dict:
+        try:
+            from sklearn.metrics import accuracy_score, f1_score, precision_score, recall_score
+
+            target_column = self.model_trainer_config.target_column
+            y_true = df[target_column].to_numpy()
+            y_pred = model.predict(df.drop(columns=[target_column]).to_numpy(dtype=np.float32))
+            return {
+                "f1_score": float(f1_score(y_true, y_pred)),
+                "precision_score": float(precision_score(y_true, y_pred)),
+                "recall_score": float(recall_score(y_true, y_pred)),
+                "accuracy_score": float(accuracy_score(y_true, y_pred)),
+            }
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def initiate_model_trainer(self) -> ModelTrainerArtifact:
+        try:
+            logger.info("Initiating model training process.")
+            config = self.model_trainer_config
+            artifact = self.data_validation_artifact
+            if not artifact.validation_status:
+                raise ValueError("Data validation failed; refusing to train on the dataset. "
+                                 f"See {artifact.validation_report_file_path}")
+            if artifact.drift_detected:
+                logger.warning(f"Training on a dataset that drifted; see {artifact.drift_report_file_path}")
+
+            train = self.load_split(artifact.valid_train_file_path, artifact.valid_train_frame)
+            test = self.load_split(artifact.valid_test_file_path, artifact.valid_test_frame)
+            train_digest = artifact.valid_train_digest
+            if train_digest is None:
+                with trace_span("frame_digest", rows=len(train.frame)):
+                    train_digest = frame_digest(train.frame)
+
+            with trace_span("model_search", rows=len(train.frame)) as span:
+                results = search_candidates(
+                    train,
+                    target_column=config.target_column,
+                    data_digest=train_digest,
+                    search_space=config.search_space,
+                    cache_dir=config.candidate_cache_dir,
+                    cv_folds=config.cv_folds,
+                    seed=config.seed,
+                    scoring=config.scoring,
+                    workers=config.workers,
+                )
+                span.set(candidates=len(results), cached=sum(result["cached"] for result in results))
+            fitted = [result for result in results if not result["cached"]]
+            logger.info(f"Searched {len(results)} candidates: {len(fitted)} fitted in "
+                        f"{sum(r['cv_time_s'] + r['fit_time_s'] for r in fitted):.2f}s, "
+                        f"{len(results) - len(fitted)} reused from {config.candidate_cache_dir}")
+
+            best = results[0]
+            logger.info(f"Best model: {best['estimator']} {best['params']} "
+                        f"(cv {config.scoring} {best['cv_score']:.4f})")
+            candidate_cache = CandidateCache(config.candidate_cache_dir)
+            model = candidate_cache.model(best["key"])
+            candidate_cache.evict(config.candidate_cache_max_bytes, config.candidate_cache_max_age_days)
+            train_metrics = self.classification_metrics(model, train.frame)
+            test_metrics = self.classification_metrics(model, test.frame)
+            logger.info(f"Train f1: {train_metrics['f1_score']:.4f}, test f1: {test_metrics['f1_score']:.4f}")
+            if test_metrics["f1_score"] < config.expected_score:
+                raise ValueError(f"Best model's test f1 {test_metrics['f1_score']:.4f} is below the expected "
+                                 f"score {config.expected_score}")
+
+            save_object(config.trained_model_file_path, model)
+            logger.info(f"Model saved to {config.trained_model_file_path}")
+            metrics = {
+                "best_model": {"estimator": best["estimator"], "params": best["params"],
+                               "cv_score": best["cv_score"], "cv_std": best["cv_std"]},
+                "drift_detected": artifact.drift_detected,
+                "scoring": config.scoring,
+                "cv_folds": config.cv_folds,
+                "train": train_metrics,
+                "test": test_metrics,
+                "candidates": [
+                    {key: result[key] for key in ("estimator", "params", "cv_score", "cv_std", "cv_time_s",
+                                                  "fit_time_s", "cached")}
+                    for result in results
+                ],
+            }
+            with trace_span("yaml_write", path=config.metrics_file_path):
+                write_yaml_file(file_path=config.metrics_file_path, content=metrics)
+            logger.info(f"Metrics saved to {config.metrics_file_path}")
+
+            model_trainer_artifact = ModelTrainerArtifact(
+                trained_model_file_path=config.trained_model_file_path,
+                metrics_file_path=config.metrics_file_path,
+                best_model_name=best["estimator"],
+                best_model_params=best["params"],
+                train_f1_score=train_metrics["f1_score"],
+                test_f1_score=test_metrics["f1_score"],
+            )
+            logger.info("Model training process completed successfully.")
+            return model_trainer_artifact
+        except Exception as e:
+            logger.error(f"Error during model training: {e}")
+            raise NetworkSecurityException(e, sys)
@@ -1,8 +1,4 @@
 import os
-import sys
-import numpy as np
-import pandas as pd
-from jupyter_lsp.schema import SCHEMA_FILE
 
 """
 DATA VALIDATION CONSTANT
@@ -12,6 +8,12 @@ DATA_VALIDATION_VALID_DIR = "validated"
 DATA_VALIDATION_INVALID_DIR = "invalid"
 DATA_VALIDATION_DRIFT_REPORT_DIR = "drift_report"
 DATA_VALIDATION_DRIFT_REPORT_FILE_NAME = "report.yaml"
+DATA_VALIDATION_PROFILE_FILE_NAME = "profile.yaml"
+DATA_VALIDATION_BASELINE_DIR = "baseline"
+DATA_VALIDATION_REPORT_FILE_NAME = "validation_report.yaml"
+DATA_VALIDATION_CHUNK_ROWS = 500_000
+DATA_VALIDATION_WORKERS = None  # None: one per CPU
+DATA_VALIDATION_MAX_QUARANTINED_RATIO = 0.05
 
 """
 DATA INGESTION CONSTANTS
@@ -21,7 +23,112 @@ DATA_INGESTION_DATABASE_NAME = "network_security"
 DATA_INGESTION_DIR_NAME = "DataIngestion"
 DATA_INGESTION_FEATURE_STORE_DIR = "feature_store"
 DATA_INGESTION_INGESTED_DIR = "ingested"
-DATA_INGESTION_TEST_TRAIN_SPLIT = 0.2
+DATA_INGESTION_TEST_TRAIN_SPLIT = 0.2  # share of each class assigned to the test split
+DATA_INGESTION_SPLIT_SEED = 42
+DATA_INGESTION_HANDOFF_MAX_ROWS = 5_000_000  # larger splits are passed to validation as files only
+DATA_INGESTION_TRAIN_INDEX_FILE_NAME = "train_index.npz"
+DATA_INGESTION_TEST_INDEX_FILE_NAME = "test_index.npz"
+DATA_INGESTION_DEDUP_MAX_KEYS = 20_000_000  # 16 bytes per distinct row
+DATA_INGESTION_BATCH_SIZE = 10000
+DATA_INGESTION_FEATURE_STORE_FORMAT = "parquet"  # one of: csv, parquet, numpy
+DATA_INGESTION_INCREMENTAL = True
+DATA_INGESTION_ROW_HASH_FIELD = "row_hash"  # set by push_data.py bulk loads
+DATA_INGESTION_RESCAN_WINDOW_S = 600  # re-read documents this much older than the high-water mark
+DATA_INGESTION_SCAN_WORKERS = 1  # above 1: read _id ranges of the collection concurrently
+DATA_INGESTION_SCAN_PARTITION_ROWS = 250_000  # target documents per _id range
+DATA_INGESTION_SCAN_PRESERVE_ORDER = True  # keep _id order, so the split does not depend on the worker count
+DATA_INGESTION_PARTITION_MAP_FILE_NAME = "partition_map.json"
+DATA_INGESTION_PARTITION_MAP_MAX_GROWTH = 2.0  # resample split points once the collection has doubled
+
+"""
+MONGODB CLIENT CONSTANTS
+"""
+MONGODB_MAX_POOL_SIZE = 50  # connections per server, shared by all threads of a process
+MONGODB_MIN_POOL_SIZE = 0
+MONGODB_MAX_IDLE_TIME_MS = 300_000
+MONGODB_CONNECT_TIMEOUT_MS = 10_000
+MONGODB_SERVER_SELECTION_TIMEOUT_MS = 5_000
+MONGODB_SOCKET_TIMEOUT_MS = None  # None: no limit, long cursors may stream for minutes
+MONGODB_HEALTH_CHECK_INTERVAL_S = 30.0
+
+"""
+MODEL TRAINER CONSTANTS
+"""
+MODEL_TRAINER_DIR_NAME = "model_trainer"
+MODEL_TRAINER_TRAINED_MODEL_DIR = "trained_model"
+MODEL_TRAINER_TRAINED_MODEL_NAME = "model.pkl"
+MODEL_TRAINER_METRICS_FILE_NAME = "metrics.yaml"
+MODEL_TRAINER_CANDIDATE_CACHE_DIR = "model_candidates"
+MODEL_TRAINER_CANDIDATE_CACHE_MAX_BYTES = 5 * 1024 ** 3
+MODEL_TRAINER_CANDIDATE_CACHE_MAX_AGE_DAYS = 30
+MODEL_TRAINER_EXPECTED_SCORE = 0.6  # minimum test F1 of the selected model
+MODEL_TRAINER_SCORING = "f1"
+MODEL_TRAINER_CV_FOLDS = 3
+MODEL_TRAINER_SEED = 42
+MODEL_TRAINER_WORKERS = None  # None: one per CPU
+# {estimator: {param: [values]}}; see utilities.model_search.ESTIMATORS for the names
+MODEL_TRAINER_SEARCH_SPACE = {
+    "LogisticRegression": {"C": [0.1, 1.0, 10.0], "max_iter": [1000]},
+    "DecisionTreeClassifier": {"criterion": ["gini", "entropy"], "max_depth": [None, 16]},
+    "RandomForestClassifier": {"n_estimators": [64, 128], "max_depth": [None, 16]},
+    "GradientBoostingClassifier": {"learning_rate": [0.05, 0.1], "n_estimators": [64, 128]},
+}
+
+"""
+BATCH PREDICTION CONSTANTS
+"""
+PREDICTION_DIR_NAME = "prediction_output"
+PREDICTION_OUTPUT_FILE_NAME = "output.csv"
+PREDICTION_BATCH_ROWS = 100_000
+PREDICTION_CACHE_CAPACITY = 1_000_000  # distinct feature vectors, about 25 bytes each
+PREDICTION_CACHE_POLICY = "lru"  # lru or lfu
+
+"""
+PREDICTION SERVER CONSTANTS
+"""
+SERVING_HOST = "127.0.0.1"
+SERVING_PORT = 8080
+SERVING_BATCH_WINDOW_MS = 2.0  # how long the first request of a micro-batch waits for company
+SERVING_MAX_BATCH_SIZE = 512
+SERVING_MAX_QUEUE = 4096  # queued requests beyond this are refused with 503
+SERVING_MAX_BODY_BYTES = 64 * 1024
+SERVING_LATENCY_SAMPLES = 100_000  # most recent request latencies kept for percentiles
+
+"""
+DRIFT MONITOR CONSTANTS
+"""
+DRIFT_MONITOR_DIR_NAME = "drift_monitor"
+DRIFT_MONITOR_REPORT_FILE_NAME = "reports.jsonl"
+DRIFT_MONITOR_WINDOW_RECORDS = 10_000
+DRIFT_MONITOR_SLIDE_RECORDS = 2_000  # equal to the window for tumbling windows
+DRIFT_MONITOR_THRESHOLD = 0.05
+DRIFT_MONITOR_BATCH_RECORDS = 1_000
+DRIFT_MONITOR_POLL_INTERVAL_S = 1.0
+
+"""
+STAGE CACHE CONSTANTS
+"""
+STAGE_CACHE_DIR_NAME = "cache"
+STAGE_CACHE_MAX_BYTES = 10 * 1024 ** 3
+STAGE_CACHE_MAX_AGE_DAYS = 30
+PIPELINE_STATE_FILE_NAME = "pipeline_state.json"
+PIPELINE_TRACE_FILE_NAME = "trace.json"  # Chrome trace format
+
+"""
+RUN REGISTRY CONSTANTS
+"""
+RUN_REGISTRY_FILE_NAME = "run_registry.sqlite"  # shared by all runs, next to their artifact directories
+RUN_REGISTRY_HASH_ARTIFACTS = True  # SHA-256 of every artifact file; unchanged files are not rehashed
+
+"""
+BLOB STORE AND RETENTION CONSTANTS
+"""
+BLOB_STORE_DIR_NAME = "blobs"  # shared by all runs, next to their artifact directories
+BLOB_STORE_ENABLED = True
+BLOB_STORE_MIN_BYTES = 64 * 1024  # smaller artifact files are left as they are
+RETENTION_KEEP_LAST_RUNS = 10
+RETENTION_KEEP_VALIDATED_RUNS = 3  # most recent runs that passed validation, kept beyond the last N
+RETENTION_KEEP_BASELINE_RUN = True  # the run whose data profile is the drift baseline
 
 """
 defining common constant variables for training pipeline
@@ -29,6 +136,8 @@ defining common constant variables for training pipeline
 TARGET_COLUMN = "Result"
 PIPELINE_NAME = "NetworkSecurity"
 ARTIFACT_DIR = "Artifacts"
+ARTIFACT_TIMESTAMP_FORMAT = "%m-%d-%Y-%H-%M-%S"
+ARTIFACT_WRITER_WORKERS = 2  # background threads persisting in-memory artifacts
 FILE_NAME = "phisingData.csv"
 
 TRAIN_FILE_NAME = "train.csv"
@@ -1,15 +1,49 @@
+from networksecurity.utilities.frame_handle import FrameHandle, in_memory_field
 from dataclasses import dataclass
 
 @dataclass
 class DataIngestionArtifact:
     train_path: str
     test_path: str
+    train_digest: str = None
+    test_digest: str = None
+    train_index_path: str = None
+    test_index_path: str = None
+    feature_store_path: str = None
+    train_rows: int = None
+    test_rows: int = None
+    blobs: dict = None  # field name -> SHA-256 of the blob store entry its file is linked to
+    train_frame: FrameHandle = in_memory_field()
+    test_frame: FrameHandle = in_memory_field()
 
 @dataclass
 class DataValidationArtifact:
-    validation_status: bool
+    validation_status: bool  # schema, columns and quarantined ratio; drift is reported separately
     valid_train_file_path: str
     valid_test_file_path: str
     invalid_train_file_path: str
     invalid_test_file_path: str
     drift_report_file_path: str
+    validation_report_file_path: str = None
+    drift_detected: bool = False
+    valid_train_digest: str = None
+    valid_test_digest: str = None
+    blobs: dict = None
+    valid_train_frame: FrameHandle = in_memory_field()
+    valid_test_frame: FrameHandle = in_memory_field()
+
+@dataclass
+class ModelTrainerArtifact:
+    trained_model_file_path: str
+    metrics_file_path: str
+    best_model_name: str
+    best_model_params: dict
+    train_f1_score: float
+    test_f1_score: float
+    blobs: dict = None
+
+@dataclass
+class BatchPredictionArtifact:
+    prediction_file_path: str
+    rows: int
+    cache_stats: dict
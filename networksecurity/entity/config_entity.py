@@ -2,37 +2,76 @@ from datetime import datetime
 import os
 
 from networksecurity.constants import train_pipeline
+from networksecurity.utilities.feature_store import FEATURE_STORE_BACKENDS
 
 class TrainingPipelineConfig:
-    def __init__(self, timestamp: datetime = datetime.now()):
-        timestamp = timestamp.now().strftime("%m-%d-%Y-%H-%M-%S")
+    def __init__(self, timestamp: datetime = None):
+        timestamp = (timestamp or datetime.now()).strftime(train_pipeline.ARTIFACT_TIMESTAMP_FORMAT)
 
         self.train_pipeline_name = train_pipeline.PIPELINE_NAME
         self.artifact_name = train_pipeline.ARTIFACT_DIR
         self.artifact_dir = os.path.join(self.artifact_name, timestamp)
         self.timestamp = timestamp
+        self.pipeline_state_file_path = os.path.join(self.artifact_dir, train_pipeline.PIPELINE_STATE_FILE_NAME)
+        self.trace_file_path = os.path.join(self.artifact_dir, train_pipeline.PIPELINE_TRACE_FILE_NAME)
 
 class DataIngestionConfig:
-    def __init__(self, training_pipeline_config: TrainingPipelineConfig):
+    def __init__(self, training_pipeline_config: TrainingPipelineConfig,
+                 feature_store_format: str = train_pipeline.DATA_INGESTION_FEATURE_STORE_FORMAT):
+        if feature_store_format not in FEATURE_STORE_BACKENDS:
+            raise ValueError(f"Unknown feature store format: {feature_store_format}")
+        self.feature_store_format = feature_store_format
+        extension = FEATURE_STORE_BACKENDS[feature_store_format].extension
+
         self.data_ingestion_dir = os.path.join(
             training_pipeline_config.artifact_dir,
             train_pipeline.DATA_INGESTION_DIR_NAME
         )
         self.feature_store_file_path = os.path.join(
             self.data_ingestion_dir,
-            train_pipeline.DATA_INGESTION_FEATURE_STORE_DIR
+            train_pipeline.DATA_INGESTION_FEATURE_STORE_DIR,
+            os.path.splitext(train_pipeline.FILE_NAME)[0] + extension
         )
         self.train_file_path = os.path.join(
             self.data_ingestion_dir,
-            train_pipeline.TRAIN_FILE_NAME
+            os.path.splitext(train_pipeline.TRAIN_FILE_NAME)[0] + extension
         )
         self.test_file_path = os.path.join(
             self.data_ingestion_dir,
-            train_pipeline.TEST_FILE_NAME
+            os.path.splitext(train_pipeline.TEST_FILE_NAME)[0] + extension
+        )
+        self.train_index_file_path = os.path.join(
+            self.data_ingestion_dir,
+            train_pipeline.DATA_INGESTION_TRAIN_INDEX_FILE_NAME
+        )
+        self.test_index_file_path = os.path.join(
+            self.data_ingestion_dir,
+            train_pipeline.DATA_INGESTION_TEST_INDEX_FILE_NAME
         )
         self.train_test_split_ratio = train_pipeline.DATA_INGESTION_TEST_TRAIN_SPLIT
+        self.split_seed = train_pipeline.DATA_INGESTION_SPLIT_SEED
+        self.target_column = train_pipeline.TARGET_COLUMN
+        self.handoff_max_rows = train_pipeline.DATA_INGESTION_HANDOFF_MAX_ROWS
+        self.dedup_max_keys = train_pipeline.DATA_INGESTION_DEDUP_MAX_KEYS
         self.collection_name = train_pipeline.DATA_INGESTION_COLLECTION_NAME
         self.database_name = train_pipeline.DATA_INGESTION_DATABASE_NAME
+        self.batch_size = train_pipeline.DATA_INGESTION_BATCH_SIZE
+        self.incremental = train_pipeline.DATA_INGESTION_INCREMENTAL
+        self.rescan_window_s = train_pipeline.DATA_INGESTION_RESCAN_WINDOW_S
+        # Shared across runs (not under the timestamped artifact dir): segments + high-water mark
+        self.segment_store_dir = os.path.join(
+            training_pipeline_config.artifact_name,
+            train_pipeline.DATA_INGESTION_FEATURE_STORE_DIR,
+            f"{self.database_name}.{self.collection_name}"
+        )
+        self.scan_workers = train_pipeline.DATA_INGESTION_SCAN_WORKERS
+        self.scan_partition_rows = train_pipeline.DATA_INGESTION_SCAN_PARTITION_ROWS
+        self.scan_preserve_order = train_pipeline.DATA_INGESTION_SCAN_PRESERVE_ORDER
+        self.partition_map_max_growth = train_pipeline.DATA_INGESTION_PARTITION_MAP_MAX_GROWTH
+        self.partition_map_file_path = os.path.join(
+            self.segment_store_dir,
+            train_pipeline.DATA_INGESTION_PARTITION_MAP_FILE_NAME
+        )
 
 class DataValidationConfig:
     def __init__(self, training_pipeline_config: TrainingPipelineConfig):
@@ -68,4 +107,136 @@ class DataValidationConfig:
             self.data_validation_dir,
             train_pipeline.DATA_VALIDATION_DRIFT_REPORT_DIR,
             train_pipeline.DATA_VALIDATION_DRIFT_REPORT_FILE_NAME
-        )
\ No newline at end of file
+        )
+        self.data_profile_file_path = os.path.join(
+            self.data_validation_dir,
+            train_pipeline.DATA_VALIDATION_DRIFT_REPORT_DIR,
+            train_pipeline.DATA_VALIDATION_PROFILE_FILE_NAME
+        )
+        self.validation_report_file_path = os.path.join(
+            self.data_validation_dir,
+            train_pipeline.DATA_VALIDATION_REPORT_FILE_NAME
+        )
+        self.chunk_rows = train_pipeline.DATA_VALIDATION_CHUNK_ROWS
+        self.workers = train_pipeline.DATA_VALIDATION_WORKERS
+        self.max_quarantined_ratio = train_pipeline.DATA_VALIDATION_MAX_QUARANTINED_RATIO
+        # Shared across runs: profile of the accepted baseline dataset
+        self.baseline_profile_file_path = os.path.join(
+            training_pipeline_config.artifact_name,
+            train_pipeline.DATA_VALIDATION_BASELINE_DIR,
+            train_pipeline.DATA_VALIDATION_PROFILE_FILE_NAME
+        )
+
+class ModelTrainerConfig:
+    def __init__(self, training_pipeline_config: TrainingPipelineConfig):
+        self.model_trainer_dir = os.path.join(
+            training_pipeline_config.artifact_dir,
+            train_pipeline.MODEL_TRAINER_DIR_NAME
+        )
+        self.trained_model_file_path = os.path.join(
+            self.model_trainer_dir,
+            train_pipeline.MODEL_TRAINER_TRAINED_MODEL_DIR,
+            train_pipeline.MODEL_TRAINER_TRAINED_MODEL_NAME
+        )
+        self.metrics_file_path = os.path.join(
+            self.model_trainer_dir,
+            train_pipeline.MODEL_TRAINER_METRICS_FILE_NAME
+        )
+        self.target_column = train_pipeline.TARGET_COLUMN
+        self.expected_score = train_pipeline.MODEL_TRAINER_EXPECTED_SCORE
+        self.scoring = train_pipeline.MODEL_TRAINER_SCORING
+        self.cv_folds = train_pipeline.MODEL_TRAINER_CV_FOLDS
+        self.seed = train_pipeline.MODEL_TRAINER_SEED
+        self.workers = train_pipeline.MODEL_TRAINER_WORKERS
+        self.search_space = train_pipeline.MODEL_TRAINER_SEARCH_SPACE
+        # Shared across runs: fitted candidates keyed by training data digest and params
+        self.candidate_cache_dir = os.path.join(
+            training_pipeline_config.artifact_name,
+            train_pipeline.MODEL_TRAINER_CANDIDATE_CACHE_DIR
+        )
+        self.candidate_cache_max_bytes = train_pipeline.MODEL_TRAINER_CANDIDATE_CACHE_MAX_BYTES
+        self.candidate_cache_max_age_days = train_pipeline.MODEL_TRAINER_CANDIDATE_CACHE_MAX_AGE_DAYS
+
+class BatchPredictionConfig:
+    def __init__(self, model_file_path: str = None,
+                 cache_policy: str = train_pipeline.PREDICTION_CACHE_POLICY):
+        # None: the model of the most recent training run under the artifact dir
+        self.model_file_path = model_file_path
+        self.artifact_dir = train_pipeline.ARTIFACT_DIR
+        self.prediction_output_file_path = os.path.join(
+            train_pipeline.PREDICTION_DIR_NAME,
+            train_pipeline.PREDICTION_OUTPUT_FILE_NAME
+        )
+        self.target_column = train_pipeline.TARGET_COLUMN
+        self.batch_rows = train_pipeline.PREDICTION_BATCH_ROWS
+        self.cache_capacity = train_pipeline.PREDICTION_CACHE_CAPACITY
+        self.cache_policy = cache_policy
+
+class PredictionServerConfig:
+    def __init__(self, model_file_path: str = None, host: str = train_pipeline.SERVING_HOST,
+                 port: int = train_pipeline.SERVING_PORT,
+                 batch_window_ms: float = train_pipeline.SERVING_BATCH_WINDOW_MS,
+                 max_batch_size: int = train_pipeline.SERVING_MAX_BATCH_SIZE,
+                 max_queue: int = train_pipeline.SERVING_MAX_QUEUE):
+        self.batch_prediction_config = BatchPredictionConfig(model_file_path=model_file_path)
+        self.host = host
+        self.port = port
+        self.batch_window_ms = batch_window_ms
+        self.max_batch_size = max_batch_size
+        self.max_queue = max_queue
+        self.max_body_bytes = train_pipeline.SERVING_MAX_BODY_BYTES
+        self.latency_samples = train_pipeline.SERVING_LATENCY_SAMPLES
+
+class DriftMonitorConfig:
+    def __init__(self, window_records: int = train_pipeline.DRIFT_MONITOR_WINDOW_RECORDS,
+                 slide_records: int = train_pipeline.DRIFT_MONITOR_SLIDE_RECORDS):
+        self.window_records = window_records
+        self.slide_records = slide_records
+        self.threshold = train_pipeline.DRIFT_MONITOR_THRESHOLD
+        self.target_column = train_pipeline.TARGET_COLUMN
+        self.batch_records = train_pipeline.DRIFT_MONITOR_BATCH_RECORDS
+        self.poll_interval_s = train_pipeline.DRIFT_MONITOR_POLL_INTERVAL_S
+        # The baseline accepted by data validation, compared against every window
+        self.baseline_profile_file_path = os.path.join(
+            train_pipeline.ARTIFACT_DIR,
+            train_pipeline.DATA_VALIDATION_BASELINE_DIR,
+            train_pipeline.DATA_VALIDATION_PROFILE_FILE_NAME
+        )
+        self.report_file_path = os.path.join(
+            train_pipeline.ARTIFACT_DIR,
+            train_pipeline.DRIFT_MONITOR_DIR_NAME,
+            train_pipeline.DRIFT_MONITOR_REPORT_FILE_NAME
+        )
+
+class StageCacheConfig:
+    def __init__(self, training_pipeline_config: TrainingPipelineConfig):
+        self.cache_dir = os.path.join(
+            training_pipeline_config.artifact_name,
+            train_pipeline.STAGE_CACHE_DIR_NAME
+        )
+        self.max_bytes = train_pipeline.STAGE_CACHE_MAX_BYTES
+        self.max_age_days = train_pipeline.STAGE_CACHE_MAX_AGE_DAYS
+
+class RunRegistryConfig:
+    def __init__(self, artifact_root: str = train_pipeline.ARTIFACT_DIR):
+        self.artifact_root = artifact_root
+        self.registry_file_path = os.path.join(artifact_root, train_pipeline.RUN_REGISTRY_FILE_NAME)
+        self.hash_artifacts = train_pipeline.RUN_REGISTRY_HASH_ARTIFACTS
+
+class BlobStoreConfig:
+    def __init__(self, artifact_root: str = train_pipeline.ARTIFACT_DIR):
+        self.blob_dir = os.path.join(artifact_root, train_pipeline.BLOB_STORE_DIR_NAME)
+        self.enabled = train_pipeline.BLOB_STORE_ENABLED
+        self.min_bytes = train_pipeline.BLOB_STORE_MIN_BYTES
+
+class RetentionConfig:
+    def __init__(self, artifact_root: str = train_pipeline.ARTIFACT_DIR):
+        self.artifact_root = artifact_root
+        self.keep_last_runs = train_pipeline.RETENTION_KEEP_LAST_RUNS
+        self.keep_validated_runs = train_pipeline.RETENTION_KEEP_VALIDATED_RUNS
+        self.keep_baseline_run = train_pipeline.RETENTION_KEEP_BASELINE_RUN
+        self.baseline_profile_file_path = os.path.join(
+            artifact_root,
+            train_pipeline.DATA_VALIDATION_BASELINE_DIR,
+            train_pipeline.DATA_VALIDATION_PROFILE_FILE_NAME
+        )
@@ -0,0 +1,120 @@
+from networksecurity.entity.config_entity import BlobStoreConfig
+from networksecurity.utilities.exception import NetworkSecurityException
+from networksecurity.utilities.logger import logger
+from networksecurity.utilities.frame_handle import persistent_fields
+from networksecurity.utilities.utils import compute_file_hash
+import os, sys
+import threading
+
+
+class BlobStore:
+    """Content-addressed store of artifact files, shared by all runs.
+
+    A file is stored once as ``<blob_dir>/<sha256[:2]>/<sha256><ext>``; the
+    run's own path becomes a hardlink to the blob, so identical payloads of
+    different runs (or of one run) take the space of one. Blobs are never
+    modified, only unlinked by ``collect`` once nothing refers to them: the
+    artifact writers write a new file and rename it over the old path (see
+    ``utils.atomic_output``), which replaces a run's link rather than writing
+    through it.
+    Where hardlinks are unavailable (e.g. the blob directory is on another
+    filesystem) files are left as they are.
+    """
+
+    def __init__(self, blob_store_config: BlobStoreConfig = None):
+        self.blob_store_config = blob_store_config or BlobStoreConfig()
+        self.blob_dir = self.blob_store_config.blob_dir
+        self._lock = threading.Lock()
+
+    def blob_path(self, digest: str, extension: str = "") -> str:
+        return os.path.join(self.blob_dir, digest[:2], digest + extension)
+
+    @staticmethod
+    def _link(source: str, destination: str):
+        """Atomically make ``destination`` a hardlink to ``source``, replacing what was there."""
+        temp_path = f"{destination}.{os.getpid()}.{threading.get_ident()}.tmp"
+        os.link(source, temp_path)
+        try:
+            os.replace(temp_path, destination)
+        except OSError:
+            os.remove(temp_path)
+            raise
+
+    def put(self, file_path: str) -> str:
+        """Store the file at ``file_path`` and replace it by a link to its blob; returns the blob's SHA-256,
+        or None if the file could not be linked."""
+        try:
+            digest = compute_file_hash(file_path)
+            blob = self.blob_path(digest, os.path.splitext(file_path)[1])
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            try:
+                # Serialized, so two stages storing the same payload agree on one blob
+                with self._lock:
+                    if not os.path.exists(blob):
+                        self._link(file_path, blob)
+                    elif not os.path.samefile(blob, file_path):
+                        self._link(blob, file_path)
+            except OSError as e:
+                logger.warning(f"Could not link {file_path} into the blob store: {e}")
+                return None
+            return digest
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def intern_artifact(self, artifact) -> dict:
+        """Store the artifact's files of at least ``min_bytes``; returns ``{field name: sha256}``."""
+        try:
+            blobs = {}
+            for name, value in persistent_fields(artifact).items():
+                if not isinstance(value, str) or not os.path.isfile(value):
+                    continue
+                if os.path.getsize(value) < self.blob_store_config.min_bytes:
+                    continue
+                digest = self.put(value)
+                if digest is not None:
+                    blobs[name] = digest
+            return blobs
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def blobs(self) -> list:
+        """``(sha256, path, stat)`` of every blob in the store."""
+        entries = []
+        if not os.path.isdir(self.blob_dir):
+            return entries
+        for prefix in os.listdir(self.blob_dir):
+            prefix_dir = os.path.join(self.blob_dir, prefix)
+            for name in os.listdir(prefix_dir):
+                if name.endswith(".tmp"):
+                    continue
+                path = os.path.join(prefix_dir, name)
+                entries.append((name.split(".", 1)[0], path, os.stat(path)))
+        return entries
+
+    def collect(self, referenced: set, dry_run: bool = False, unlinked: dict = None) -> dict:
+        """Remove blobs that are neither in ``referenced`` nor linked from anywhere else.
+
+        A blob with a second link is still a file of some run or stage cache
+        entry; ``unlinked`` counts links by ``(st_dev, st_ino)`` that are about
+        to go away (for a dry run). A run links its file to a new blob when it
+        stores it, so no blob is unused while being stored, and ``put`` keeps
+        the run's own file if a blob disappears as it links to it.
+        """
+        try:
+            unlinked = unlinked or {}
+            removed = freed = kept_bytes = 0
+            for digest, path, stat in self.blobs():
+                links = stat.st_nlink - unlinked.get((stat.st_dev, stat.st_ino), 0)
+                if digest in referenced or links > 1:
+                    kept_bytes += stat.st_size
+                    continue
+                if not dry_run:
+                    os.remove(path)
+                removed += 1
+                freed += stat.st_size
+            if removed:
+                logger.info(f"{'Would remove' if dry_run else 'Removed'} {removed} unreferenced blobs "
+                            f"({freed} bytes); {kept_bytes} bytes kept")
+            return {"blobs_removed": removed, "bytes_freed": freed, "bytes_kept": kept_bytes}
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
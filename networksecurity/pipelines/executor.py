@@ -0,0 +1,132 @@
+from networksecurity.utilities.exception import NetworkSecurityException
+from networksecurity.utilities.logger import logger
+from networksecurity.utilities.tracing import trace_span
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field
+from typing import Callable
+import sys
+import time
+
+
+@dataclass
+class Stage:
+    """One node of a pipeline DAG.
+
+    ``inputs`` maps each keyword argument of ``func`` to what feeds it: either
+    an artifact dataclass (the stage whose ``output`` has that type) or the
+    name of an upstream stage. ``output`` optionally declares the artifact
+    dataclass the stage returns, so later stages can depend on it by type.
+    """
+    name: str
+    func: Callable
+    inputs: dict = field(default_factory=dict)
+    output: type = None
+
+
+class PipelineExecutor:
+    """Runs a DAG of stages, executing every stage whose inputs are ready concurrently.
+
+    Args:
+        stages: The stages; dependencies are resolved from their ``inputs``.
+        max_workers: Size of the worker pool.
+        use_processes: Use a process pool instead of threads. Stage functions,
+            their inputs and outputs must then be picklable.
+    """
+
+    def __init__(self, stages: list, max_workers: int = None, use_processes: bool = False):
+        try:
+            self.stages = {stage.name: stage for stage in stages}
+            if len(self.stages) != len(stages):
+                raise ValueError("Stage names must be unique")
+            self.max_workers = max_workers
+            self.use_processes = use_processes
+            self.dependencies = self._resolve_dependencies()
+            self.order = self._topological_order()
+            self.timings = {}
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def _resolve_dependencies(self) -> dict:
+        """Map every stage to ``{argument: upstream stage name}``."""
+        producers = {}
+        for stage in self.stages.values():
+            if stage.output is not None:
+                if stage.output in producers:
+                    raise ValueError(
+                        f"Stages '{producers[stage.output]}' and '{stage.name}' both produce {stage.output.__name__}"
+                    )
+                producers[stage.output] = stage.name
+
+        dependencies = {}
+        for stage in self.stages.values():
+            dependencies[stage.name] = {}
+            for argument, source in stage.inputs.items():
+                if isinstance(source, str):
+                    upstream = source if source in self.stages else None
+                else:
+                    upstream = producers.get(source)
+                if upstream is None:
+                    raise ValueError(f"No stage provides input '{argument}' ({source}) of stage '{stage.name}'")
+                dependencies[stage.name][argument] = upstream
+        return dependencies
+
+    def _topological_order(self) -> list:
+        remaining = {name: set(upstreams.values()) for name, upstreams in self.dependencies.items()}
+        order = []
+        while remaining:
+            ready = sorted(name for name, upstreams in remaining.items() if not upstreams)
+            if not ready:
+                raise ValueError(f"Cycle between stages: {', '.join(sorted(remaining))}")
+            for name in ready:
+                order.append(name)
+                del remaining[name]
+            for upstreams in remaining.values():
+                upstreams.difference_update(ready)
+        return order
+
+    @staticmethod
+    def _call_traced(stage: Stage, kwargs: dict):
+        with trace_span(stage.name, category="task") as span:
+            result = stage.func(**kwargs)
+            span.record_output(result)
+            return result
+
+    def run(self) -> dict:
+        """Run all stages and return ``{stage name: result}``; timings end up in ``self.timings``."""
+        pool_cls = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+        results = {}
+        running = {}
+        pending = list(self.order)
+
+        try:
+            with pool_cls(max_workers=self.max_workers) as pool:
+                while pending or running:
+                    for name in [n for n in pending if set(self.dependencies[n].values()) <= results.keys()]:
+                        stage = self.stages[name]
+                        kwargs = {arg: results[upstream] for arg, upstream in self.dependencies[name].items()}
+                        self.timings[name] = {"start": time.time()}
+                        if self.use_processes:
+                            # Spans recorded in worker processes would not reach this process's tracer
+                            future = pool.submit(stage.func, **kwargs)
+                        else:
+                            future = pool.submit(self._call_traced, stage, kwargs)
+                        running[future] = name
+                        pending.remove(name)
+
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        name = running.pop(future)
+                        try:
+                            results[name] = future.result()
+                        except Exception:
+                            for other in running:
+                                other.cancel()
+                            raise
+                        finally:
+                            timing = self.timings[name]
+                            timing["end"] = time.time()
+                            timing["duration_s"] = round(timing["end"] - timing["start"], 4)
+                        logger.info(f"Stage '{name}' finished in {self.timings[name]['duration_s']:.3f}s")
+            return results
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
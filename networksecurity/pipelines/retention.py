@@ -0,0 +1,112 @@
+from networksecurity.constants.train_pipeline import (
+    DATA_VALIDATION_DIR_NAME, DATA_VALIDATION_DRIFT_REPORT_DIR, DATA_VALIDATION_PROFILE_FILE_NAME,
+    PIPELINE_STATE_FILE_NAME
+)
+from networksecurity.entity.config_entity import RetentionConfig, BlobStoreConfig
+from networksecurity.pipelines.blob_store import BlobStore
+from networksecurity.pipelines.run_state import PipelineRunState
+from networksecurity.utilities.exception import NetworkSecurityException
+from networksecurity.utilities.logger import logger
+from networksecurity.utilities.utils import compute_file_hash
+from collections import Counter
+import os, sys
+import shutil
+
+
+def _profile_path(run_dir: str) -> str:
+    return os.path.join(run_dir, DATA_VALIDATION_DIR_NAME, DATA_VALIDATION_DRIFT_REPORT_DIR,
+                        DATA_VALIDATION_PROFILE_FILE_NAME)
+
+
+def _passed_validation(state: PipelineRunState) -> bool:
+    stage = state.stages.get("data_validation") or {}
+    return stage.get("status") == "completed" and bool((stage.get("artifact") or {}).get("validation_status"))
+
+
+def select_runs(retention_config: RetentionConfig = None) -> tuple:
+    """Split the runs under the artifact root into ``(kept, removable)``.
+
+    ``kept`` maps each kept run directory to the reasons for keeping it: one
+    of the ``keep_last_runs`` most recent runs (never fewer than one, so a run
+    in progress is safe), one of the ``keep_validated_runs`` most recent runs
+    that passed validation, or the most recent run whose data profile is the
+    drift baseline. Directories without a state file are neither.
+    """
+    try:
+        config = retention_config or RetentionConfig()
+        baseline_hash = None
+        if config.keep_baseline_run and os.path.exists(config.baseline_profile_file_path):
+            baseline_hash = compute_file_hash(config.baseline_profile_file_path)
+
+        kept, removable = {}, []
+        validated = 0
+        for position, (_, state_path) in enumerate(PipelineRunState._runs(config.artifact_root)):
+            run_dir = os.path.dirname(state_path)
+            state = PipelineRunState(state_path)
+            reasons = []
+            if position < max(1, config.keep_last_runs):
+                reasons.append("recent")
+            if _passed_validation(state):
+                validated += 1
+                if validated <= config.keep_validated_runs:
+                    reasons.append("validated")
+            if baseline_hash is not None and os.path.exists(_profile_path(run_dir)) \
+                    and compute_file_hash(_profile_path(run_dir)) == baseline_hash:
+                reasons.append("baseline")
+                baseline_hash = None
+            if reasons:
+                kept[run_dir] = reasons
+            else:
+                removable.append(run_dir)
+        return kept, removable
+    except Exception as e:
+        raise NetworkSecurityException(e, sys)
+
+
+def referenced_blobs(run_dirs) -> set:
+    """SHA-256 of every blob recorded in the state files of ``run_dirs``."""
+    referenced = set()
+    for run_dir in run_dirs:
+        state = PipelineRunState(os.path.join(run_dir, PIPELINE_STATE_FILE_NAME))
+        for stage in state.stages.values():
+            referenced.update(((stage.get("artifact") or {}).get("blobs") or {}).values())
+    return referenced
+
+
+def _links(run_dirs) -> tuple:
+    """Links under ``run_dirs`` by ``(st_dev, st_ino)``, and the bytes of files with no link elsewhere."""
+    links, stats = Counter(), {}
+    for run_dir in run_dirs:
+        for root, _, names in os.walk(run_dir):
+            for name in names:
+                stat = os.stat(os.path.join(root, name))
+                key = (stat.st_dev, stat.st_ino)
+                links[key] += 1
+                stats[key] = stat
+    exclusive_bytes = sum(stats[key].st_size for key, count in links.items() if count >= stats[key].st_nlink)
+    return links, exclusive_bytes
+
+
+def collect_garbage(retention_config: RetentionConfig = None, blob_store_config: BlobStoreConfig = None,
+                    dry_run: bool = False) -> dict:
+    """Delete the runs ``select_runs`` does not keep, then the blobs no remaining run or cache entry uses.
+
+    With ``dry_run`` nothing is deleted; the result reports what would be.
+    """
+    try:
+        retention_config = retention_config or RetentionConfig()
+        blob_store = BlobStore(blob_store_config or BlobStoreConfig(retention_config.artifact_root))
+        kept, removable = select_runs(retention_config)
+        links, run_bytes = _links(removable)
+
+        for run_dir in removable:
+            logger.info(f"{'Would remove' if dry_run else 'Removing'} run {run_dir}")
+            if not dry_run:
+                shutil.rmtree(run_dir)
+        blobs = blob_store.collect(referenced_blobs(kept), dry_run=dry_run, unlinked=links if dry_run else None)
+
+        return {"runs_kept": {os.path.basename(run_dir): reasons for run_dir, reasons in kept.items()},
+                "runs_removed": [os.path.basename(run_dir) for run_dir in removable],
+                "run_bytes_freed": run_bytes, **blobs}
+    except Exception as e:
+        raise NetworkSecurityException(e, sys)
@@ -0,0 +1,322 @@
+from networksecurity.constants.train_pipeline import ARTIFACT_TIMESTAMP_FORMAT, PIPELINE_STATE_FILE_NAME
+from networksecurity.entity.config_entity import RunRegistryConfig
+from networksecurity.pipelines.run_state import PipelineRunState
+from networksecurity.utilities.exception import NetworkSecurityException
+from networksecurity.utilities.logger import logger
+from networksecurity.utilities.utils import compute_file_hash
+from contextlib import closing
+from datetime import datetime
+import os, sys
+import time
+import sqlite3
+import yaml
+
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    artifact_dir TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    finished_at REAL,
+    status TEXT NOT NULL,
+    validation_status INTEGER,
+    is_drift INTEGER,
+    drift_baseline TEXT,
+    best_model_name TEXT,
+    train_f1_score REAL,
+    test_f1_score REAL,
+    state_mtime_ns INTEGER NOT NULL,
+    indexed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_started ON runs (started_at);
+CREATE INDEX IF NOT EXISTS runs_validation ON runs (validation_status, started_at);
+
+CREATE TABLE IF NOT EXISTS stages (
+    run_id TEXT NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    stage TEXT NOT NULL,
+    status TEXT NOT NULL,
+    cached INTEGER,
+    fingerprint TEXT,
+    duration_s REAL,
+    finished_at REAL,
+    error TEXT,
+    PRIMARY KEY (run_id, stage)
+);
+CREATE INDEX IF NOT EXISTS stages_status ON stages (stage, status);
+
+CREATE TABLE IF NOT EXISTS artifacts (
+    run_id TEXT NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    stage TEXT NOT NULL,
+    name TEXT NOT NULL,
+    path TEXT NOT NULL,
+    size INTEGER,
+    mtime_ns INTEGER,
+    sha256 TEXT,
+    PRIMARY KEY (run_id, stage, name)
+);
+CREATE INDEX IF NOT EXISTS artifacts_sha256 ON artifacts (sha256);
+CREATE INDEX IF NOT EXISTS artifacts_path ON artifacts (path, size, mtime_ns);
+
+CREATE TABLE IF NOT EXISTS feature_drift (
+    run_id TEXT NOT NULL REFERENCES runs (run_id) ON DELETE CASCADE,
+    feature TEXT NOT NULL,
+    started_at REAL NOT NULL,
+    p_val REAL,
+    drift_detected INTEGER NOT NULL,
+    chi2 REAL,
+    psi REAL,
+    js_divergence REAL,
+    PRIMARY KEY (run_id, feature)
+);
+CREATE INDEX IF NOT EXISTS feature_drift_history ON feature_drift (feature, drift_detected, started_at);
+"""
+
+STAGE_ORDER = ("data_ingestion", "data_validation", "model_trainer")
+
+
+def _read_drift_report(file_path: str) -> dict:
+    """Drift report YAML, parsed with libyaml when PyYAML was built with it (most of the cost of indexing)."""
+    with open(file_path) as file:
+        return yaml.load(file, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)) or {}
+
+
+def _run_started_at(run_id: str) -> float:
+    try:
+        return datetime.strptime(run_id, ARTIFACT_TIMESTAMP_FORMAT).timestamp()
+    except ValueError:
+        return None
+
+
+class RunRegistry:
+    """SQLite index of the runs under ``Artifacts/``: run metadata, stage statuses,
+    artifact paths and hashes, and per-feature drift statistics.
+
+    The run directories stay the source of truth; ``index_run`` (called at
+    the end of every pipeline run) and ``index_all`` (backfill) copy what is
+    needed for history queries into indexed tables, so questions such as
+    "when did feature X first drift?" are answered by one index lookup
+    instead of parsing every run's YAML. A run is re-indexed only when its
+    ``pipeline_state.json`` changed, and an artifact file whose path, size
+    and mtime are already known is not hashed again.
+    """
+
+    def __init__(self, run_registry_config: RunRegistryConfig = None):
+        try:
+            self.run_registry_config = run_registry_config or RunRegistryConfig()
+            self.file_path = self.run_registry_config.registry_file_path
+            os.makedirs(os.path.dirname(self.file_path) or ".", exist_ok=True)
+            with closing(self._connect()) as connection:
+                if connection.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                    connection.executescript(SCHEMA)
+                    connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def _connect(self) -> sqlite3.Connection:
+        # WAL lets queries run while a pipeline run is being indexed
+        connection = sqlite3.connect(self.file_path, timeout=30)
+        connection.row_factory = sqlite3.Row
+        connection.execute("PRAGMA journal_mode = WAL")
+        # A crash can only lose the last commits, which the next index_all redoes
+        connection.execute("PRAGMA synchronous = NORMAL")
+        connection.execute("PRAGMA foreign_keys = ON")
+        return connection
+
+    def _query(self, sql: str, parameters: tuple = ()) -> list:
+        try:
+            with closing(self._connect()) as connection:
+                return [dict(row) for row in connection.execute(sql, parameters)]
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    # Indexing
+
+    def _hash(self, connection: sqlite3.Connection, path: str, size: int, mtime_ns: int):
+        if not self.run_registry_config.hash_artifacts:
+            return None
+        known = connection.execute(
+            "SELECT sha256 FROM artifacts WHERE path = ? AND size = ? AND mtime_ns = ? AND sha256 IS NOT NULL",
+            (path, size, mtime_ns)
+        ).fetchone()
+        return known[0] if known else compute_file_hash(path)
+
+    def _artifact_rows(self, connection: sqlite3.Connection, run_id: str, stages: dict) -> list:
+        rows = []
+        for stage, entry in stages.items():
+            # Files in the blob store were hashed when they were stored
+            blobs = (entry.get("artifact") or {}).get("blobs") or {}
+            for name, value in (entry.get("artifact") or {}).items():
+                if not isinstance(value, str) or not os.path.exists(value):
+                    continue
+                if os.path.isdir(value):
+                    size = sum(os.path.getsize(os.path.join(root, file_name))
+                               for root, _, names in os.walk(value) for file_name in names)
+                    mtime_ns = max((os.stat(os.path.join(root, file_name)).st_mtime_ns
+                                    for root, _, names in os.walk(value) for file_name in names), default=0)
+                else:
+                    stat = os.stat(value)
+                    size, mtime_ns = stat.st_size, stat.st_mtime_ns
+                sha256 = blobs.get(name) or self._hash(connection, value, size, mtime_ns)
+                rows.append((run_id, stage, name, value, size, mtime_ns, sha256))
+        return rows
+
+    @staticmethod
+    def _status(stages: dict) -> str:
+        statuses = [stages.get(stage, {}).get("status") for stage in STAGE_ORDER]
+        if "failed" in statuses:
+            return "failed"
+        return "completed" if all(status == "completed" for status in statuses) else "incomplete"
+
+    def index_run(self, artifact_dir: str, force: bool = False, connection: sqlite3.Connection = None) -> bool:
+        """Index (or re-index) the run in ``artifact_dir``; False if it was already up to date."""
+        try:
+            if connection is None:
+                with closing(self._connect()) as connection:
+                    return self.index_run(artifact_dir, force, connection)
+
+            run_id = os.path.basename(os.path.normpath(artifact_dir))
+            state = PipelineRunState(os.path.join(artifact_dir, PIPELINE_STATE_FILE_NAME))
+            if not os.path.exists(state.file_path):
+                return False
+            state_mtime_ns = os.stat(state.file_path).st_mtime_ns
+
+            known = connection.execute("SELECT state_mtime_ns FROM runs WHERE run_id = ?", (run_id,)).fetchone()
+            if known and known[0] == state_mtime_ns and not force:
+                return False
+
+            stages, timings = state.stages, state.timings
+            # The run directory is named after the run's start, also for resumed runs
+            started_at = _run_started_at(run_id) or min(
+                (timing["start"] for timing in timings.values() if "start" in timing), default=0.0
+            )
+            finished_at = max([timing["end"] for timing in timings.values() if "end" in timing]
+                              + [entry["finished_at"] for entry in stages.values() if entry.get("finished_at")],
+                              default=None)
+
+            validation = (stages.get("data_validation") or {}).get("artifact") or {}
+            trainer = (stages.get("model_trainer") or {}).get("artifact") or {}
+            drift_report = {}
+            drift_report_path = validation.get("drift_report_file_path")
+            if drift_report_path and os.path.exists(drift_report_path):
+                drift_report = _read_drift_report(drift_report_path)
+            overall = drift_report.pop("overall_drift_status", {})
+
+            artifact_rows = self._artifact_rows(connection, run_id, stages)
+            with connection:
+                connection.execute("DELETE FROM runs WHERE run_id = ?", (run_id,))
+                connection.execute(
+                    "INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (run_id, artifact_dir, started_at, finished_at, self._status(stages),
+                     validation.get("validation_status"), overall.get("is_drift_detected"),
+                     overall.get("baseline"), trainer.get("best_model_name"),
+                     trainer.get("train_f1_score"), trainer.get("test_f1_score"),
+                     state_mtime_ns, time.time())
+                )
+                connection.executemany("INSERT INTO stages VALUES (?, ?, ?, ?, ?, ?, ?, ?)", [
+                    (run_id, stage, entry.get("status"), entry.get("cached"), entry.get("fingerprint"),
+                     (timings.get(stage) or {}).get("duration_s"), entry.get("finished_at"), entry.get("error"))
+                    for stage, entry in stages.items()
+                ])
+                connection.executemany("INSERT INTO artifacts VALUES (?, ?, ?, ?, ?, ?, ?)", artifact_rows)
+                connection.executemany("INSERT INTO feature_drift VALUES (?, ?, ?, ?, ?, ?, ?, ?)", [
+                    (run_id, feature, started_at, stats.get("p_val"), bool(stats.get("drift_detected")),
+                     stats.get("chi2"), stats.get("psi"), stats.get("js_divergence"))
+                    for feature, stats in drift_report.items() if isinstance(stats, dict)
+                ])
+            return True
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def index_all(self, force: bool = False) -> dict:
+        """Index every run under the artifact root that is new or changed, and drop runs that were deleted."""
+        try:
+            artifact_root = self.run_registry_config.artifact_root
+            run_dirs = [os.path.dirname(state_path) for _, state_path in PipelineRunState._runs(artifact_root)]
+            with closing(self._connect()) as connection:
+                indexed = sum(self.index_run(run_dir, force, connection) for run_dir in run_dirs)
+            present = {os.path.basename(run_dir) for run_dir in run_dirs}
+            with closing(self._connect()) as connection, connection:
+                known = [row[0] for row in connection.execute("SELECT run_id FROM runs")]
+                removed = [run_id for run_id in known if run_id not in present]
+                connection.executemany("DELETE FROM runs WHERE run_id = ?", [(run_id,) for run_id in removed])
+            logger.info(f"Run registry: {indexed} runs indexed, {len(removed)} removed, {len(run_dirs)} on disk")
+            return {"runs": len(run_dirs), "indexed": indexed, "removed": len(removed)}
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    # Queries
+
+    def runs(self, status: str = None, validation_status: bool = None, since: float = None,
+             limit: int = None) -> list:
+        """Runs, most recent first, optionally filtered by run status, validation outcome and start time."""
+        clauses, parameters = [], []
+        if status is not None:
+            clauses.append("status = ?")
+            parameters.append(status)
+        if validation_status is not None:
+            clauses.append("validation_status = ?")
+            parameters.append(int(validation_status))
+        if since is not None:
+            clauses.append("started_at >= ?")
+            parameters.append(since)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        limit_clause = f"LIMIT {int(limit)}" if limit else ""
+        return self._query(f"SELECT * FROM runs {where} ORDER BY started_at DESC {limit_clause}", tuple(parameters))
+
+    def run(self, run_id: str) -> dict:
+        """One run with its stages, artifacts and drifted features, or None."""
+        found = self._query("SELECT * FROM runs WHERE run_id = ?", (run_id,))
+        if not found:
+            return None
+        run = found[0]
+        run["stages"] = self._query("SELECT stage, status, cached, duration_s, error FROM stages WHERE run_id = ?",
+                                    (run_id,))
+        run["artifacts"] = self._query("SELECT stage, name, path, size, sha256 FROM artifacts WHERE run_id = ?",
+                                       (run_id,))
+        run["drifted_features"] = [row["feature"] for row in self._query(
+            "SELECT feature FROM feature_drift WHERE run_id = ? AND drift_detected = 1 ORDER BY feature", (run_id,)
+        )]
+        return run
+
+    def feature_history(self, feature: str, drifted_only: bool = False, limit: int = None) -> list:
+        """Drift statistics of ``feature`` across runs, oldest first."""
+        drifted = "AND drift_detected = 1" if drifted_only else ""
+        limit_clause = f"LIMIT {int(limit)}" if limit else ""
+        return self._query(
+            f"SELECT run_id, started_at, p_val, drift_detected, chi2, psi, js_divergence FROM feature_drift "
+            f"WHERE feature = ? {drifted} ORDER BY started_at {limit_clause}", (feature,)
+        )
+
+    def first_drift(self, feature: str) -> dict:
+        """The earliest run in which ``feature`` drifted, or None."""
+        found = self.feature_history(feature, drifted_only=True, limit=1)
+        return found[0] if found else None
+
+    def drift_counts(self) -> list:
+        """Per feature: number of runs checked, runs with drift, and the first and last drifted run."""
+        return self._query(
+            "SELECT feature, COUNT(*) AS runs, SUM(drift_detected) AS drifted_runs, "
+            "MIN(CASE WHEN drift_detected THEN started_at END) AS first_drift_at, "
+            "MAX(CASE WHEN drift_detected THEN started_at END) AS last_drift_at "
+            "FROM feature_drift GROUP BY feature ORDER BY drifted_runs DESC, feature"
+        )
+
+    def find_artifact(self, sha256: str) -> list:
+        """Every run and stage that produced a file with the given SHA-256 (a unique prefix also matches)."""
+        return self._query(
+            "SELECT run_id, stage, name, path, size, sha256 FROM artifacts WHERE sha256 >= ? AND sha256 < ? "
+            "ORDER BY run_id", (sha256, sha256 + "g")
+        )
+
+
+def index_run_quietly(artifact_dir: str, run_registry_config: RunRegistryConfig = None):
+    """Index a finished run; a registry problem is logged, never raised into the pipeline."""
+    try:
+        start = time.perf_counter()
+        RunRegistry(run_registry_config).index_run(artifact_dir)
+        logger.info(f"Indexed run {os.path.basename(artifact_dir)} in the run registry "
+                    f"({(time.perf_counter() - start) * 1000:.1f} ms)")
+    except Exception as e:
+        logger.warning(f"Could not index run in the run registry: {e}")
+
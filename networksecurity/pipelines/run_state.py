@@ -0,0 +1,101 @@
+from networksecurity.constants.train_pipeline import ARTIFACT_TIMESTAMP_FORMAT, PIPELINE_STATE_FILE_NAME
+from networksecurity.utilities.exception import NetworkSecurityException
+from networksecurity.utilities.frame_handle import persistent_fields
+from datetime import datetime
+import os, sys
+import json
+import time
+import threading
+
+
+class PipelineRunState:
+    """Status and artifacts of every stage of one run, kept in ``pipeline_state.json``
+    inside the run's artifact directory so that an interrupted run can be resumed.
+    Stages may be marked from several threads; updates are serialized."""
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._lock = threading.Lock()
+        self.stages = {}
+        self.timings = {}
+        if os.path.exists(file_path):
+            with open(file_path) as file:
+                content = json.load(file)
+            self.stages = content.get("stages", {})
+            self.timings = content.get("timings", {})
+
+    def _save(self):
+        os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+        temp_path = self.file_path + ".tmp"
+        with open(temp_path, "w") as file:
+            json.dump({"stages": self.stages, "timings": self.timings}, file, indent=2)
+        os.replace(temp_path, self.file_path)
+
+    def completed_artifact(self, stage_name: str, artifact_cls):
+        """Artifact of ``stage_name`` if it completed in this run, else None."""
+        stage = self.stages.get(stage_name)
+        if not stage or stage.get("status") != "completed":
+            return None
+        return artifact_cls(**stage["artifact"])
+
+    def mark_completed(self, stage_name: str, artifact, fingerprint: str = None, cached: bool = False):
+        try:
+            with self._lock:
+                self.stages[stage_name] = {
+                    "status": "completed",
+                    "fingerprint": fingerprint,
+                    "cached": cached,
+                    "finished_at": time.time(),
+                    "artifact": persistent_fields(artifact),
+                }
+                self._save()
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def mark_failed(self, stage_name: str, error: Exception):
+        try:
+            with self._lock:
+                self.stages[stage_name] = {"status": "failed", "finished_at": time.time(), "error": str(error)}
+                self._save()
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def record_timings(self, timings: dict):
+        """Store per-stage ``start``/``end``/``duration_s`` as measured by the executor."""
+        try:
+            with self._lock:
+                self.timings.update(timings)
+                self._save()
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    @staticmethod
+    def _runs(artifact_root: str) -> list:
+        """``(timestamp, state file path)`` of the runs under ``artifact_root``, most recent first."""
+        if not os.path.isdir(artifact_root):
+            return []
+        runs = []
+        for name in os.listdir(artifact_root):
+            try:
+                timestamp = datetime.strptime(name, ARTIFACT_TIMESTAMP_FORMAT)
+            except ValueError:
+                continue
+            state_path = os.path.join(artifact_root, name, PIPELINE_STATE_FILE_NAME)
+            if os.path.exists(state_path):
+                runs.append((timestamp, state_path))
+        return sorted(runs, reverse=True)
+
+    @staticmethod
+    def latest_run_timestamp(artifact_root: str):
+        """Timestamp of the most recent run under ``artifact_root`` that has a state file, or None."""
+        runs = PipelineRunState._runs(artifact_root)
+        return runs[0][0] if runs else None
+
+    @staticmethod
+    def latest_completed_artifact(artifact_root: str, stage_name: str, artifact_cls):
+        """Artifact of ``stage_name`` from the most recent run that completed it, or None."""
+        for _, state_path in PipelineRunState._runs(artifact_root):
+            artifact = PipelineRunState(state_path).completed_artifact(stage_name, artifact_cls)
+            if artifact is not None:
+                return artifact
+        return None
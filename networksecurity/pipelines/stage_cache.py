@@ -0,0 +1,213 @@
+from networksecurity.entity.config_entity import StageCacheConfig
+from networksecurity.utilities.exception import NetworkSecurityException
+from networksecurity.utilities.logger import logger
+from networksecurity.utilities.frame_handle import persistent_fields
+import os, sys
+import json
+import time
+import shutil
+import hashlib
+from collections import Counter
+
+
+def _link_or_copy(source: str, destination: str):
+    """Hardlink ``source`` (a file or directory tree) to ``destination``, copying where linking fails."""
+    if os.path.isdir(source):
+        for root, _, names in os.walk(source):
+            target_dir = os.path.join(destination, os.path.relpath(root, source))
+            os.makedirs(target_dir, exist_ok=True)
+            for name in names:
+                _link_or_copy(os.path.join(root, name), os.path.join(target_dir, name))
+        return
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copy2(source, destination)
+
+
+def _remove_path(path: str):
+    if os.path.isdir(path) and not os.path.islink(path):
+        shutil.rmtree(path)
+    elif os.path.lexists(path):
+        os.remove(path)
+
+
+def _file_stats(path: str) -> list:
+    """``os.stat`` of every file in the tree ``path``."""
+    return [os.stat(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names]
+
+
+class StageCache:
+    """Content-addressed store of stage artifacts, keyed by a stage fingerprint.
+
+    Each entry lives in ``<cache_dir>/<stage>/<fingerprint>/``: the artifact's
+    files are hardlinked there (copied where hardlinks are unavailable) and
+    ``entry.json`` records the remaining artifact fields and where each file
+    was in the run directory. A hit links the files back into the current
+    run's directory and returns the artifact with its paths pointing there,
+    so the run does not depend on the entry, which ``evict`` may remove.
+    """
+    ENTRY_FILE_NAME = "entry.json"
+
+    def __init__(self, stage_cache_config: StageCacheConfig):
+        self.stage_cache_config = stage_cache_config
+        self.cache_dir = stage_cache_config.cache_dir
+
+    @staticmethod
+    def fingerprint(stage_name: str, config, run_dir: str, inputs: dict) -> str:
+        """Hash the stage name, its config and the hashes of its inputs.
+
+        ``run_dir`` is stripped from config paths so that identical configs of
+        different runs produce the same fingerprint.
+        """
+        config_fields = {
+            key: value.replace(run_dir, "<run>") if isinstance(value, str) else value
+            for key, value in sorted(vars(config).items())
+        }
+        payload = json.dumps(
+            {"stage": stage_name, "config": config_fields, "inputs": inputs},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _entry_dir(self, stage_name: str, fingerprint: str) -> str:
+        return os.path.join(self.cache_dir, stage_name, fingerprint)
+
+    def get(self, stage_name: str, fingerprint: str, artifact_cls, run_dir: str):
+        """Return the cached artifact for ``fingerprint`` with its files linked into ``run_dir``,
+        or None on a miss."""
+        try:
+            entry_dir = self._entry_dir(stage_name, fingerprint)
+            entry_path = os.path.join(entry_dir, self.ENTRY_FILE_NAME)
+            if not os.path.exists(entry_path):
+                return None
+
+            try:
+                with open(entry_path) as file:
+                    entry = json.load(file)
+            except ValueError:
+                logger.warning(f"Cache entry {entry_dir} is unreadable; ignoring it.")
+                return None
+
+            values, links = {}, []
+            for name, value in entry["fields"].items():
+                if name in entry["files"]:
+                    source = os.path.join(entry_dir, value)
+                    if not os.path.exists(source):
+                        logger.warning(f"Cache entry {entry_dir} is incomplete; ignoring it.")
+                        return None
+                    # Files that were not in the run directory go to a directory of the stage
+                    relative_path = entry.get("run_paths", {}).get(name) or os.path.join(stage_name, value)
+                    value = os.path.join(run_dir, relative_path)
+                    links.append((source, value))
+                values[name] = value
+
+            for source, destination in links:
+                # Unlinked first: the destination may be a link to a blob or to another entry
+                _remove_path(destination)
+                os.makedirs(os.path.dirname(destination), exist_ok=True)
+                _link_or_copy(source, destination)
+
+            entry["last_used"] = time.time()
+            self._write_entry(entry_path, entry)
+
+            logger.info(f"Stage cache hit for {stage_name}: {fingerprint[:12]}")
+            return artifact_cls(**values)
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    @staticmethod
+    def _write_entry(entry_path: str, entry: dict):
+        """Write ``entry.json`` under a temporary name and rename it, so readers never see it half written."""
+        temp_path = f"{entry_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w") as file:
+            json.dump(entry, file, indent=2)
+        os.replace(temp_path, entry_path)
+
+    def put(self, stage_name: str, fingerprint: str, artifact, run_dir: str):
+        """Store ``artifact`` of the run in ``run_dir``; its existing file fields are hardlinked into the entry."""
+        try:
+            entry_dir = self._entry_dir(stage_name, fingerprint)
+            temp_dir = entry_dir + ".tmp"
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            os.makedirs(temp_dir)
+
+            entry = {"stage": stage_name, "fingerprint": fingerprint, "created_at": time.time(),
+                     "last_used": time.time(), "fields": {}, "files": [], "run_paths": {}}
+            for field_name, value in persistent_fields(artifact).items():
+                if isinstance(value, str) and os.path.exists(value):
+                    # Prefix with the field name: several fields may share a base name
+                    name = f"{field_name}__{os.path.basename(value.rstrip(os.sep))}"
+                    _link_or_copy(value, os.path.join(temp_dir, name))
+                    entry["files"].append(field_name)
+                    relative_path = os.path.relpath(value, run_dir)
+                    if relative_path.split(os.sep, 1)[0] != os.pardir:
+                        entry["run_paths"][field_name] = relative_path
+                    value = name
+                entry["fields"][field_name] = value
+
+            self._write_entry(os.path.join(temp_dir, self.ENTRY_FILE_NAME), entry)
+
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            os.replace(temp_dir, entry_dir)
+            logger.info(f"Stored {stage_name} artifact in stage cache: {fingerprint[:12]}")
+            self.evict()
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def _entries(self) -> list:
+        entries = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+        for stage_name in os.listdir(self.cache_dir):
+            stage_dir = os.path.join(self.cache_dir, stage_name)
+            for fingerprint in os.listdir(stage_dir):
+                entry_dir = os.path.join(stage_dir, fingerprint)
+                entry_path = os.path.join(entry_dir, self.ENTRY_FILE_NAME)
+                if not os.path.exists(entry_path):
+                    continue
+                try:
+                    with open(entry_path) as file:
+                        last_used = json.load(file).get("last_used", 0)
+                except ValueError:
+                    last_used = 0
+                entries.append((last_used, entry_dir, _file_stats(entry_dir)))
+        return entries
+
+    def evict(self) -> int:
+        """Drop entries unused for longer than ``max_age_days``, then least recently used
+        entries until the cache fits in ``max_bytes``. Returns the number of entries removed.
+
+        Entry files are hardlinks, shared between entries and with run
+        directories and the blob store. Only the files no longer linked from
+        outside the cache count towards ``max_bytes``, each once; removing an
+        entry frees a file with its last link in the cache.
+        """
+        try:
+            entries = sorted(self._entries())
+            cutoff = time.time() - self.stage_cache_config.max_age_days * 86400
+            links = Counter((stat.st_dev, stat.st_ino) for _, _, stats in entries for stat in stats)
+            owned = {
+                (stat.st_dev, stat.st_ino): stat.st_size for _, _, stats in entries for stat in stats
+                if stat.st_nlink <= links[(stat.st_dev, stat.st_ino)]
+            }
+            total_bytes = sum(owned.values())
+
+            removed = 0
+            for last_used, entry_dir, stats in entries:
+                if last_used >= cutoff and total_bytes <= self.stage_cache_config.max_bytes:
+                    break
+                shutil.rmtree(entry_dir, ignore_errors=True)
+                for stat in stats:
+                    inode = (stat.st_dev, stat.st_ino)
+                    links[inode] -= 1
+                    if not links[inode]:
+                        total_bytes -= owned.pop(inode, 0)
+                removed += 1
+
+            if removed:
+                logger.info(f"Evicted {removed} stage cache entries ({total_bytes} bytes kept)")
+            return removed
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
@@ -0,0 +1,223 @@
+from networksecurity.components.data_ingestion import DataIngestion
+from networksecurity.components.data_validation import DataValidation
+from networksecurity.components.model_trainer import ModelTrainer
+from networksecurity.constants.train_pipeline import SCHEMA_FILE_PATH, ARTIFACT_DIR
+from networksecurity.entity.config_entity import (
+    TrainingPipelineConfig, DataIngestionConfig, DataValidationConfig, ModelTrainerConfig, StageCacheConfig,
+    RunRegistryConfig, BlobStoreConfig
+)
+from networksecurity.entity.artifact_entity import DataIngestionArtifact, DataValidationArtifact, ModelTrainerArtifact
+from networksecurity.pipelines.blob_store import BlobStore
+from networksecurity.pipelines.executor import PipelineExecutor, Stage
+from networksecurity.pipelines.run_state import PipelineRunState
+from networksecurity.pipelines.run_registry import index_run_quietly
+from networksecurity.pipelines.stage_cache import StageCache
+from networksecurity.utilities.exception import NetworkSecurityException
+from networksecurity.utilities.logger import logger
+from networksecurity.utilities.tracing import start_tracing, stop_tracing, trace_span
+from networksecurity.utilities.utils import compute_file_hash
+from networksecurity.utilities.frame_handle import frame_handles, wait_persisted
+from concurrent.futures import ThreadPoolExecutor
+import os, sys
+
+
+class TrainingPipeline:
+    """Runs the pipeline stages with stage-level memoization and resumable runs.
+
+    Args:
+        resume: Continue the most recent run in its artifact directory, skipping
+            stages that already completed there.
+        use_cache: Reuse artifacts of earlier runs whose stage fingerprint
+            (config, schema hash and input hashes) matches.
+
+    Stages hand their data frames to the next stage in memory while the files
+    are written in the background; a stage is recorded as completed (and
+    stored in the stage cache) once its files are on disk. Its larger files
+    are then moved into the blob store shared by all runs, which keeps one
+    copy of identical payloads.
+    """
+
+    def __init__(self, resume: bool = False, use_cache: bool = True):
+        try:
+            timestamp = PipelineRunState.latest_run_timestamp(ARTIFACT_DIR) if resume else None
+            if resume and timestamp is None:
+                logger.warning("No previous run to resume; starting a new run.")
+            self.training_pipeline_config = TrainingPipelineConfig(timestamp=timestamp)
+            self.resumed = timestamp is not None
+            if timestamp is not None:
+                logger.info(f"Resuming run in {self.training_pipeline_config.artifact_dir}")
+
+            self.run_state = PipelineRunState(self.training_pipeline_config.pipeline_state_file_path)
+            self.stage_cache = StageCache(StageCacheConfig(self.training_pipeline_config)) if use_cache else None
+            blob_store_config = BlobStoreConfig(self.training_pipeline_config.artifact_name)
+            self.blob_store = BlobStore(blob_store_config) if blob_store_config.enabled else None
+            self._schema_hash = compute_file_hash(SCHEMA_FILE_PATH)
+            # One thread, so stages are recorded in the order they finished
+            self._completions = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stage-completion")
+            self._pending_completions = []
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def _run_stage(self, stage_name: str, artifact_cls, config, inputs: dict, run):
+        """Return the stage artifact from the run state, the stage cache, or by calling ``run``."""
+        artifact = self.run_state.completed_artifact(stage_name, artifact_cls)
+        if artifact is not None:
+            logger.info(f"Skipping {stage_name}: already completed in this run.")
+            return artifact
+
+        fingerprint = StageCache.fingerprint(
+            stage_name, config, self.training_pipeline_config.artifact_dir,
+            {"schema": self._schema_hash, **inputs}
+        )
+        if self.stage_cache is not None:
+            with trace_span("cache_lookup", stage=stage_name) as span:
+                artifact = self.stage_cache.get(stage_name, fingerprint, artifact_cls,
+                                                self.training_pipeline_config.artifact_dir)
+                span.set(hit=artifact is not None)
+            if artifact is not None:
+                self.run_state.mark_completed(stage_name, artifact, fingerprint, cached=True)
+                return artifact
+
+        try:
+            artifact = run()
+        except Exception as e:
+            self.run_state.mark_failed(stage_name, e)
+            raise
+
+        if frame_handles(artifact):
+            self._pending_completions.append(
+                self._completions.submit(self._complete_stage, stage_name, fingerprint, artifact)
+            )
+        else:
+            self._complete_stage(stage_name, fingerprint, artifact)
+        return artifact
+
+    def _complete_stage(self, stage_name: str, fingerprint: str, artifact):
+        try:
+            with trace_span("persist_wait", stage=stage_name):
+                wait_persisted(artifact)
+        except Exception as e:
+            self.run_state.mark_failed(stage_name, e)
+            raise
+        if self.blob_store is not None:
+            with trace_span("blob_store_put", stage=stage_name):
+                artifact.blobs = self.blob_store.intern_artifact(artifact)
+        if self.stage_cache is not None:
+            with trace_span("cache_put", stage=stage_name):
+                self.stage_cache.put(stage_name, fingerprint, artifact, self.training_pipeline_config.artifact_dir)
+        self.run_state.mark_completed(stage_name, artifact, fingerprint)
+
+    def wait_for_completions(self):
+        """Block until every stage's files are written and recorded; re-raises the first failure."""
+        pending, self._pending_completions = self._pending_completions, []
+        errors = [future.exception() for future in pending]
+        errors = [error for error in errors if error is not None]
+        if errors:
+            raise errors[0]
+
+    def start_data_ingestion(self) -> DataIngestionArtifact:
+        try:
+            logger.info("\n" + "="*30 + " DATA INGESTION " + "="*30)
+            data_ingestion_config = DataIngestionConfig(training_pipeline_config=self.training_pipeline_config)
+            data_ingestion = DataIngestion(data_ingestion_config=data_ingestion_config)
+            with trace_span("fingerprint_inputs", stage="data_ingestion"):
+                inputs = {"source": data_ingestion.source_fingerprint()}
+            return self._run_stage(
+                "data_ingestion", DataIngestionArtifact, data_ingestion_config, inputs,
+                data_ingestion.initiate_data_ingestion
+            )
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    @staticmethod
+    def _input_hash(file_path: str, digest: str = None):
+        """Content digest of an input recorded by its producer, else the hash of the file.
+
+        The digest is available before a background write of the file has finished.
+        """
+        if digest is not None:
+            return [os.path.splitext(file_path)[1], digest]
+        return compute_file_hash(file_path)
+
+    def start_data_validation(self, data_ingestion_artifact: DataIngestionArtifact) -> DataValidationArtifact:
+        try:
+            logger.info("\n" + "="*30 + " DATA VALIDATION " + "="*30)
+            data_validation_config = DataValidationConfig(training_pipeline_config=self.training_pipeline_config)
+            baseline_path = data_validation_config.baseline_profile_file_path
+            with trace_span("fingerprint_inputs", stage="data_validation"):
+                inputs = {
+                    "train": self._input_hash(data_ingestion_artifact.train_path,
+                                              data_ingestion_artifact.train_digest),
+                    "test": self._input_hash(data_ingestion_artifact.test_path,
+                                             data_ingestion_artifact.test_digest),
+                    "baseline": compute_file_hash(baseline_path) if os.path.exists(baseline_path) else None,
+                }
+
+            def run():
+                data_validation = DataValidation(
+                    data_validation_config=data_validation_config,
+                    data_ingestion_artifact=data_ingestion_artifact
+                )
+                return data_validation.initiate_data_validation()
+
+            return self._run_stage("data_validation", DataValidationArtifact, data_validation_config, inputs, run)
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def start_model_trainer(self, data_validation_artifact: DataValidationArtifact) -> ModelTrainerArtifact:
+        try:
+            logger.info("\n" + "="*30 + " MODEL TRAINER " + "="*30)
+            model_trainer_config = ModelTrainerConfig(training_pipeline_config=self.training_pipeline_config)
+            with trace_span("fingerprint_inputs", stage="model_trainer"):
+                inputs = {
+                    "train": self._input_hash(data_validation_artifact.valid_train_file_path,
+                                              data_validation_artifact.valid_train_digest),
+                    "test": self._input_hash(data_validation_artifact.valid_test_file_path,
+                                             data_validation_artifact.valid_test_digest),
+                    "validation_status": data_validation_artifact.validation_status,
+                    "drift_detected": data_validation_artifact.drift_detected,
+                }
+
+            def run():
+                model_trainer = ModelTrainer(
+                    model_trainer_config=model_trainer_config,
+                    data_validation_artifact=data_validation_artifact
+                )
+                return model_trainer.initiate_model_trainer()
+
+            return self._run_stage("model_trainer", ModelTrainerArtifact, model_trainer_config, inputs, run)
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def _save_trace(self, tracer):
+        """Write the run's trace next to its artifacts and log where the time went."""
+        try:
+            tracer.save(self.training_pipeline_config.trace_file_path, append=self.resumed)
+            for name, count, wall_ms, cpu_ms in tracer.summary()[:10]:
+                logger.info(f"Span {name}: {count}x, {wall_ms:.1f} ms wall, {cpu_ms:.1f} ms CPU")
+        except Exception as e:
+            logger.warning(f"Could not write trace: {e}")
+
+    def run_pipeline(self) -> ModelTrainerArtifact:
+        tracer = start_tracing()
+        try:
+            executor = PipelineExecutor([
+                Stage("data_ingestion", self.start_data_ingestion, output=DataIngestionArtifact),
+                Stage("data_validation", self.start_data_validation,
+                      inputs={"data_ingestion_artifact": DataIngestionArtifact}, output=DataValidationArtifact),
+                Stage("model_trainer", self.start_model_trainer,
+                      inputs={"data_validation_artifact": DataValidationArtifact}, output=ModelTrainerArtifact),
+            ])
+            results = executor.run()
+            self.wait_for_completions()
+            self.run_state.record_timings(executor.timings)
+            return results["model_trainer"]
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+        finally:
+            # Stages that finished before a failure are still recorded, so the run can resume
+            self._completions.shutdown(wait=True)
+            stop_tracing()
+            self._save_trace(tracer)
+            index_run_quietly(self.training_pipeline_config.artifact_dir,
+                              RunRegistryConfig(self.training_pipeline_config.artifact_name))
@@ -0,0 +1,155 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+import asyncio
+import numpy as np
+
+
+class Overloaded(Exception):
+    """The request queue is full; the client should retry later."""
+
+
+class ServingStats:
+    """Request latencies and micro-batch sizes of a running server.
+
+    Latencies go into a ring buffer of the most recent ``latency_samples``
+    requests; batch sizes into power-of-two buckets (1, 2, 3-4, 5-8, ...).
+    """
+
+    def __init__(self, latency_samples: int):
+        self._latencies = np.zeros(latency_samples, dtype=np.float64)
+        self._latency_count = 0
+        self._batch_buckets = np.zeros(64, dtype=np.int64)
+        self.requests = 0
+        self.rejected = 0
+        self.invalid = 0
+        self.failed = 0
+        self.batches = 0
+        self.batched_requests = 0
+
+    def record_latency(self, seconds: float):
+        self._latencies[self._latency_count % len(self._latencies)] = seconds
+        self._latency_count += 1
+
+    def record_batch(self, size: int):
+        self._batch_buckets[(size - 1).bit_length()] += 1
+        self.batches += 1
+        self.batched_requests += size
+
+    def latency_percentiles(self, percentiles=(50, 90, 99, 99.9)) -> dict:
+        samples = self._latencies[:min(self._latency_count, len(self._latencies))]
+        if not len(samples):
+            return {}
+        values = np.percentile(samples, percentiles)
+        return {f"p{p:g}_ms": float(value) * 1000 for p, value in zip(percentiles, values)}
+
+    def batch_size_histogram(self) -> dict:
+        """``{"<low>-<high>": batches}`` over the non-empty buckets."""
+        histogram = {}
+        for bucket in np.flatnonzero(self._batch_buckets):
+            low, high = (1 << (bucket - 1)) + 1 if bucket else 1, 1 << bucket
+            histogram[str(high) if low == high else f"{low}-{high}"] = int(self._batch_buckets[bucket])
+        return histogram
+
+    def snapshot(self) -> dict:
+        served = min(self._latency_count, len(self._latencies))
+        return {
+            "requests": self.requests,
+            "rejected": self.rejected,
+            "invalid": self.invalid,
+            "failed": self.failed,
+            "batches": self.batches,
+            "mean_batch_size": self.batched_requests / self.batches if self.batches else 0.0,
+            "latency_samples": served,
+            "latency": self.latency_percentiles(),
+            "batch_sizes": self.batch_size_histogram(),
+        }
+
+
+class MicroBatcher:
+    """Collects concurrent requests into micro-batches for one vectorized ``predict`` call.
+
+    A batch starts with the first queued request and closes after
+    ``window_s`` or at ``max_batch_size`` requests, whichever comes first.
+    ``predict`` runs on a worker thread so the event loop keeps accepting
+    requests, which queue up for the next batch meanwhile. The queue holds
+    at most ``max_queue`` requests; ``submit`` raises ``Overloaded`` beyond.
+    """
+
+    def __init__(self, predict: Callable, window_s: float, max_batch_size: int, max_queue: int,
+                 stats: ServingStats):
+        self.predict = predict
+        self.window_s = window_s
+        self.max_batch_size = max_batch_size
+        self.stats = stats
+        self._queue = asyncio.Queue(maxsize=max_queue)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="micro-batch")
+        self._task = None
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def start(self):
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(Overloaded("Server is shutting down"))
+        self._executor.shutdown(wait=True)
+
+    def submit(self, vector: list) -> asyncio.Future:
+        """Queue one feature vector; the returned future resolves to its prediction."""
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self._queue.put_nowait((vector, future))
+        except asyncio.QueueFull:
+            raise Overloaded(f"{self._queue.maxsize} requests already queued")
+        return future
+
+    async def _collect(self) -> list:
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.window_s
+        while len(batch) < self.max_batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._collect()
+            futures = [future for _, future in batch]
+            try:
+                features = np.array([vector for vector, _ in batch], dtype=np.int8)
+                predictions = await loop.run_in_executor(self._executor, self.predict, features)
+            except asyncio.CancelledError:
+                for future in futures:
+                    future.cancel()
+                raise
+            except Exception as e:
+                self.stats.failed += len(batch)
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            else:
+                for future, prediction in zip(futures, predictions.tolist()):
+                    if not future.done():
+                        future.set_result(prediction)
+            self.stats.record_batch(len(batch))
@@ -0,0 +1,191 @@
+from networksecurity.components.batch_prediction import BatchPrediction
+from networksecurity.entity.config_entity import PredictionServerConfig
+from networksecurity.constants.train_pipeline import SCHEMA_FILE_PATH
+from networksecurity.serving.micro_batcher import MicroBatcher, Overloaded, ServingStats
+from networksecurity.utilities.schema import get_schema_domains, get_schema_dtypes
+from networksecurity.utilities.utils import read_yaml_file
+from networksecurity.utilities.exception import NetworkSecurityException
+from networksecurity.utilities.logger import logger
+import sys
+import json
+import time
+import asyncio
+import numpy as np
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable"}
+
+
+class PayloadError(ValueError):
+    def __init__(self, errors: list):
+        super().__init__("; ".join(errors))
+        self.errors = errors
+
+
+class PredictionServer:
+    """HTTP/JSON endpoint for single feature vectors, scored in micro-batches.
+
+    ``POST /predict`` takes a JSON object mapping every feature of
+    schema.yaml to its value and answers ``{"prediction": <label>}``. Payloads
+    are checked against the schema's columns, dtypes and domains (400 with
+    the list of problems otherwise). When the batch queue is full the request
+    is refused with 503 and ``Retry-After``. ``GET /stats`` reports latency
+    percentiles, the batch size histogram and the prediction cache;
+    ``GET /health`` answers once the model is loaded.
+
+    Connections are HTTP/1.1 keep-alive; requests on a connection are
+    answered in order.
+    """
+
+    def __init__(self, prediction_server_config: PredictionServerConfig, predictor: BatchPrediction = None):
+        try:
+            self.prediction_server_config = prediction_server_config
+            self.predictor = predictor or BatchPrediction(prediction_server_config.batch_prediction_config)
+            self.features = self.predictor.features
+            schema_config = read_yaml_file(SCHEMA_FILE_PATH)
+            domains = get_schema_domains(schema_config)
+            dtypes = get_schema_dtypes(schema_config)
+            # Allowed values per feature: its domain, else the range of its integer dtype (int8 by default)
+            self._allowed = {}
+            for col in self.features:
+                if col in domains:
+                    self._allowed[col] = frozenset(domains[col])
+                else:
+                    info = np.iinfo(np.dtype(str(dtypes.get(col, "int8")).lower()))
+                    self._allowed[col] = range(int(info.min), int(info.max) + 1)
+            self.stats = ServingStats(prediction_server_config.latency_samples)
+            self.batcher = None
+            self._server = None
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def parse_payload(self, body: bytes) -> list:
+        """The feature vector of a request body in schema order; raises PayloadError."""
+        try:
+            payload = json.loads(body)
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise PayloadError([f"Body is not valid JSON: {e}"])
+        if not isinstance(payload, dict):
+            raise PayloadError(["Body must be a JSON object of feature values"])
+
+        errors = [f"Unknown field: {key}" for key in payload if key not in self._allowed]
+        vector = []
+        for col in self.features:
+            if col not in payload:
+                errors.append(f"Missing feature: {col}")
+                continue
+            value = payload[col]
+            if isinstance(value, bool) or not isinstance(value, int):
+                errors.append(f"{col}: expected an integer, got {value!r}")
+            elif value not in self._allowed[col]:
+                errors.append(f"{col}: {value} is outside the allowed values")
+            vector.append(value)
+        if errors:
+            raise PayloadError(errors)
+        return vector
+
+    def snapshot(self) -> dict:
+        return {
+            **self.stats.snapshot(),
+            "queue_depth": self.batcher.queue_depth if self.batcher else 0,
+            "batch_window_ms": self.prediction_server_config.batch_window_ms,
+            "max_batch_size": self.prediction_server_config.max_batch_size,
+            "prediction_cache": self.predictor.stats(),
+        }
+
+    async def _predict(self, body: bytes):
+        start = time.perf_counter()
+        self.stats.requests += 1
+        try:
+            vector = self.parse_payload(body)
+        except PayloadError as e:
+            self.stats.invalid += 1
+            return 400, {"errors": e.errors}, {}
+        try:
+            prediction = await self.batcher.submit(vector)
+        except Overloaded as e:
+            self.stats.rejected += 1
+            return 503, {"error": str(e)}, {"Retry-After": "1"}
+        except Exception as e:
+            logger.error(f"Prediction failed: {e}")
+            return 500, {"error": "Prediction failed"}, {}
+        self.stats.record_latency(time.perf_counter() - start)
+        return 200, {"prediction": prediction}, {}
+
+    async def _route(self, method: str, path: str, body: bytes):
+        if path == "/predict":
+            if method != "POST":
+                return 405, {"error": "Use POST"}, {"Allow": "POST"}
+            return await self._predict(body)
+        if path in ("/stats", "/health"):
+            if method != "GET":
+                return 405, {"error": "Use GET"}, {"Allow": "GET"}
+            return 200, self.snapshot() if path == "/stats" else {"status": "ok"}, {}
+        return 404, {"error": f"No route for {path}"}, {}
+
+    @staticmethod
+    def _response(status: int, content: dict, headers: dict, keep_alive: bool) -> bytes:
+        body = json.dumps(content).encode()
+        lines = [f"HTTP/1.1 {status} {_REASONS.get(status, '')}", "Content-Type: application/json",
+                 f"Content-Length: {len(body)}", f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+        lines += [f"{name}: {value}" for name, value in headers.items()]
+        return ("\r\n".join(lines) + "\r\n\r\n").encode() + body
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    request_line = await reader.readuntil(b"\r\n")
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    return
+                method, path, version = request_line.decode("latin-1").split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readuntil(b"\r\n")
+                    if line == b"\r\n":
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = headers.get("connection", "").lower() != "close" and "1.1" in version
+                length = int(headers.get("content-length", 0))
+                if length > self.prediction_server_config.max_body_bytes:
+                    writer.write(self._response(413, {"error": "Body too large"}, {}, keep_alive=False))
+                    await writer.drain()
+                    return
+                body = await reader.readexactly(length) if length else b""
+
+                status, content, extra_headers = await self._route(method, path.split("?", 1)[0], body)
+                writer.write(self._response(status, content, extra_headers, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    return
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError, ValueError) as e:
+            logger.warning(f"Dropping malformed connection: {e}")
+        finally:
+            writer.close()
+
+    async def serve(self, ready: asyncio.Event = None):
+        config = self.prediction_server_config
+        self.batcher = MicroBatcher(self.predictor.predict, config.batch_window_ms / 1000, config.max_batch_size,
+                                    config.max_queue, self.stats)
+        self.batcher.start()
+        self._server = await asyncio.start_server(self.handle_connection, config.host, config.port)
+        logger.info(f"Serving predictions on http://{config.host}:{config.port} "
+                    f"(window {config.batch_window_ms} ms, batches up to {config.max_batch_size})")
+        if ready is not None:
+            ready.set()
+        try:
+            async with self._server:
+                await self._server.serve_forever()
+        finally:
+            await self.batcher.stop()
+            logger.info(f"Prediction server stopped: {json.dumps(self.stats.snapshot())}")
+
+    def run(self):
+        try:
+            asyncio.run(self.serve())
+        except KeyboardInterrupt:
+            pass
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
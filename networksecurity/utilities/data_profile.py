@@ -0,0 +1,139 @@
+from networksecurity.utilities.exception import NetworkSecurityException
+from networksecurity.utilities.schema import get_domain_range, get_schema_domains
+from networksecurity.utilities.drift import value_histograms, compare_histograms, data_value_range
+from networksecurity.utilities.utils import read_yaml_file, write_yaml_file
+from dataclasses import dataclass
+import os, sys
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class DataProfile:
+    """Per-column summary of a dataset, enough to run drift checks without the data.
+
+    ``histograms[i, j]`` counts the value ``low + j`` in ``columns[i]``; the last
+    bin counts missing values and values outside ``[low, high]``. Profiles of
+    separate chunks with the same columns and value range can be merged.
+    """
+    columns: list
+    low: int
+    high: int
+    row_count: int
+    histograms: np.ndarray
+    null_counts: np.ndarray
+    domain_violations: np.ndarray
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame, schema_config: dict = None, columns: list = None) -> "DataProfile":
+        try:
+            schema_config = schema_config or {}
+            columns = list(columns or df.columns)
+            low, high = get_domain_range(schema_config) or data_value_range(df[columns])
+            histograms = value_histograms(df, columns, low, high)
+            null_counts = df[columns].isna().sum().to_numpy(dtype=np.int64)
+            return cls._from_histograms(columns, low, high, len(df), histograms, null_counts, schema_config)
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    @classmethod
+    def from_dedup_index(cls, index, schema_config: dict = None) -> "DataProfile":
+        """Profile of the rows of a ``DedupIndex``, computed from its distinct rows only."""
+        try:
+            codec = index.codec
+            histograms = index.value_histograms()
+            null_counts = np.zeros(len(codec.columns), dtype=np.int64)
+            return cls._from_histograms(codec.columns, codec.low, codec.high, index.rows, histograms, null_counts,
+                                        schema_config or {})
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    @classmethod
+    def _from_histograms(cls, columns: list, low: int, high: int, row_count: int, histograms: np.ndarray,
+                         null_counts: np.ndarray, schema_config: dict) -> "DataProfile":
+        # Out-of-range values sit in the last bin together with nulls
+        domain_violations = histograms[:, -1] - null_counts
+        domains = get_schema_domains(schema_config)
+        for i, col in enumerate(columns):
+            if col in domains:
+                outside = [j for j, value in enumerate(range(low, high + 1)) if value not in domains[col]]
+                domain_violations[i] += histograms[i, outside].sum()
+
+        return cls(
+            columns=list(columns),
+            low=int(low),
+            high=int(high),
+            row_count=int(row_count),
+            histograms=histograms,
+            null_counts=null_counts,
+            domain_violations=domain_violations,
+        )
+
+    def merge(self, other: "DataProfile") -> "DataProfile":
+        """Return the profile of the concatenation of both underlying datasets."""
+        if self.columns != other.columns or (self.low, self.high) != (other.low, other.high):
+            raise ValueError("Only profiles with the same columns and value range can be merged")
+        return DataProfile(
+            columns=list(self.columns),
+            low=self.low,
+            high=self.high,
+            row_count=self.row_count + other.row_count,
+            histograms=self.histograms + other.histograms,
+            null_counts=self.null_counts + other.null_counts,
+            domain_violations=self.domain_violations + other.domain_violations,
+        )
+
+    @staticmethod
+    def merge_all(profiles: list) -> "DataProfile":
+        merged = profiles[0]
+        for profile in profiles[1:]:
+            merged = merged.merge(profile)
+        return merged
+
+    def compare(self, current: "DataProfile", threshold: float = 0.05):
+        """Drift of ``current`` against this profile, as ``(is_drift, drift_report)``."""
+        if self.columns != current.columns or (self.low, self.high) != (current.low, current.high):
+            raise ValueError("Profiles describe different columns or value ranges")
+        return compare_histograms(self.columns, self.histograms, current.histograms, threshold)
+
+    def to_dict(self) -> dict:
+        values = list(range(self.low, self.high + 1))
+        return {
+            "row_count": int(self.row_count),
+            "value_range": [self.low, self.high],
+            "columns": {
+                col: {
+                    "histogram": dict(zip(values, self.histograms[i, :-1].tolist())),
+                    "other": int(self.histograms[i, -1]),
+                    "null_count": int(self.null_counts[i]),
+                    "domain_violations": int(self.domain_violations[i]),
+                }
+                for i, col in enumerate(self.columns)
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, content: dict) -> "DataProfile":
+        low, high = content["value_range"]
+        columns = list(content["columns"])
+        stats = [content["columns"][col] for col in columns]
+        return cls(
+            columns=columns,
+            low=low,
+            high=high,
+            row_count=content["row_count"],
+            histograms=np.array(
+                [[entry["histogram"][value] for value in range(low, high + 1)] + [entry["other"]] for entry in stats],
+                dtype=np.int64,
+            ).reshape(len(columns), high - low + 2),
+            null_counts=np.array([entry["null_count"] for entry in stats], dtype=np.int64),
+            domain_violations=np.array([entry["domain_violations"] for entry in stats], dtype=np.int64),
+        )
+
+    def save(self, file_path: str):
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        write_yaml_file(file_path=file_path, content=self.to_dict())
+
+    @classmethod
+    def load(cls, file_path: str) -> "DataProfile":
+        return cls.from_dict(read_yaml_file(file_path))
@@ -0,0 +1,241 @@
+from networksecurity.utilities.exception import NetworkSecurityException
+import sys
+import numpy as np
+import pandas as pd
+
+# Upper bound on the number of cells materialized per row chunk
+CHUNK_CELLS = 1 << 24
+PSI_EPSILON = 1e-6
+
+
+def value_histograms(df: pd.DataFrame, columns: list, low: int, high: int) -> np.ndarray:
+    """Count the values of every column in one vectorized pass over the data.
+
+    Returns an int64 array of shape ``(len(columns), high - low + 2)``: bin ``i``
+    counts the value ``low + i`` and the last bin counts missing values and
+    values outside ``[low, high]``.
+
+    Rows are processed in chunks of the (rows x columns) value matrix. For the
+    small domains in this schema, one ``count_nonzero(matrix == value, axis=0)``
+    per domain value is several times faster than an offset-and-bincount over
+    the same matrix, because it stays on the narrow int8 data instead of
+    widening every cell to an index.
+    """
+    try:
+        values = np.arange(low, high + 1)
+        positions = [df.columns.get_loc(col) for col in columns]
+        plain = all(isinstance(df.dtypes.iloc[i], np.dtype) for i in positions)
+        counts = np.zeros((len(columns), len(values) + 1), dtype=np.int64)
+
+        chunk_rows = max(1, CHUNK_CELLS // max(1, len(columns)))
+        for start in range(0, len(df), chunk_rows):
+            block = df.iloc[start:start + chunk_rows, positions]
+            # Nullable (Int8) columns go through float so that <NA> never equals a domain value
+            matrix = block.to_numpy() if plain else block.to_numpy(dtype=np.float64, na_value=np.nan)
+            for i, value in enumerate(values):
+                counts[:, i] += np.count_nonzero(matrix == value, axis=0)
+
+        counts[:, -1] = len(df) - counts[:, :-1].sum(axis=1)
+        return counts
+    except Exception as e:
+        raise NetworkSecurityException(e, sys)
+
+
+def chi_square_test(base_counts: np.ndarray, current_counts: np.ndarray):
+    """Chi-square test of homogeneity for every row of two histogram matrices.
+
+    Returns ``(statistic, p_value)`` arrays with one entry per column. Bins that
+    are empty in both samples are ignored; a column with a single populated bin
+    gets a p-value of 1.
+    """
+    from scipy.stats import chi2  # imported on first use: scipy.stats takes ~1 s to import
+
+    base_counts = base_counts.astype(np.float64)
+    current_counts = current_counts.astype(np.float64)
+    totals = base_counts + current_counts
+    base_n = base_counts.sum(axis=1, keepdims=True)
+    current_n = current_counts.sum(axis=1, keepdims=True)
+    grand_n = base_n + current_n
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        base_expected = base_n * totals / grand_n
+        current_expected = current_n * totals / grand_n
+        cells = (
+            (base_counts - base_expected) ** 2 / base_expected
+            + (current_counts - current_expected) ** 2 / current_expected
+        )
+    statistic = np.where(totals > 0, cells, 0.0).sum(axis=1)
+
+    dof = (totals > 0).sum(axis=1) - 1
+    p_value = np.ones_like(statistic)
+    testable = (dof > 0) & (base_n[:, 0] > 0) & (current_n[:, 0] > 0)
+    p_value[testable] = chi2.sf(statistic[testable], dof[testable])
+    return statistic, p_value
+
+
+def _proportions(counts: np.ndarray) -> np.ndarray:
+    totals = counts.sum(axis=1, keepdims=True).astype(np.float64)
+    return np.divide(counts, totals, out=np.zeros(counts.shape, dtype=np.float64), where=totals > 0)
+
+
+def population_stability_index(base_counts: np.ndarray, current_counts: np.ndarray) -> np.ndarray:
+    """PSI per column; empty bins are smoothed with ``PSI_EPSILON``."""
+    base = np.clip(_proportions(base_counts), PSI_EPSILON, None)
+    current = np.clip(_proportions(current_counts), PSI_EPSILON, None)
+    return ((current - base) * np.log(current / base)).sum(axis=1)
+
+
+def jensen_shannon_divergence(base_counts: np.ndarray, current_counts: np.ndarray) -> np.ndarray:
+    """Jensen-Shannon divergence per column, in bits (bounded by [0, 1])."""
+    base = _proportions(base_counts)
+    current = _proportions(current_counts)
+    mixture = (base + current) / 2
+
+    def _kl(p, q):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            terms = p * np.log2(p / q)
+        return np.where(p > 0, terms, 0.0).sum(axis=1)
+
+    return np.clip(0.5 * _kl(base, mixture) + 0.5 * _kl(current, mixture), 0.0, 1.0)
+
+
+def compare_histograms(columns: list, base_counts: np.ndarray, current_counts: np.ndarray,
+                       threshold: float = 0.05):
+    """Build ``(is_drift, drift_report)`` from two histogram matrices.
+
+    Each report entry keeps the ``p_val``/``drift_detected`` keys used by the
+    drift report YAML (p-value of the chi-square test) and adds the chi-square
+    statistic, PSI and Jensen-Shannon divergence.
+
+    ``threshold`` is the family-wise significance level: a feature is flagged
+    when its p-value is below ``threshold / len(columns)`` (Bonferroni), so that
+    testing 30 features of an undrifted dataset does not flag one by chance.
+    """
+    feature_threshold = threshold / max(1, len(columns))
+    statistic, p_value = chi_square_test(base_counts, current_counts)
+    psi = population_stability_index(base_counts, current_counts)
+    js = jensen_shannon_divergence(base_counts, current_counts)
+
+    drift_report = {}
+    for i, col in enumerate(columns):
+        drift_report[col] = {
+            "p_val": float(p_value[i]),
+            "drift_detected": bool(p_value[i] < feature_threshold),
+            "chi2": float(statistic[i]),
+            "psi": float(psi[i]),
+            "js_divergence": float(js[i]),
+        }
+    is_drift = any(stats["drift_detected"] for stats in drift_report.values())
+    return is_drift, drift_report
+
+
+def data_value_range(*frames: pd.DataFrame) -> tuple:
+    """Smallest and largest value over all given frames (used when no schema range is known)."""
+    lows = [frame.min(numeric_only=True).min() for frame in frames if not frame.empty]
+    highs = [frame.max(numeric_only=True).max() for frame in frames if not frame.empty]
+    if not lows or pd.isna(min(lows)):
+        return 0, 0
+    return int(min(lows)), int(max(highs))
+
+
+def detect_drift(base_df: pd.DataFrame, current_df: pd.DataFrame, threshold: float = 0.05,
+                 value_range: tuple = None):
+    """Compare every column of ``base_df`` against ``current_df`` in one pass per frame.
+
+    Args:
+        value_range: ``(low, high)`` of the expected values, e.g. from the schema
+            domains. Derived from the data when omitted.
+    """
+    try:
+        columns = list(base_df.columns)
+        low, high = value_range or data_value_range(base_df, current_df[columns])
+        base_counts = value_histograms(base_df, columns, low, high)
+        current_counts = value_histograms(current_df, columns, low, high)
+        return compare_histograms(columns, base_counts, current_counts, threshold)
+    except Exception as e:
+        raise NetworkSecurityException(e, sys)
+
+
+class WindowedHistograms:
+    """Per-column value histograms over a sliding (or tumbling) window of a record stream.
+
+    The window spans ``window`` records and advances by ``slide`` records
+    (``slide == window`` gives tumbling windows). Records are counted into
+    the current pane of ``slide`` records; when a pane completes it is added
+    to the running window total and the pane that falls out of the window is
+    subtracted. Every record costs one increment per column, a pane boundary
+    two histogram additions, and memory stays at the ring of ``window / slide``
+    panes however long the stream runs. Bins follow ``value_histograms``.
+    """
+
+    def __init__(self, n_columns: int, low: int, high: int, window: int, slide: int = None):
+        slide = slide or window
+        if window <= 0 or slide <= 0 or window % slide:
+            raise ValueError(f"window ({window}) must be a positive multiple of slide ({slide})")
+        self.low, self.high = int(low), int(high)
+        self.window, self.slide = int(window), int(slide)
+        self.bins = self.high - self.low + 2
+        shape = (n_columns, self.bins)
+        self._panes = np.zeros((window // slide,) + shape, dtype=np.int64)
+        self._pane = np.zeros(shape, dtype=np.int64)
+        self._total = np.zeros(shape, dtype=np.int64)
+        self._pane_records = 0
+        self._completed_panes = 0
+        self._column_offsets = np.arange(n_columns) * self.bins
+        self.records = 0
+
+    def codes(self, values: np.ndarray) -> np.ndarray:
+        """Bin index of every value (float, NaN for missing); the last bin takes nulls and out-of-range values."""
+        with np.errstate(invalid="ignore"):
+            inside = (values >= self.low) & (values <= self.high) & (values == np.round(values))
+        return np.where(inside, values - self.low, self.bins - 1).astype(np.intp)
+
+    @property
+    def window_full(self) -> bool:
+        return self._completed_panes >= len(self._panes)
+
+    def _close_pane(self):
+        slot = self._completed_panes % len(self._panes)
+        self._total -= self._panes[slot]
+        self._panes[slot] = self._pane
+        self._total += self._pane
+        self._pane[...] = 0
+        self._pane_records = 0
+        self._completed_panes += 1
+
+    def add_record(self, codes: np.ndarray) -> bool:
+        """Count one record given the bin codes of its columns; True when this closed a full window."""
+        self._pane.flat[self._column_offsets + codes] += 1
+        self._pane_records += 1
+        self.records += 1
+        if self._pane_records < self.slide:
+            return False
+        self._close_pane()
+        return self.window_full
+
+    def add_records(self, codes: np.ndarray):
+        """Count a ``(records, columns)`` block of bin codes; yields once per full window it closes.
+
+        Use the windows (``window_counts``) as they are yielded: they advance with the block.
+        """
+        start = 0
+        while start < len(codes):
+            take = min(self.slide - self._pane_records, len(codes) - start)
+            block = codes[start:start + take]
+            self._pane += np.bincount((block + self._column_offsets).ravel(),
+                                      minlength=self._pane.size).reshape(self._pane.shape)
+            self._pane_records += take
+            self.records += take
+            start += take
+            if self._pane_records == self.slide:
+                self._close_pane()
+                if self.window_full:
+                    yield self.window_counts()
+
+    def window_counts(self) -> np.ndarray:
+        """Histograms of the records in the last full window (a copy)."""
+        return self._total.copy()
+
+    @property
+    def nbytes(self) -> int:
+        return self._panes.nbytes + self._pane.nbytes + self._total.nbytes
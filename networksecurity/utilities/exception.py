@@ -3,12 +3,26 @@ import sys
 
 class NetworkSecurityException(Exception):
     def __init__(self, message, error_detail: sys, is_critical: bool = False):
-        _, _, exc_tb = error_detail.exc_info()
-        self.lineno = exc_tb.tb_lineno
-        self.filename = exc_tb.tb_frame.f_code.co_filename
+        if isinstance(message, NetworkSecurityException):
+            # Re-raised by an outer layer: keep the original location and don't log again
+            self.lineno = message.lineno
+            self.filename = message.filename
+            self.error_message = message.error_message
+            super().__init__(*message.args)
+            return
+
+        _, handled, exc_tb = error_detail.exc_info()
+        if exc_tb is not None:
+            self.lineno = exc_tb.tb_lineno
+            self.filename = exc_tb.tb_frame.f_code.co_filename
+        else:
+            self.lineno, self.filename = None, None
         self.error_message = f"Error occurred in script: {self.filename} at line: {self.lineno} error message: {message}"
 
-        if is_critical:
+        if isinstance(handled, NetworkSecurityException):
+            # Wrapping an error that was logged where it was first raised
+            pass
+        elif is_critical:
             logger.critical(self.error_message)
         else:
             logger.error(self.error_message)
@@ -16,4 +30,4 @@ class NetworkSecurityException(Exception):
         super().__init__(message)
 
     def __str__(self):
-        return self.args[0]
\ No newline at end of file
+        return str(self.args[0])
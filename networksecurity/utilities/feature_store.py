@@ -0,0 +1,535 @@
+from networksecurity.utilities.schema import read_csv_with_schema, apply_schema_dtypes, get_schema_dtypes, NA_VALUES
+from networksecurity.utilities.logger import logger
+from networksecurity.utilities.utils import atomic_output
+import os
+import json
+import itertools
+import shutil
+from collections import deque
+from datetime import datetime, timezone
+import numpy as np
+import pandas as pd
+
+
+class FeatureStoreBackend:
+    """Reads and writes a DataFrame in one on-disk format."""
+    name = None
+    extension = None
+
+    def __init__(self, schema_config: dict = None):
+        self._schema_config = schema_config or {}
+
+    def write(self, df: pd.DataFrame, file_path: str):
+        raise NotImplementedError
+
+    def read(self, file_path: str, columns: list = None) -> pd.DataFrame:
+        raise NotImplementedError
+
+    def iter_chunks(self, file_path: str, chunk_rows: int, columns: list = None):
+        """Yield the artifact as DataFrames of at most ``chunk_rows`` rows."""
+        df = self.read(file_path, columns=columns)
+        for start in range(0, len(df), chunk_rows):
+            yield df.iloc[start:start + chunk_rows].reset_index(drop=True)
+
+    def open_writer(self, file_path: str, columns: list = None) -> "FeatureStoreWriter":
+        """Writer that builds the artifact from successive chunks.
+
+        ``columns`` describes the output if no chunk is ever written.
+        """
+        raise NotImplementedError
+
+    def empty_frame(self, columns: list) -> pd.DataFrame:
+        dtypes = get_schema_dtypes(self._schema_config)
+        return pd.DataFrame({col: pd.Series(dtype=dtypes.get(col, "float64")) for col in columns})
+
+    def size_on_disk(self, file_path: str) -> int:
+        """Total bytes used by ``file_path`` (a file, or a directory of files)."""
+        if os.path.isdir(file_path):
+            return sum(
+                os.path.getsize(os.path.join(root, name))
+                for root, _, names in os.walk(file_path) for name in names
+            )
+        return os.path.getsize(file_path)
+
+
+class FeatureStoreWriter:
+    """Writes one artifact chunk by chunk; use as a context manager."""
+
+    def __init__(self, backend: FeatureStoreBackend, file_path: str, columns: list = None):
+        self.backend = backend
+        self.file_path = file_path
+        self.columns = columns
+        self.rows = 0
+
+    def write(self, df: pd.DataFrame):
+        if df.empty:
+            return
+        self._write(df)
+        self.rows += len(df)
+
+    def _write(self, df: pd.DataFrame):
+        raise NotImplementedError
+
+    def _close(self):
+        pass
+
+    def close(self):
+        if self.rows:
+            self._close()
+        else:
+            self.backend.write(self.backend.empty_frame(self.columns or []), self.file_path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class _CsvWriter(FeatureStoreWriter):
+    """Appends to a temporary file that replaces ``file_path`` on close."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._temp_path = f"{self.file_path}.tmp"
+
+    def _write(self, df: pd.DataFrame):
+        df.to_csv(self._temp_path, mode="a" if self.rows else "w", header=not self.rows, index=False)
+
+    def _close(self):
+        os.replace(self._temp_path, self.file_path)
+
+
+def _widen_type(current, new):
+    """Arrow type that holds the values of both ``current`` and ``new``: the wider number, else text."""
+    import pyarrow as pa
+
+    if current.equals(new) or pa.types.is_null(new):
+        return current
+    if pa.types.is_null(current):
+        return new
+    numeric = (pa.types.is_integer, pa.types.is_floating)
+    if any(check(current) for check in numeric) and any(check(new) for check in numeric):
+        return pa.from_numpy_dtype(np.promote_types(current.to_pandas_dtype(), new.to_pandas_dtype()))
+    return pa.large_string()
+
+
+class _ParquetWriter(FeatureStoreWriter):
+    """Writes row groups to a temporary file that replaces ``file_path`` on close.
+
+    The first chunk fixes the schema. A later chunk with values the schema
+    cannot hold (e.g. text or 300 in an int8 column, which ingestion leaves
+    for validation to quarantine) widens it: the row groups written so far
+    are rewritten with the wider types.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._writer = None
+        self._temp_path = f"{self.file_path}.tmp"
+
+    @staticmethod
+    def _to_table(df: pd.DataFrame, schema=None):
+        import pyarrow as pa
+
+        if schema is not None:
+            return pa.Table.from_pandas(df, schema=schema, preserve_index=False)
+        try:
+            return pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # Object columns mixing numbers and text are stored as text
+            objects = {col: df[col].astype("string") for col in df.columns if df[col].dtype == object}
+            return pa.Table.from_pandas(df.assign(**objects), preserve_index=False)
+
+    def _widened_schema(self, table):
+        import pyarrow as pa
+
+        current = self._writer.schema
+        if current.names != table.schema.names:
+            raise ValueError(f"Chunk columns {table.schema.names} do not match the file's {current.names}")
+        widened = {name: _widen_type(current.field(name).type, table.schema.field(name).type) for name in current.names}
+
+        # A widened column takes its pandas metadata from the chunk, so it reads back with the new type
+        metadata = dict(current.metadata or {})
+        if b"pandas" in metadata and b"pandas" in (table.schema.metadata or {}):
+            pandas_metadata = json.loads(metadata[b"pandas"])
+            chunk_entries = {entry["name"]: entry for entry in json.loads(table.schema.metadata[b"pandas"])["columns"]}
+            for entry in pandas_metadata["columns"]:
+                name = entry["name"]
+                if name not in widened or widened[name].equals(current.field(name).type):
+                    continue
+                entry.update(chunk_entries[name])
+                if not widened[name].equals(table.schema.field(name).type):
+                    entry["pandas_type"] = entry["numpy_type"] = widened[name].to_pandas_dtype().__name__
+            metadata[b"pandas"] = json.dumps(pandas_metadata).encode()
+        return pa.schema([current.field(name).with_type(widened[name]) for name in current.names], metadata=metadata)
+
+    def _rewrite(self, schema):
+        """Copy the row groups written so far to a new temporary file with ``schema``, and continue there."""
+        import pyarrow.parquet as pq
+
+        self._writer.close()
+        rewrite_path = f"{self.file_path}.widen.tmp" if self._temp_path == f"{self.file_path}.tmp" \
+            else f"{self.file_path}.tmp"
+        writer = pq.ParquetWriter(rewrite_path, schema)
+        parquet_file = pq.ParquetFile(self._temp_path)
+        for i in range(parquet_file.num_row_groups):
+            writer.write_table(parquet_file.read_row_group(i).cast(schema))
+        parquet_file.close()
+        os.remove(self._temp_path)
+        self._writer, self._temp_path = writer, rewrite_path
+
+    def _write(self, df: pd.DataFrame):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        if self._writer is None:
+            table = self._to_table(df)
+            self._writer = pq.ParquetWriter(self._temp_path, table.schema)
+        else:
+            try:
+                # Later chunks take the file's schema (and pandas metadata)
+                table = self._to_table(df, schema=self._writer.schema)
+            except (pa.ArrowInvalid, pa.ArrowTypeError, OverflowError):
+                table = self._to_table(df)
+                schema = self._widened_schema(table)
+                if not schema.equals(self._writer.schema):
+                    logger.warning(f"Widening the schema of {self.file_path} for values that do not fit it")
+                    self._rewrite(schema)
+                table = table.cast(schema)
+        self._writer.write_table(table)
+
+    def _close(self):
+        self._writer.close()
+        os.replace(self._temp_path, self.file_path)
+
+
+class _NumpyWriter(FeatureStoreWriter):
+    """Appends raw column bytes to part files, then prefixes each with its .npy header."""
+
+    def _write(self, df: pd.DataFrame):
+        if not self.rows:
+            if os.path.isdir(self.file_path):
+                shutil.rmtree(self.file_path)
+            os.makedirs(self.file_path)
+            self._columns = [{"name": str(col), "dtype": str(df[col].dtype), "nullable": False,
+                              "numpy_dtype": None} for col in df.columns]
+
+        for i, (col, entry) in enumerate(zip(df.columns, self._columns)):
+            series = df[col]
+            if isinstance(series.dtype, pd.api.extensions.ExtensionDtype):
+                entry["nullable"], entry["dtype"] = True, str(series.dtype)
+                values = series.to_numpy(dtype=series.dtype.numpy_dtype, na_value=0)
+            else:
+                values = series.to_numpy()
+            if values.dtype == object:
+                raise ValueError(f"Column '{col}' has object dtype; the numpy feature store holds numeric data only")
+            entry["numpy_dtype"] = entry["numpy_dtype"] or values.dtype.str
+            with open(os.path.join(self.file_path, f"{i}.npy.part"), "ab") as file:
+                file.write(np.ascontiguousarray(values, dtype=entry["numpy_dtype"]).tobytes())
+            with open(os.path.join(self.file_path, f"{i}.mask.npy.part"), "ab") as file:
+                file.write(series.isna().to_numpy().tobytes())
+
+    def _finish_array(self, part_path: str, npy_path: str, dtype: str):
+        with open(npy_path, "wb") as out, open(part_path, "rb") as part:
+            header = {"descr": dtype, "fortran_order": False, "shape": (self.rows,)}
+            np.lib.format.write_array_header_1_0(out, header)
+            shutil.copyfileobj(part, out)
+        os.remove(part_path)
+
+    def _close(self):
+        for i, entry in enumerate(self._columns):
+            self._finish_array(os.path.join(self.file_path, f"{i}.npy.part"),
+                               os.path.join(self.file_path, f"{i}.npy"), entry.pop("numpy_dtype"))
+            mask_part = os.path.join(self.file_path, f"{i}.mask.npy.part")
+            if entry["nullable"]:
+                self._finish_array(mask_part, os.path.join(self.file_path, f"{i}.mask.npy"), "|b1")
+            else:
+                os.remove(mask_part)
+
+        manifest = {"rows": self.rows, "columns": self._columns}
+        with open(os.path.join(self.file_path, NumpyFeatureStore.MANIFEST_FILE_NAME), "w") as file:
+            json.dump(manifest, file)
+
+
+class CsvFeatureStore(FeatureStoreBackend):
+    """Plain CSV, kept for compatibility with existing artifacts and tools."""
+    name = "csv"
+    extension = ".csv"
+
+    def write(self, df: pd.DataFrame, file_path: str):
+        with atomic_output(file_path) as temp_path:
+            df.to_csv(temp_path, index=False)
+
+    def read(self, file_path: str, columns: list = None) -> pd.DataFrame:
+        df = read_csv_with_schema(file_path, self._schema_config, usecols=columns)
+        return df[columns] if columns else df
+
+    def iter_chunks(self, file_path: str, chunk_rows: int, columns: list = None):
+        for chunk in pd.read_csv(file_path, na_values=NA_VALUES, chunksize=chunk_rows, usecols=columns):
+            chunk = apply_schema_dtypes(chunk, self._schema_config)
+            yield chunk[columns] if columns else chunk
+
+    def open_writer(self, file_path: str, columns: list = None) -> FeatureStoreWriter:
+        return _CsvWriter(self, file_path, columns)
+
+
+class ParquetFeatureStore(FeatureStoreBackend):
+    """Columnar Parquet via pyarrow; nullable dtypes round-trip through the pandas metadata."""
+    name = "parquet"
+    extension = ".parquet"
+
+    def write(self, df: pd.DataFrame, file_path: str):
+        with atomic_output(file_path) as temp_path:
+            df.to_parquet(temp_path, engine="pyarrow", index=False)
+
+    def read(self, file_path: str, columns: list = None) -> pd.DataFrame:
+        return pd.read_parquet(file_path, engine="pyarrow", columns=columns)
+
+    def iter_chunks(self, file_path: str, chunk_rows: int, columns: list = None):
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(file_path)
+        for batch in parquet_file.iter_batches(batch_size=chunk_rows, columns=columns):
+            yield batch.to_pandas()
+
+    def open_writer(self, file_path: str, columns: list = None) -> FeatureStoreWriter:
+        return _ParquetWriter(self, file_path, columns)
+
+
+class NumpyFeatureStore(FeatureStoreBackend):
+    """One raw ``.npy`` file per column, memory-mappable.
+
+    Layout of the store directory::
+
+        columns.json    column names, dtypes and row count
+        <i>.npy         values of the i-th column
+        <i>.mask.npy    missing-value mask, only for nullable columns
+    """
+    name = "numpy"
+    extension = "_npy"
+    MANIFEST_FILE_NAME = "columns.json"
+
+    def write(self, df: pd.DataFrame, file_path: str):
+        if os.path.isdir(file_path):
+            shutil.rmtree(file_path)
+        os.makedirs(file_path)
+
+        manifest = {"rows": len(df), "columns": []}
+        for i, col in enumerate(df.columns):
+            series = df[col]
+            nullable = isinstance(series.dtype, pd.api.extensions.ExtensionDtype)
+            if nullable:
+                values = series.to_numpy(dtype=series.dtype.numpy_dtype, na_value=0)
+                np.save(os.path.join(file_path, f"{i}.mask.npy"), series.isna().to_numpy())
+            else:
+                values = series.to_numpy()
+            if values.dtype == object:
+                raise ValueError(f"Column '{col}' has object dtype; the numpy feature store holds numeric data only")
+
+            np.save(os.path.join(file_path, f"{i}.npy"), values)
+            manifest["columns"].append({"name": str(col), "dtype": str(series.dtype), "nullable": nullable})
+
+        with open(os.path.join(file_path, self.MANIFEST_FILE_NAME), "w") as file:
+            json.dump(manifest, file)
+
+    def _manifest(self, file_path: str) -> dict:
+        with open(os.path.join(file_path, self.MANIFEST_FILE_NAME)) as file:
+            return json.load(file)
+
+    def read_arrays(self, file_path: str, columns: list = None, mmap_mode: str = "r") -> dict:
+        """Return ``{column: (values, mask)}`` with memory-mapped arrays and no copies.
+
+        ``mask`` is None for columns stored without missing values.
+        """
+        manifest = self._manifest(file_path)
+        index = {entry["name"]: (i, entry) for i, entry in enumerate(manifest["columns"])}
+        columns = columns or [entry["name"] for entry in manifest["columns"]]
+
+        arrays = {}
+        for col in columns:
+            i, entry = index[col]
+            values = np.load(os.path.join(file_path, f"{i}.npy"), mmap_mode=mmap_mode)
+            mask = None
+            if entry["nullable"]:
+                mask = np.load(os.path.join(file_path, f"{i}.mask.npy"), mmap_mode=mmap_mode)
+            arrays[col] = (values, mask)
+        return arrays
+
+    def read(self, file_path: str, columns: list = None) -> pd.DataFrame:
+        dtypes = {entry["name"]: entry["dtype"] for entry in self._manifest(file_path)["columns"]}
+        data = {}
+        for col, (values, mask) in self.read_arrays(file_path, columns, mmap_mode=None).items():
+            if mask is not None:
+                # Masked extension arrays (Int8, Float64, ...) take (values, mask) as-is
+                values = pd.api.types.pandas_dtype(dtypes[col]).construct_array_type()(values, mask)
+            data[col] = values
+        return pd.DataFrame(data, copy=False)
+
+    def iter_chunks(self, file_path: str, chunk_rows: int, columns: list = None):
+        manifest = self._manifest(file_path)
+        dtypes = {entry["name"]: entry["dtype"] for entry in manifest["columns"]}
+        arrays = self.read_arrays(file_path, columns)
+        for start in range(0, manifest["rows"], chunk_rows):
+            data = {}
+            for col, (values, mask) in arrays.items():
+                values = np.array(values[start:start + chunk_rows])
+                if mask is not None:
+                    values = pd.api.types.pandas_dtype(dtypes[col]).construct_array_type()(
+                        values, np.array(mask[start:start + chunk_rows])
+                    )
+                data[col] = values
+            yield pd.DataFrame(data, copy=False)
+
+    def open_writer(self, file_path: str, columns: list = None) -> FeatureStoreWriter:
+        return _NumpyWriter(self, file_path, columns)
+
+
+FEATURE_STORE_BACKENDS = {
+    backend.name: backend
+    for backend in (CsvFeatureStore, ParquetFeatureStore, NumpyFeatureStore)
+}
+
+
+
+def get_feature_store(file_format: str, schema_config: dict = None) -> FeatureStoreBackend:
+    """Return the backend registered under ``file_format`` ("csv", "parquet" or "numpy")."""
+    try:
+        return FEATURE_STORE_BACKENDS[file_format](schema_config)
+    except KeyError:
+        raise ValueError(
+            f"Unknown feature store format '{file_format}'. "
+            f"Available formats: {', '.join(FEATURE_STORE_BACKENDS)}"
+        )
+
+
+def get_feature_store_for_path(file_path: str, schema_config: dict = None) -> FeatureStoreBackend:
+    """Pick the backend from the file extension of an existing artifact."""
+    for backend in FEATURE_STORE_BACKENDS.values():
+        if file_path.endswith(backend.extension):
+            return backend(schema_config)
+    raise ValueError(f"Cannot infer feature store format from path: {file_path}")
+
+
+def object_id_seconds(object_id: bytes) -> int:
+    """Creation time (Unix seconds) embedded in a 12-byte ObjectId."""
+    return int.from_bytes(object_id[:4], "big")
+
+
+class RecentIdWindow:
+    """The ``_id`` values (12-byte ObjectIds) read by one cursor within ``window_s`` seconds of the newest one.
+
+    Ids are fed in ascending ``_id`` order, so older ones drop off the front
+    and only a window's worth is held, however large the scan.
+    """
+
+    def __init__(self, window_s: int):
+        self.window_s = window_s
+        self.ids = deque()
+
+    def extend(self, object_ids: list):
+        self.ids.extend(object_ids)
+        if self.ids:
+            cutoff = object_id_seconds(self.ids[-1]) - self.window_s
+            while object_id_seconds(self.ids[0]) < cutoff:
+                self.ids.popleft()
+
+
+class FeatureStoreManifest:
+    """Append-only list of feature store segments plus the ingestion high-water mark.
+
+    Persisted as ``manifest.json`` inside ``store_dir``. A segment file is always
+    written before the manifest that references it, and the manifest is replaced
+    atomically, so an interrupted run leaves at worst an unreferenced segment that
+    the next run overwrites.
+
+    ``recent_ids`` are the ``_id`` values already ingested within the re-scan
+    window below the high-water mark. They are stored in a ``.npy`` file named
+    after the segment count, written before the manifest that names it, so a
+    manifest never refers to ids of a segment it does not list.
+    """
+    FILE_NAME = "manifest.json"
+
+    def __init__(self, store_dir: str):
+        self.store_dir = store_dir
+        self.file_path = os.path.join(store_dir, self.FILE_NAME)
+        self.high_water_mark = None
+        self.segments = []
+        self.recent_ids = set()
+        self._recent_ids_file = None
+
+        if os.path.exists(self.file_path):
+            with open(self.file_path) as file:
+                content = json.load(file)
+            self.high_water_mark = content.get("high_water_mark")
+            self.segments = content.get("segments", [])
+            self._recent_ids_file = content.get("recent_ids_file")
+            if self._recent_ids_file:
+                ids = np.load(os.path.join(store_dir, self._recent_ids_file))
+                self.recent_ids = {row.tobytes() for row in ids}
+
+    @property
+    def total_rows(self) -> int:
+        return sum(segment["rows"] for segment in self.segments)
+
+    def segment_paths(self) -> list:
+        return [os.path.join(self.store_dir, segment["file"]) for segment in self.segments]
+
+    def next_segment_path(self, extension: str, offset: int = 0) -> str:
+        """Path of the segment ``offset`` places after the next one (for segments written side by side)."""
+        return os.path.join(self.store_dir, f"segment-{len(self.segments) + offset + 1:05d}{extension}")
+
+    def add_segment(self, segment_path: str, rows: int, high_water_mark: str):
+        self.segments.append({
+            "file": os.path.basename(segment_path),
+            "rows": int(rows),
+            "high_water_mark": high_water_mark,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        })
+        # Hex ObjectIds compare like the ids; late documents below the mark must not move it back
+        self.high_water_mark = max(self.high_water_mark or "", high_water_mark or "") or None
+
+    def update_recent_ids(self, object_ids, window_s: int):
+        """Add newly ingested ids and keep those within ``window_s`` seconds below the high-water mark."""
+        if self.high_water_mark is None:
+            return
+        cutoff = int(self.high_water_mark[:8], 16) - window_s
+        self.recent_ids = {object_id for object_id in itertools.chain(self.recent_ids, object_ids)
+                           if object_id_seconds(object_id) >= cutoff}
+
+    def save(self):
+        os.makedirs(self.store_dir, exist_ok=True)
+        previous_ids_file = self._recent_ids_file
+        self._recent_ids_file = None
+        if self.recent_ids:
+            self._recent_ids_file = f"recent_ids-{len(self.segments):05d}.npy"
+            ids = np.frombuffer(b"".join(sorted(self.recent_ids)), dtype=np.uint8).reshape(-1, 12)
+            temp_ids_path = os.path.join(self.store_dir, "recent_ids.tmp.npy")
+            np.save(temp_ids_path, ids)
+            os.replace(temp_ids_path, os.path.join(self.store_dir, self._recent_ids_file))
+
+        temp_path = self.file_path + ".tmp"
+        with open(temp_path, "w") as file:
+            json.dump({"high_water_mark": self.high_water_mark, "segments": self.segments,
+                       "recent_ids_file": self._recent_ids_file}, file, indent=2)
+        os.replace(temp_path, self.file_path)
+        if previous_ids_file and previous_ids_file != self._recent_ids_file:
+            os.remove(os.path.join(self.store_dir, previous_ids_file))
+
+    def iter_segment_chunks(self, chunk_rows: int, schema_config: dict = None, columns: list = None):
+        """Stream every segment in order as chunks of at most ``chunk_rows`` rows."""
+        for segment_path in self.segment_paths():
+            feature_store = get_feature_store_for_path(segment_path, schema_config)
+            yield from feature_store.iter_chunks(segment_path, chunk_rows, columns=columns)
+
+    def read_segments(self, schema_config: dict = None, columns: list = None) -> pd.DataFrame:
+        """Read every segment, each with the backend matching its extension, into one frame."""
+        frames = [
+            get_feature_store_for_path(segment_path, schema_config).read(segment_path, columns=columns)
+            for segment_path in self.segment_paths()
+        ]
+        if not frames:
+            return pd.DataFrame(columns=columns)
+        if len(frames) == 1:
+            return frames[0]
+        return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,180 @@
+from networksecurity.constants.train_pipeline import ARTIFACT_WRITER_WORKERS
+from networksecurity.utilities.exception import NetworkSecurityException
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import field, fields
+from multiprocessing import shared_memory, resource_tracker
+from typing import Callable
+import os, sys
+import hashlib
+import threading
+import numpy as np
+import pandas as pd
+
+# Column buffers in a shared memory block start on this boundary
+_ALIGNMENT = 64
+
+_writer_pool = None
+_writer_pool_lock = threading.Lock()
+
+
+def _get_writer_pool() -> ThreadPoolExecutor:
+    global _writer_pool
+    with _writer_pool_lock:
+        if _writer_pool is None:
+            _writer_pool = ThreadPoolExecutor(max_workers=ARTIFACT_WRITER_WORKERS,
+                                              thread_name_prefix="artifact-writer")
+        return _writer_pool
+
+
+def frame_digest(df: pd.DataFrame) -> str:
+    """SHA-256 of a frame's column names, dtypes and values (the index is ignored)."""
+    digest = hashlib.sha256()
+    digest.update(repr([(str(col), str(dtype)) for col, dtype in df.dtypes.items()]).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def _column_buffers(series: pd.Series) -> list:
+    """The numpy arrays that hold a column: its values, plus the mask of a nullable column."""
+    if isinstance(series.dtype, np.dtype):
+        if series.dtype.kind not in "biuf":
+            raise TypeError(f"Column '{series.name}' of dtype {series.dtype} cannot be shared")
+        return [series.to_numpy()]
+    array = series.array
+    if not isinstance(array, pd.arrays.IntegerArray):
+        raise TypeError(f"Column '{series.name}' of dtype {series.dtype} cannot be shared")
+    return [array._data, array._mask]
+
+
+def _attach(name: str):
+    """Map the shared memory block ``name`` and remove its name.
+
+    The returned mmap backs the arrays built on it and is released with the
+    last of them; unlinking right away means the block cannot outlive this
+    process, whatever happens to the sender.
+    """
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        # Take the mapping out of the SharedMemory object so that close() leaves it to numpy
+        buffer = block._mmap
+        block._buf.release()
+        block._buf, block._mmap = None, None
+    finally:
+        block.unlink()
+        block.close()
+    return buffer
+
+
+class FrameHandle:
+    """In-memory handle to a DataFrame artifact, passed between stages next to its file path.
+
+    Within a process the handle simply holds the frame, so a downstream stage
+    uses it without reading the file back. Pickling the handle (e.g. to or
+    from a ``ProcessPoolExecutor`` worker) moves the columns into a shared
+    memory block instead of the pickle stream; the receiving process maps it
+    and builds the frame on it without copying. Only integer, float and
+    nullable integer columns can be shared.
+
+    ``persist`` writes the frame to disk on a background thread; ``wait``
+    blocks until that write has finished.
+    """
+
+    def __init__(self, df: pd.DataFrame, file_path: str = None):
+        self._df = df
+        self.file_path = file_path
+        self._write = None
+
+    @property
+    def frame(self) -> pd.DataFrame:
+        return self._df
+
+    def persist(self, write: Callable, file_path: str, background: bool = True):
+        """Write the frame with ``write(df, file_path)``, on the artifact writer threads by default."""
+        self.file_path = file_path
+        if background:
+            self._write = _get_writer_pool().submit(write, self._df, file_path)
+        else:
+            write(self._df, file_path)
+        return self
+
+    def wait(self) -> str:
+        """Block until the frame is on disk and return its path; re-raises errors of the write."""
+        try:
+            if self._write is not None:
+                self._write.result()
+            return self.file_path
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    @property
+    def persisted(self) -> bool:
+        return self._write is None or self._write.done()
+
+    def __getstate__(self):
+        # The receiving process may read file_path, so finish the write first
+        self.wait()
+        columns = []
+        buffers = []
+        offset = 0
+        for col in self._df.columns:
+            series = self._df[col]
+            parts = []
+            for array in _column_buffers(series):
+                offset = -(-offset // _ALIGNMENT) * _ALIGNMENT
+                parts.append((offset, array.dtype.str))
+                buffers.append((offset, array))
+                offset += array.nbytes
+            columns.append((col, parts))
+
+        block = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        try:
+            for start, array in buffers:
+                target = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf, offset=start)
+                target[...] = array
+                del target
+            name = block.name
+            if os.name == "posix":
+                # The receiver unlinks the block once it has mapped it
+                resource_tracker.unregister(block._name, "shared_memory")
+        finally:
+            block.close()
+        return {"file_path": self.file_path, "rows": len(self._df), "columns": columns, "shm_name": name}
+
+    def __setstate__(self, state):
+        rows = state["rows"]
+        buffer = _attach(state["shm_name"])
+        data = {}
+        for col, parts in state["columns"]:
+            arrays = [np.frombuffer(buffer, dtype=np.dtype(part_dtype), count=rows, offset=start)
+                      for start, part_dtype in parts]
+            if len(arrays) == 1:
+                data[col] = arrays[0]
+            else:
+                data[col] = pd.arrays.IntegerArray(arrays[0], arrays[1])
+        self._df = pd.DataFrame(data, columns=[col for col, _ in state["columns"]], copy=False)
+        self.file_path = state["file_path"]
+        self._write = None
+
+    def __repr__(self):
+        return f"FrameHandle(rows={len(self._df)}, file_path={self.file_path!r})"
+
+
+def in_memory_field():
+    """Dataclass field for a FrameHandle; such fields are left out of run state and stage cache entries."""
+    return field(default=None, repr=False, compare=False, metadata={"in_memory": True})
+
+
+def persistent_fields(artifact) -> dict:
+    """The artifact's fields that describe it on disk, i.e. all but its in-memory handles."""
+    return {f.name: getattr(artifact, f.name) for f in fields(artifact) if not f.metadata.get("in_memory")}
+
+
+def frame_handles(artifact) -> list:
+    return [getattr(artifact, f.name) for f in fields(artifact)
+            if f.metadata.get("in_memory") and getattr(artifact, f.name) is not None]
+
+
+def wait_persisted(artifact):
+    """Block until every frame handle of ``artifact`` has been written to disk."""
+    for handle in frame_handles(artifact):
+        handle.wait()
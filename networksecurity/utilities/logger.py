@@ -1,7 +1,13 @@
 import logging
+import logging.handlers
 import sys
 import os
+import json
+import time
+import queue
+import atexit
 import datetime
+import threading
 
 class ColorFormatter(logging.Formatter):
     green = "\033[92m"
@@ -12,39 +18,187 @@ class ColorFormatter(logging.Formatter):
 
     def __init__(self, fmt=None, datefmt=None):
         super().__init__(fmt, datefmt)
+        # One formatter per level, built once instead of on every record
         self.FORMATS = {
-            logging.DEBUG: self.green + self._fmt + self.reset,
-            logging.INFO: self.green + self._fmt + self.reset,
-            logging.WARNING: self.yellow + self._fmt + self.reset,
-            logging.ERROR: self.red + self._fmt + self.reset,
-            logging.CRITICAL: self.bold_red + self._fmt + self.reset
+            logging.DEBUG: logging.Formatter(self.green + self._fmt + self.reset, datefmt),
+            logging.INFO: logging.Formatter(self.green + self._fmt + self.reset, datefmt),
+            logging.WARNING: logging.Formatter(self.yellow + self._fmt + self.reset, datefmt),
+            logging.ERROR: logging.Formatter(self.red + self._fmt + self.reset, datefmt),
+            logging.CRITICAL: logging.Formatter(self.bold_red + self._fmt + self.reset, datefmt)
         }
 
     def format(self, record):
-        log_fmt = self.FORMATS.get(record.levelno)
-        formatter = logging.Formatter(log_fmt, datefmt=self.datefmt)
+        formatter = self.FORMATS.get(record.levelno)
+        if formatter is None:
+            return super().format(record)
         return formatter.format(record)
 
-# Log file setup
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, for log shippers."""
+
+    def format(self, record):
+        entry = {
+            "time": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "logger": record.name,
+            "module": record.module,
+            "lineno": record.lineno,
+            "thread": record.threadName,
+            "message": record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+class ErrorRateLimitFilter(logging.Filter):
+    """Drop repeats of the same error message within ``window`` seconds and cap
+    error records at ``max_per_second``. The next record that gets through for a
+    message carries the number of repeats that were suppressed."""
+
+    def __init__(self, window: float = 60.0, max_per_second: float = 20.0, level: int = logging.ERROR):
+        super().__init__()
+        self.window = window
+        self.max_per_second = max_per_second
+        self.level = level
+        self._last_seen = {}
+        self._suppressed = {}
+        self._tokens = max_per_second
+        self._refilled_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if record.levelno < self.level:
+            return True
+
+        key = (record.levelno, record.getMessage())
+        now = time.monotonic()
+        with self._lock:
+            self._tokens = min(self.max_per_second, self._tokens + (now - self._refilled_at) * self.max_per_second)
+            self._refilled_at = now
+            last_seen = self._last_seen.get(key)
+            if (last_seen is not None and now - last_seen < self.window) or self._tokens < 1:
+                self._suppressed[key] = self._suppressed.get(key, 0) + 1
+                return False
+
+            self._tokens -= 1
+            self._last_seen[key] = now
+            if len(self._last_seen) > 10000:
+                cutoff = now - self.window
+                self._last_seen = {k: t for k, t in self._last_seen.items() if t >= cutoff}
+            suppressed = self._suppressed.pop(key, 0)
+
+        if suppressed:
+            record.msg = f"{record.getMessage()} (suppressed {suppressed} repeats)"
+            record.args = None
+        return True
+
+_IMMUTABLE_ARG_TYPES = (str, int, float, bool, type(None))
+
+class _QueueHandler(logging.handlers.QueueHandler):
+    """Starts its listener with the first record, so importing the logger starts no thread."""
+
+    def __init__(self, log_queue, listener: logging.handlers.QueueListener = None):
+        super().__init__(log_queue)
+        self.listener = listener
+        self._started = False
+        self._start_lock = threading.Lock()
+
+    def enqueue(self, record):
+        if not self._started and self.listener is not None:
+            with self._start_lock:
+                if not self._started:
+                    self.listener.start()
+                    self._started = True
+        super().enqueue(record)
+
+    def prepare(self, record):
+        # All formatting happens on the listener thread. Args are merged here only if
+        # they could be mutated before the listener gets to them.
+        args = record.args
+        if args and not (isinstance(args, tuple) and all(isinstance(arg, _IMMUTABLE_ARG_TYPES) for arg in args)):
+            record.msg = record.getMessage()
+            record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+# processName is not in any format; skip the multiprocessing lookup on every record
+logging.logMultiprocessing = False
+
+class _LazyFileHandler(logging.FileHandler):
+    """Creates the log directory and file when the first record is written."""
+
+    def __init__(self, filename, mode="a", encoding=None):
+        super().__init__(filename, mode, encoding, delay=True)
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
+# Log file setup: nothing is created until something is logged
 LOG_FILE = f"{datetime.datetime.now().strftime('%Y_%m_%d___%H_%M_%S')}.log"
 log_path = os.path.join(os.getcwd(), "logs")
-os.makedirs(log_path, exist_ok=True)
 
 log_format = '[%(asctime)s] - %(lineno)d - %(name)s - %(levelname)s - %(message)s'
 date_format = '%Y-%m-%d %H:%M:%S'
 
-# Console Logging
-console_handler = logging.StreamHandler(sys.stdout)
-console_handler.setFormatter(ColorFormatter(log_format, date_format))
-# Configure logging
-logging.basicConfig(
-    level = logging.INFO,
-    format = log_format,
-    datefmt = date_format,
-    handlers = [
-        logging.FileHandler(os.path.join(log_path, LOG_FILE)),
-        console_handler
-    ]
-)
+def configure_logging(target: logging.Logger = None, level=logging.INFO, json_format: bool = None,
+                      log_file: str = None, stream=sys.stdout, rate_limit: bool = True):
+    """Route ``target`` (the root logger by default) through a queue to a background listener.
+
+    Callers only enqueue records; the listener thread formats them and writes the
+    console and log file. The listener starts with the first record and the log file
+    is created when it is first written. Set ``NETWORKSECURITY_LOG_JSON=1`` (or
+    ``json_format``) for JSON lines instead of colored text. Returns the listener.
+    """
+    if json_format is None:
+        json_format = os.getenv("NETWORKSECURITY_LOG_JSON", "").lower() in ("1", "true", "yes")
+    target = target if target is not None else logging.getLogger()
+
+    console_handler = logging.StreamHandler(stream)
+    console_handler.setFormatter(
+        JsonFormatter(datefmt=date_format) if json_format else ColorFormatter(log_format, date_format)
+    )
+    handlers = [console_handler]
+    if log_file:
+        file_handler = _LazyFileHandler(log_file)
+        file_handler.setFormatter(
+            JsonFormatter(datefmt=date_format) if json_format else logging.Formatter(log_format, date_format)
+        )
+        handlers.append(file_handler)
+
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    queue_handler = _QueueHandler(log_queue, listener)
+    if rate_limit:
+        queue_handler.addFilter(ErrorRateLimitFilter())
+
+    for handler in list(target.handlers):
+        target.removeHandler(handler)
+    target.addHandler(queue_handler)
+    target.setLevel(level)
+
+    # Drain the queue on interpreter exit so the last records are not lost
+    atexit.register(_stop_listener, listener)
+    if hasattr(os, "register_at_fork"):
+        # Flush first so the child does not inherit and re-write buffered output
+        os.register_at_fork(before=lambda: [handler.flush() for handler in listener.handlers],
+                            after_in_child=lambda: _restart_listener(listener))
+    return listener
+
+def _stop_listener(listener: logging.handlers.QueueListener):
+    if listener._thread is not None:
+        listener.stop()
+
+def _restart_listener(listener: logging.handlers.QueueListener):
+    """The listener thread does not survive a fork; give a forked child its own."""
+    if listener._thread is not None:
+        listener._thread = None
+        listener.start()
+
+listener = configure_logging(log_file=os.path.join(log_path, LOG_FILE))
 
 logger = logging.getLogger()
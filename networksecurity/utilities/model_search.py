@@ -0,0 +1,233 @@
+from networksecurity.utilities.exception import NetworkSecurityException
+from networksecurity.utilities.frame_handle import FrameHandle
+from networksecurity.utilities.logger import logger
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import product
+import os, sys
+import json
+import time
+import pickle
+import hashlib
+import importlib
+import numpy as np
+
+# Classifiers the search space may name, by module; imported only when a search runs
+ESTIMATORS = {
+    "LogisticRegression": "sklearn.linear_model",
+    "DecisionTreeClassifier": "sklearn.tree",
+    "RandomForestClassifier": "sklearn.ensemble",
+    "ExtraTreesClassifier": "sklearn.ensemble",
+    "GradientBoostingClassifier": "sklearn.ensemble",
+    "HistGradientBoostingClassifier": "sklearn.ensemble",
+    "KNeighborsClassifier": "sklearn.neighbors",
+}
+
+
+def make_estimator(name: str, params: dict, seed: int = 0):
+    """Unfitted classifier ``name`` with ``params``, seeded where it takes a ``random_state``."""
+    if name not in ESTIMATORS:
+        raise ValueError(f"Unknown estimator: {name}")
+    estimator = getattr(importlib.import_module(ESTIMATORS[name]), name)()
+    if "random_state" in estimator.get_params():
+        params = {"random_state": seed, **params}
+    return estimator.set_params(**params)
+
+
+def expand_search_space(search_space: dict) -> list:
+    """``[(estimator name, params), ...]`` for every point of every grid in ``search_space``."""
+    candidates = []
+    for name, grid in search_space.items():
+        keys = sorted(grid)
+        for values in product(*(grid[key] for key in keys)):
+            candidates.append((name, dict(zip(keys, values))))
+    return candidates
+
+
+def candidate_key(data_digest: str, name: str, params: dict, cv_folds: int, seed: int, scoring: str) -> str:
+    """Cache key of a fitted candidate: the training data, the estimator and everything that affects its fit."""
+    import sklearn
+    payload = json.dumps(
+        {"data": data_digest, "estimator": name, "params": params, "cv_folds": cv_folds, "seed": seed,
+         "scoring": scoring, "sklearn": sklearn.__version__},
+        sort_keys=True, default=str,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class CandidateCache:
+    """Fitted candidates of earlier searches, by candidate key.
+
+    An entry is the pickled model (``<key>.pkl``) next to its
+    cross-validation result (``<key>.json``), so results are looked up without
+    unpickling models. Files are written under a temporary name and renamed,
+    the result last, so concurrent workers and interrupted runs never leave a
+    partial entry behind. A lookup touches the result file, whose mtime is
+    the entry's last use for ``evict``.
+    """
+
+    def __init__(self, cache_dir: str):
+        self.cache_dir = cache_dir
+
+    def path(self, key: str, extension: str = ".pkl") -> str:
+        return os.path.join(self.cache_dir, key[:2], key + extension)
+
+    def result(self, key: str):
+        """The cross-validation result cached for ``key``, or None."""
+        path = self.path(key, ".json")
+        if not (os.path.exists(path) and os.path.exists(self.path(key))):
+            return None
+        try:
+            with open(path) as file:
+                result = json.load(file)
+            os.utime(path)
+            return result
+        except Exception as e:
+            logger.warning(f"Unreadable model candidate {path}; refitting it: {e}")
+            return None
+
+    def model(self, key: str):
+        with open(self.path(key), "rb") as file:
+            return pickle.load(file)
+
+    def put(self, key: str, result: dict, model):
+        os.makedirs(os.path.dirname(self.path(key)), exist_ok=True)
+        for extension, dump, mode in ((".pkl", lambda file: pickle.dump(model, file, pickle.HIGHEST_PROTOCOL), "wb"),
+                                      (".json", lambda file: json.dump(result, file, indent=2), "w")):
+            path = self.path(key, extension)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, mode) as file:
+                dump(file)
+            os.replace(temp_path, path)
+
+    def _entries(self) -> list:
+        """``(last_used, key, paths, size)`` of each entry, including the leftovers of interrupted writes."""
+        files = {}
+        if os.path.isdir(self.cache_dir):
+            for prefix in os.listdir(self.cache_dir):
+                prefix_dir = os.path.join(self.cache_dir, prefix)
+                for name in os.listdir(prefix_dir):
+                    files.setdefault(name.split(".", 1)[0], []).append(os.path.join(prefix_dir, name))
+        entries = []
+        for key, paths in files.items():
+            stats = [os.stat(path) for path in paths]
+            entries.append((max(stat.st_mtime for stat in stats), key, paths, sum(stat.st_size for stat in stats)))
+        return entries
+
+    def evict(self, max_bytes: int, max_age_days: float) -> int:
+        """Drop entries unused for longer than ``max_age_days``, then least recently used
+        entries until the cache fits in ``max_bytes``. Returns the number of entries removed."""
+        try:
+            entries = sorted(self._entries())
+            cutoff = time.time() - max_age_days * 86400
+            total_bytes = sum(size for _, _, _, size in entries)
+
+            removed = 0
+            for last_used, _, paths, size in entries:
+                if last_used >= cutoff and total_bytes <= max_bytes:
+                    break
+                for path in paths:
+                    if os.path.exists(path):
+                        os.remove(path)
+                if not os.listdir(os.path.dirname(paths[0])):
+                    os.rmdir(os.path.dirname(paths[0]))
+                total_bytes -= size
+                removed += 1
+
+            if removed:
+                logger.info(f"Evicted {removed} model candidates from {self.cache_dir} ({total_bytes} bytes kept)")
+            return removed
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+
+# Training data of a search worker, set once per process by _init_worker
+_worker_data = None
+
+
+def _init_worker(data: FrameHandle, target_column: str, single_threaded: bool = True):
+    """Keep the training frame for the tasks of this worker.
+
+    The frame is handed over once per worker rather than with every task:
+    forked workers share the parent's pages, spawned ones map the
+    FrameHandle's shared memory block. Parallelism comes from the pool, so
+    the OpenMP/BLAS threads of a worker's fits are limited to one.
+    """
+    global _worker_data
+    if single_threaded:
+        from threadpoolctl import threadpool_limits
+        threadpool_limits(1)
+    df = data.frame
+    _worker_data = (df.drop(columns=[target_column]).to_numpy(dtype=np.float32),
+                    df[target_column].to_numpy())
+
+
+def _fit_candidate(name: str, params: dict, key: str, cache_dir: str, cv_folds: int, seed: int,
+                   scoring: str) -> dict:
+    """Cross-validate and refit one candidate on the worker's data and store it in the cache."""
+    from sklearn.model_selection import StratifiedKFold, cross_val_score
+
+    features, target = _worker_data
+    start = time.perf_counter()
+    folds = StratifiedKFold(n_splits=cv_folds, shuffle=True, random_state=seed)
+    scores = cross_val_score(make_estimator(name, params, seed), features, target, cv=folds, scoring=scoring)
+    cv_seconds = time.perf_counter() - start
+    model = make_estimator(name, params, seed).fit(features, target)
+    result = {
+        "estimator": name, "params": params, "key": key,
+        "cv_score": float(scores.mean()), "cv_std": float(scores.std()),
+        "cv_time_s": cv_seconds, "fit_time_s": time.perf_counter() - start - cv_seconds,
+    }
+    CandidateCache(cache_dir).put(key, result, model)
+    return result
+
+
+def search_candidates(data: FrameHandle, target_column: str, data_digest: str, search_space: dict,
+                      cache_dir: str, cv_folds: int = 3, seed: int = 0, scoring: str = "f1",
+                      workers: int = None) -> list:
+    """Evaluate every candidate of ``search_space`` on ``data``, on a pool of ``workers`` processes.
+
+    Candidates already in the cache under the same data digest and params are
+    not refitted. Returns one result per candidate (``cached`` tells which were
+    reused), best cross-validation score first; the fitted models stay in the
+    cache, see ``CandidateCache.model``.
+    """
+    try:
+        cache = CandidateCache(cache_dir)
+        results, pending = [], []
+        for name, params in expand_search_space(search_space):
+            key = candidate_key(data_digest, name, params, cv_folds, seed, scoring)
+            result = cache.result(key)
+            if result is not None:
+                results.append({**result, "cached": True})
+                logger.info(f"Candidate {name} {params}: cached, cv {scoring} {result['cv_score']:.4f}")
+            else:
+                pending.append((name, params, key))
+
+        workers = min(workers or os.cpu_count() or 1, len(pending))
+
+        def _record(result):
+            results.append({**result, "cached": False})
+            logger.info(f"Candidate {result['estimator']} {result['params']}: cv {scoring} "
+                        f"{result['cv_score']:.4f} +/- {result['cv_std']:.4f}, "
+                        f"{result['cv_time_s']:.2f}s cv + {result['fit_time_s']:.2f}s fit")
+
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(data, target_column)) as pool:
+                futures = [pool.submit(_fit_candidate, name, params, key, cache_dir, cv_folds, seed, scoring)
+                           for name, params, key in pending]
+                for future in as_completed(futures):
+                    _record(future.result())
+        elif pending:
+            global _worker_data
+            _init_worker(data, target_column, single_threaded=False)
+            try:
+                for name, params, key in pending:
+                    _record(_fit_candidate(name, params, key, cache_dir, cv_folds, seed, scoring))
+            finally:
+                _worker_data = None
+
+        results.sort(key=lambda result: (-result["cv_score"], result["key"]))
+        return results
+    except Exception as e:
+        raise NetworkSecurityException(e, sys)
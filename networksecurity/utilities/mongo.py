@@ -0,0 +1,165 @@
+from networksecurity.constants import train_pipeline
+from networksecurity.utilities.logger import logger
+import os
+import time
+import atexit
+import threading
+
+
+def get_mongodb_uri() -> str:
+    """MongoDB connection string from the environment or a ``.env`` file, resolved on first use.
+
+    ``MONGODB_URI`` is the name to use; ``MONGODB_URL`` (read by older
+    versions of push_data.py) is still accepted as a fallback.
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    mongodb_uri = os.getenv("MONGODB_URI")
+    if not mongodb_uri and os.getenv("MONGODB_URL"):
+        logger.warning("MONGODB_URL is deprecated, set MONGODB_URI instead")
+        mongodb_uri = os.getenv("MONGODB_URL")
+    if not mongodb_uri:
+        raise ValueError("MONGODB_URI environment variable is not set")
+    return mongodb_uri
+
+
+class MongoClientManager:
+    """Process-wide pool of ``MongoClient`` objects, one per connection string.
+
+    A ``MongoClient`` is thread-safe and keeps its own connection pool, so
+    every stage and worker thread of a process shares one client per URI
+    instead of paying the connection and TLS handshakes per call. The server
+    is pinged once when a client is created (so a bad URI still fails fast);
+    after that a background thread pings every client each
+    ``health_check_interval_s`` and ``health()`` reports the last results, so
+    nothing on the request path waits for a round trip.
+
+    Clients must not be used across ``fork()``: the child process drops the
+    inherited clients (without closing the parent's sockets) and creates its
+    own on first use.
+    """
+
+    def __init__(self, max_pool_size: int = train_pipeline.MONGODB_MAX_POOL_SIZE,
+                 min_pool_size: int = train_pipeline.MONGODB_MIN_POOL_SIZE,
+                 max_idle_time_ms: int = train_pipeline.MONGODB_MAX_IDLE_TIME_MS,
+                 connect_timeout_ms: int = train_pipeline.MONGODB_CONNECT_TIMEOUT_MS,
+                 server_selection_timeout_ms: int = train_pipeline.MONGODB_SERVER_SELECTION_TIMEOUT_MS,
+                 socket_timeout_ms: int = train_pipeline.MONGODB_SOCKET_TIMEOUT_MS,
+                 health_check_interval_s: float = train_pipeline.MONGODB_HEALTH_CHECK_INTERVAL_S):
+        self.client_options = {
+            "maxPoolSize": max_pool_size,
+            "minPoolSize": min_pool_size,
+            "maxIdleTimeMS": max_idle_time_ms,
+            "connectTimeoutMS": connect_timeout_ms,
+            "serverSelectionTimeoutMS": server_selection_timeout_ms,
+            "socketTimeoutMS": socket_timeout_ms,
+        }
+        self.health_check_interval_s = health_check_interval_s
+        self._reset()
+
+    def _reset(self):
+        self._lock = threading.Lock()
+        self._clients = {}
+        self._health = {}
+        self._stop = threading.Event()
+        self._health_thread = None
+        self._pid = os.getpid()
+
+    def get_client(self, mongodb_uri: str = None):
+        """The shared client for ``mongodb_uri`` (default: ``get_mongodb_uri()``)."""
+        if self._pid != os.getpid():
+            self._reset()
+        mongodb_uri = mongodb_uri or get_mongodb_uri()
+        client = self._clients.get(mongodb_uri)
+        if client is not None:
+            return client
+        with self._lock:
+            client = self._clients.get(mongodb_uri)
+            if client is None:
+                client = self._create_client(mongodb_uri)
+                self._clients[mongodb_uri] = client
+                self._start_health_checks()
+            return client
+
+    def _create_client(self, mongodb_uri: str):
+        import certifi
+        import pymongo
+
+        client = pymongo.MongoClient(mongodb_uri, tlsCAFile=certifi.where(), **self.client_options)
+        self._check(mongodb_uri, client, raise_errors=True)
+        logger.info(f"Opened MongoDB client (pool of up to {self.client_options['maxPoolSize']} connections)")
+        return client
+
+    def _check(self, mongodb_uri: str, client, raise_errors: bool = False):
+        start = time.perf_counter()
+        try:
+            client.admin.command("ping")
+            status = {"ok": True}
+        except Exception as e:
+            if raise_errors:
+                raise
+            status = {"ok": False, "error": str(e)}
+            if self._health.get(mongodb_uri, {}).get("ok", True):
+                logger.warning(f"MongoDB health check failed: {e}")
+        status.update(latency_ms=round((time.perf_counter() - start) * 1000, 3), checked_at=time.time())
+        self._health[mongodb_uri] = status
+
+    def _start_health_checks(self):
+        if self._health_thread is not None or not self.health_check_interval_s:
+            return
+        self._health_thread = threading.Thread(target=self._health_loop, name="mongo-health", daemon=True)
+        self._health_thread.start()
+
+    def _health_loop(self):
+        while not self._stop.wait(self.health_check_interval_s):
+            for mongodb_uri, client in list(self._clients.items()):
+                self._check(mongodb_uri, client)
+
+    def health(self) -> list:
+        """Last health check of every client (``ok``, ``latency_ms``, ``checked_at``, ``error``)."""
+        return [dict(status) for status in self._health.values()]
+
+    def close_all(self):
+        """Close every client; later ``get_client`` calls open new ones."""
+        if self._pid != os.getpid():
+            self._reset()
+            return
+        with self._lock:
+            self._stop.set()
+            clients, self._clients = self._clients, {}
+            self._health = {}
+            self._health_thread = None
+            self._stop = threading.Event()
+        for client in clients.values():
+            client.close()
+        if clients:
+            logger.info(f"Closed {len(clients)} MongoDB client(s)")
+
+
+_manager = MongoClientManager()
+# A forked child must not touch the parent's sockets, and the health thread does not survive the fork
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=lambda: _manager._reset())
+atexit.register(lambda: _manager.close_all())
+
+
+def configure_mongo_clients(**options) -> MongoClientManager:
+    """Replace the process-wide manager with one built from ``options`` (see ``MongoClientManager``)."""
+    global _manager
+    _manager.close_all()
+    _manager = MongoClientManager(**options)
+    return _manager
+
+
+def get_mongo_client(mongodb_uri: str = None):
+    """The process-wide pooled client for ``mongodb_uri`` (default: ``get_mongodb_uri()``)."""
+    return _manager.get_client(mongodb_uri)
+
+
+def mongo_client_health() -> list:
+    return _manager.health()
+
+
+def close_mongo_clients():
+    _manager.close_all()
@@ -0,0 +1,177 @@
+from networksecurity.utilities.exception import NetworkSecurityException
+from networksecurity.utilities.schema import get_domain_range
+from networksecurity.utilities.utils import atomic_output
+import os, sys
+import numpy as np
+import pandas as pd
+
+KEY_BITS = 64
+
+
+class RowCodec:
+    """Packs a row of small-range integer columns into one uint64 key.
+
+    Every field takes ``bits`` bits (2 for the phishing data's {-1, 0, 1}),
+    holding ``value - low``; column ``i`` sits at bit ``i * bits``. The 31
+    fields of a phishing record fit in 62 bits. Rows with a missing column,
+    a null or a value outside ``[low, high]`` cannot be packed.
+    """
+
+    def __init__(self, columns: list, low: int, high: int):
+        self.columns = list(columns)
+        self.low = int(low)
+        self.high = int(high)
+        self.bits = max(1, (self.high - self.low).bit_length())
+        if len(self.columns) * self.bits > KEY_BITS:
+            raise ValueError(f"{len(self.columns)} columns of {self.bits} bits do not fit in {KEY_BITS} bits")
+        self._mask = np.uint64((1 << self.bits) - 1)
+
+    @classmethod
+    def from_schema(cls, schema_config: dict, columns: list = None) -> "RowCodec":
+        value_range = get_domain_range(schema_config)
+        if value_range is None:
+            raise ValueError("Packing rows needs value domains in the schema")
+        return cls(columns or list(schema_config["columns"]), *value_range)
+
+    def shift(self, i: int) -> np.uint64:
+        return np.uint64(i * self.bits)
+
+    def encode(self, df: pd.DataFrame):
+        """Return ``(keys, packable)``: the uint64 key of every row, and which rows could be packed.
+
+        Keys of rows that cannot be packed are 0 and must be ignored.
+        """
+        try:
+            keys = np.zeros(len(df), dtype=np.uint64)
+            packable = np.ones(len(df), dtype=bool)
+            for i, col in enumerate(self.columns):
+                if col not in df.columns:
+                    packable[:] = False
+                    break
+                series = df[col]
+                if isinstance(series.dtype, np.dtype) and series.dtype.kind in "iu":
+                    values = series.to_numpy()
+                else:
+                    values = pd.to_numeric(series, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+                    with np.errstate(invalid="ignore"):
+                        packable &= values == np.round(values)
+                with np.errstate(invalid="ignore"):
+                    packable &= (values >= self.low) & (values <= self.high)
+                codes = np.where(packable, values - self.low, 0).astype(np.uint64)
+                keys |= codes << self.shift(i)
+            keys[~packable] = 0
+            return keys, packable
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+    def column_codes(self, keys: np.ndarray, i: int) -> np.ndarray:
+        """Field ``i`` of every key, as ``value - low``."""
+        return ((keys >> self.shift(i)) & self._mask).astype(np.intp)
+
+    def decode(self, keys: np.ndarray) -> pd.DataFrame:
+        """Rebuild the rows of ``keys`` as int8 columns."""
+        return pd.DataFrame(
+            {col: (self.column_codes(keys, i) + self.low).astype(np.int8) for i, col in enumerate(self.columns)},
+            copy=False,
+        )
+
+
+class DedupIndex:
+    """Multiset of packed rows as sorted unique ``keys`` with their ``counts``.
+
+    Histograms and other per-row statistics over the index cost
+    O(unique rows) instead of O(rows). ``unpacked_rows`` counts the rows that
+    were seen but could not be packed and are not in the index.
+    """
+
+    def __init__(self, codec: RowCodec, keys: np.ndarray = None, counts: np.ndarray = None,
+                 unpacked_rows: int = 0):
+        self.codec = codec
+        self.keys = np.zeros(0, dtype=np.uint64) if keys is None else keys
+        self.counts = np.zeros(0, dtype=np.int64) if counts is None else counts
+        self.unpacked_rows = int(unpacked_rows)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, codec: RowCodec) -> "DedupIndex":
+        keys, packable = codec.encode(df)
+        index = cls(codec)
+        index.add(keys[packable], unpacked_rows=int((~packable).sum()))
+        return index
+
+    @property
+    def rows(self) -> int:
+        return int(self.counts.sum())
+
+    @property
+    def unique_rows(self) -> int:
+        return len(self.keys)
+
+    @property
+    def dedup_ratio(self) -> float:
+        return self.rows / self.unique_rows if self.unique_rows else 1.0
+
+    @property
+    def nbytes(self) -> int:
+        return self.keys.nbytes + self.counts.nbytes
+
+    @staticmethod
+    def _combine(keys: np.ndarray, counts: np.ndarray):
+        order = np.argsort(keys, kind="stable")
+        keys, counts = keys[order], counts[order]
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]]) if len(keys) else np.zeros(0, dtype=np.intp)
+        return keys[starts], np.add.reduceat(counts, starts) if len(keys) else counts
+
+    def add(self, keys: np.ndarray, unpacked_rows: int = 0):
+        """Add the packed rows ``keys`` (one entry per row, in any order)."""
+        new_keys, new_counts = np.unique(keys.astype(np.uint64, copy=False), return_counts=True)
+        self.keys, self.counts = self._combine(
+            np.concatenate([self.keys, new_keys]), np.concatenate([self.counts, new_counts.astype(np.int64)])
+        )
+        self.unpacked_rows += int(unpacked_rows)
+
+    def merge(self, other: "DedupIndex") -> "DedupIndex":
+        keys, counts = self._combine(np.concatenate([self.keys, other.keys]),
+                                     np.concatenate([self.counts, other.counts]))
+        return DedupIndex(self.codec, keys, counts, self.unpacked_rows + other.unpacked_rows)
+
+    def subtract(self, keys: np.ndarray) -> "DedupIndex":
+        """Index without one occurrence per entry of ``keys``, which must all be in the index."""
+        removed_keys, removed_counts = np.unique(keys.astype(np.uint64, copy=False), return_counts=True)
+        positions = np.searchsorted(self.keys, removed_keys)
+        if len(removed_keys) and (
+            positions.max() >= len(self.keys) or (self.keys[positions] != removed_keys).any()
+            or (self.counts[positions] < removed_counts).any()
+        ):
+            raise ValueError("Cannot remove rows that are not in the index")
+        counts = self.counts.copy()
+        counts[positions] -= removed_counts
+        kept = counts > 0
+        return DedupIndex(self.codec, self.keys[kept], counts[kept], self.unpacked_rows)
+
+    def value_histograms(self) -> np.ndarray:
+        """Per-column value counts, shaped like ``drift.value_histograms`` (last bin empty)."""
+        width = self.codec.high - self.codec.low + 1
+        histograms = np.zeros((len(self.codec.columns), width + 1), dtype=np.int64)
+        for i in range(len(self.codec.columns)):
+            histograms[i, :width] = np.bincount(
+                self.codec.column_codes(self.keys, i), weights=self.counts, minlength=width
+            )[:width].astype(np.int64)
+        return histograms
+
+    def to_frame(self, count_column: str = "count") -> pd.DataFrame:
+        """The distinct rows with their number of occurrences."""
+        frame = self.codec.decode(self.keys)
+        frame[count_column] = self.counts
+        return frame
+
+    def save(self, file_path: str):
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with atomic_output(file_path) as temp_path, open(temp_path, "wb") as file:
+            np.savez(file, keys=self.keys, counts=self.counts, unpacked_rows=self.unpacked_rows,
+                     columns=np.array(self.codec.columns), value_range=np.array([self.codec.low, self.codec.high]))
+
+    @classmethod
+    def load(cls, file_path: str) -> "DedupIndex":
+        with np.load(file_path) as content:
+            codec = RowCodec(content["columns"].tolist(), *content["value_range"].tolist())
+            return cls(codec, content["keys"], content["counts"], int(content["unpacked_rows"]))
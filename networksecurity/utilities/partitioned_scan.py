@@ -0,0 +1,122 @@
+from networksecurity.utilities.exception import NetworkSecurityException
+from networksecurity.utilities.logger import logger
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime, timezone
+import os, sys
+import json
+
+
+def sample_split_points(collection, partitions: int, query: dict = None, oversample: int = 32) -> list:
+    """Up to ``partitions - 1`` ``_id`` values cutting the matching documents into similar-sized ranges.
+
+    ``_id`` values are drawn with ``$sample`` (``oversample`` per partition)
+    and the quantiles of the sorted sample become the split points, so no
+    index walk or ``skip`` over the collection is needed.
+    """
+    if partitions <= 1:
+        return []
+    pipeline = [{"$match": query}] if query else []
+    pipeline += [{"$sample": {"size": partitions * oversample}}, {"$project": {"_id": 1}}]
+    sample = sorted(document["_id"] for document in collection.aggregate(pipeline))
+    points = [sample[len(sample) * i // partitions] for i in range(1, partitions)] if sample else []
+    # Duplicates would only give empty ranges
+    return sorted(set(points))
+
+
+def id_ranges(split_points: list) -> list:
+    """``(low, high)`` ranges (``low`` inclusive, ``high`` exclusive, ``None`` unbounded) covering every ``_id``."""
+    bounds = [None] + list(split_points) + [None]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def range_query(query: dict, low, high) -> dict:
+    """``query`` restricted to ``low <= _id < high``."""
+    query = dict(query or {})
+    condition = dict(query.get("_id") or {})
+    if low is not None:
+        condition["$gte"] = low
+    if high is not None:
+        condition["$lt"] = high
+    if condition:
+        query["_id"] = condition
+    return query
+
+
+class PartitionMap:
+    """``_id`` split points of a collection, stored as ``partition_map.json`` and reused across runs.
+
+    Any set of split points covers the whole collection, so a stale map
+    only loses balance, not documents; it is resampled once the collection
+    has grown by ``max_growth`` or more partitions are asked for than it has.
+    """
+
+    def __init__(self, file_path: str, split_points: list = None, documents: int = 0):
+        self.file_path = file_path
+        self.split_points = split_points or []
+        self.documents = documents
+
+    @classmethod
+    def load(cls, file_path: str) -> "PartitionMap":
+        from bson import ObjectId
+
+        if not os.path.exists(file_path):
+            return cls(file_path)
+        with open(file_path) as file:
+            content = json.load(file)
+        return cls(file_path, [ObjectId(point) for point in content["split_points"]], content["documents"])
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
+        temp_path = self.file_path + ".tmp"
+        with open(temp_path, "w") as file:
+            json.dump({
+                "split_points": [str(point) for point in self.split_points],
+                "documents": int(self.documents),
+                "created_at": datetime.now(timezone.utc).isoformat(),
+            }, file, indent=2)
+        os.replace(temp_path, self.file_path)
+
+    def is_stale(self, partitions: int, documents: int, max_growth: float) -> bool:
+        if not os.path.exists(self.file_path) or len(self.split_points) + 1 < partitions:
+            return True
+        return documents > max(1, self.documents) * max_growth
+
+    @classmethod
+    def for_collection(cls, file_path: str, collection, partitions: int, max_growth: float = 2.0) -> "PartitionMap":
+        """The stored map of ``collection``, resampled first if it is missing or stale."""
+        partition_map = cls.load(file_path)
+        documents = collection.estimated_document_count()
+        if partition_map.is_stale(partitions, documents, max_growth):
+            partition_map = cls(file_path, sample_split_points(collection, partitions), documents)
+            partition_map.save()
+            logger.info(f"Sampled {len(partition_map.split_points)} split points over {documents} documents "
+                        f"into {file_path}")
+        return partition_map
+
+
+def scan_partitions(read_partition, partitions: list, workers: int, preserve_order: bool = True):
+    """Run ``read_partition(partition)`` for every partition on a thread pool and yield the results.
+
+    At most two partitions per worker are queued or running at a time, which
+    bounds the results held in memory. With ``preserve_order`` results come
+    out in the order of ``partitions`` (a slow one holds back those after
+    it); otherwise as soon as each partition is done.
+    """
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scan") as pool:
+            pending = iter(partitions)
+            in_flight = [pool.submit(read_partition, partition)
+                         for _, partition in zip(range(2 * workers), pending)]
+            while in_flight:
+                if preserve_order:
+                    done = in_flight.pop(0)
+                else:
+                    done = next(iter(wait(in_flight, return_when=FIRST_COMPLETED).done))
+                    in_flight.remove(done)
+                result = done.result()
+                for partition in pending:
+                    in_flight.append(pool.submit(read_partition, partition))
+                    break
+                yield result
+    except Exception as e:
+        raise NetworkSecurityException(e, sys)
@@ -0,0 +1,149 @@
+import numpy as np
+
+CACHE_POLICIES = ("lru", "lfu")
+EVICTION_LOW_WATER = 0.9  # an eviction frees down to this fraction of capacity, so its sort serves many inserts
+PENDING_FRACTION = 1 / 64  # new entries buffered, as a fraction of capacity, before merging into the sorted table
+
+
+class _Entries:
+    """Sorted ``keys`` with parallel ``values``, the batch ``tick`` they were last used in and their ``uses``."""
+
+    def __init__(self):
+        self.keys = np.zeros(0, dtype=np.uint64)
+        self.values = None
+        self.last_used = np.zeros(0, dtype=np.int64)
+        self.uses = np.zeros(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    @property
+    def nbytes(self) -> int:
+        values = 0 if self.values is None else self.values.nbytes
+        return self.keys.nbytes + values + self.last_used.nbytes + self.uses.nbytes
+
+    def find(self, keys: np.ndarray):
+        positions = np.searchsorted(self.keys, keys)
+        found = positions < len(self.keys)
+        found[found] = self.keys[positions[found]] == keys[found]
+        return positions, found
+
+    def insert(self, keys: np.ndarray, values: np.ndarray, last_used, uses):
+        """Insert the sorted ``keys``, none of which are present yet, in one O(n + m) pass."""
+        if self.values is None:
+            self.values = np.zeros(0, dtype=values.dtype)
+        positions = np.searchsorted(self.keys, keys)
+        self.keys = np.insert(self.keys, positions, keys)
+        self.values = np.insert(self.values, positions, values.astype(self.values.dtype, copy=False))
+        self.last_used = np.insert(self.last_used, positions, last_used)
+        self.uses = np.insert(self.uses, positions, uses)
+
+    def keep(self, kept: np.ndarray):
+        self.keys, self.values = self.keys[kept], self.values[kept]
+        self.last_used, self.uses = self.last_used[kept], self.uses[kept]
+
+
+class PredictionCache:
+    """Bounded memo of predictions by packed feature vector (see ``RowCodec``).
+
+    Entries live in a large sorted table plus a small sorted buffer of new
+    ones, so a batch of keys is looked up and inserted with a few vectorized
+    passes that do not copy the whole table. The buffer is merged into the
+    table once it holds ``PENDING_FRACTION`` of ``capacity`` or the cache
+    goes over ``capacity``. A merge that takes the table over ``capacity``
+    evicts down to ``EVICTION_LOW_WATER`` of it: the least recently used
+    entries (``lru``) or the least used ones, older first among equals
+    (``lfu``).
+    """
+
+    def __init__(self, capacity: int, policy: str = "lru"):
+        if policy not in CACHE_POLICIES:
+            raise ValueError(f"Unknown cache policy: {policy}")
+        if capacity < 1:
+            raise ValueError(f"Cache capacity must be positive, got {capacity}")
+        self.capacity = int(capacity)
+        self.policy = policy
+        self.low_water = max(1, int(self.capacity * EVICTION_LOW_WATER))
+        self.pending_limit = max(1, int(self.capacity * PENDING_FRACTION))
+        self._entries = _Entries()
+        self._pending = _Entries()
+        self._tick = 0
+        self.lookups = 0
+        self.hits = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._pending)
+
+    @property
+    def keys(self) -> np.ndarray:
+        """All cached keys, sorted."""
+        return np.union1d(self._entries.keys, self._pending.keys)
+
+    @property
+    def nbytes(self) -> int:
+        return self._entries.nbytes + self._pending.nbytes
+
+    def lookup(self, keys: np.ndarray, weights: np.ndarray = None):
+        """Return ``(found, values)`` for the distinct, sorted ``keys``; ``values`` is only meaningful where found.
+
+        ``weights`` (default 1) is how many rows each key stands for, for the
+        hit statistics and the ``lfu`` use counts.
+        """
+        self._tick += 1
+        weights = np.ones(len(keys), dtype=np.int64) if weights is None else weights
+        found = np.zeros(len(keys), dtype=bool)
+        values = None
+        for entries in (self._entries, self._pending):
+            positions, hit = entries.find(keys)
+            hit_positions = positions[hit]
+            entries.last_used[hit_positions] = self._tick
+            entries.uses[hit_positions] += weights[hit]
+            if entries.values is not None:
+                if values is None:
+                    values = np.zeros(len(keys), dtype=entries.values.dtype)
+                values[hit] = entries.values[hit_positions]
+            found |= hit
+        self.lookups += int(weights.sum())
+        self.hits += int(weights[found].sum())
+        return found, values
+
+    def insert(self, keys: np.ndarray, values: np.ndarray, weights: np.ndarray = None):
+        """Add the distinct, sorted ``keys`` that ``lookup`` did not find, with their ``values``."""
+        if not len(keys):
+            return
+        weights = np.ones(len(keys), dtype=np.int64) if weights is None else weights
+        if self._entries.values is not None:
+            values = values.astype(self._entries.values.dtype, copy=False)
+        self._pending.insert(keys, values, self._tick, weights)
+        if len(self._pending) >= self.pending_limit or len(self) > self.capacity:
+            self._merge()
+
+    def _merge(self):
+        pending, self._pending = self._pending, _Entries()
+        self._entries.insert(pending.keys, pending.values, pending.last_used, pending.uses)
+        if len(self._entries) > self.capacity:
+            self._evict(len(self._entries) - self.low_water)
+
+    def _evict(self, count: int):
+        entries = self._entries
+        if self.policy == "lru":
+            order = np.argsort(entries.last_used, kind="stable")
+        else:
+            order = np.lexsort((entries.last_used, entries.uses))
+        kept = np.ones(len(entries), dtype=bool)
+        kept[order[:count]] = False
+        entries.keep(kept)
+        self.evictions += count
+
+    def stats(self) -> dict:
+        return {
+            "policy": self.policy,
+            "capacity": self.capacity,
+            "size": len(self),
+            "lookups": self.lookups,
+            "hits": self.hits,
+            "hit_rate": self.hits / self.lookups if self.lookups else 0.0,
+            "evictions": self.evictions,
+            "bytes": self.nbytes,
+        }
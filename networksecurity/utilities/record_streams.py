@@ -0,0 +1,102 @@
+from networksecurity.utilities.exception import NetworkSecurityException
+from networksecurity.utilities.logger import logger
+import os, sys
+import csv
+import json
+import time
+import pandas as pd
+
+
+def _batches(lines, parse, batch_records: int):
+    """Group parsed lines into DataFrames of up to ``batch_records`` records; a ``None`` line (the source
+    went idle) hands out the records gathered so far."""
+    records = []
+    for line in lines:
+        if line is None:
+            if records:
+                yield pd.DataFrame.from_records(records)
+                records = []
+            continue
+        records.append(parse(line))
+        if len(records) >= batch_records:
+            yield pd.DataFrame.from_records(records)
+            records = []
+    if records:
+        yield pd.DataFrame.from_records(records)
+
+
+def _follow_lines(file, follow: bool, poll_interval_s: float):
+    """Complete lines of ``file``; when following, ``None`` marks every idle poll."""
+    partial = ""
+    while True:
+        line = file.readline()
+        if line:
+            partial += line
+            if partial.endswith("\n"):
+                if partial.strip():
+                    yield partial
+                partial = ""
+            continue
+        if not follow:
+            if partial.strip():
+                yield partial
+            return
+        yield None
+        time.sleep(poll_interval_s)
+
+
+def tail_file(file_path: str, follow: bool = False, poll_interval_s: float = 1.0, batch_records: int = 1000,
+              from_start: bool = True):
+    """Records of a JSON-lines (``.jsonl``) or CSV file as DataFrame batches (CSV values stay text).
+
+    With ``follow`` the file is tailed like ``tail -f``: after the end is
+    reached it is polled every ``poll_interval_s`` for appended lines, and a
+    partial batch is handed out whenever the file goes idle. Only the current
+    batch is held in memory.
+    """
+    try:
+        extension = os.path.splitext(file_path)[1].lower()
+        if extension not in (".jsonl", ".csv"):
+            raise ValueError(f"Cannot tail {file_path}: expected a .jsonl or .csv file")
+        with open(file_path, "r", encoding="utf-8") as file:
+            header = None
+            if extension == ".csv":
+                header = next(csv.reader([file.readline()]))
+            if not from_start:
+                file.seek(0, os.SEEK_END)
+            logger.info(f"Reading records from {file_path}{' (following)' if follow else ''}")
+
+            def parse(line: str) -> dict:
+                if header is None:
+                    return json.loads(line)
+                return dict(zip(header, next(csv.reader([line]))))
+
+            yield from _batches(_follow_lines(file, follow, poll_interval_s), parse, batch_records)
+    except Exception as e:
+        raise NetworkSecurityException(e, sys)
+
+
+def mongo_change_stream(collection, batch_records: int = 1000, max_await_ms: int = 1000):
+    """Documents inserted into a MongoDB ``collection`` (needs a replica set) as DataFrame batches.
+
+    A partial batch is handed out whenever the stream has been idle for
+    ``max_await_ms``. ``_id`` is dropped.
+    """
+    try:
+        pipeline = [{"$match": {"operationType": "insert"}}]
+        with collection.watch(pipeline, max_await_time_ms=max_await_ms) as stream:
+            logger.info(f"Watching inserts into {collection.full_name}")
+
+            def changes():
+                while stream.alive:
+                    change = stream.try_next()
+                    if change is None:
+                        yield None
+                        continue
+                    document = change["fullDocument"]
+                    document.pop("_id", None)
+                    yield document
+
+            yield from _batches(changes(), lambda document: document, batch_records)
+    except Exception as e:
+        raise NetworkSecurityException(e, sys)
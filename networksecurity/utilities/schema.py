@@ -0,0 +1,94 @@
+from networksecurity.utilities.exception import NetworkSecurityException
+import sys
+import numpy as np
+import pandas as pd
+
+NA_VALUES = ["na"]
+READ_CHUNK_SIZE = 100_000
+
+
+def get_schema_dtypes(schema_config: dict) -> dict:
+    """Return the ``{column: dtype}`` mapping declared in schema.yaml."""
+    return dict(schema_config.get("dtypes") or {})
+
+
+def get_schema_domains(schema_config: dict) -> dict:
+    """Return the ``{column: [allowed values]}`` mapping declared in schema.yaml."""
+    return {col: list(values) for col, values in (schema_config.get("domains") or {}).items()}
+
+
+def get_domain_range(schema_config: dict):
+    """Return ``(low, high)`` over all declared domains, or None without domains."""
+    values = [value for domain in get_schema_domains(schema_config).values() for value in domain]
+    if not values:
+        return None
+    return min(values), max(values)
+
+
+def _nullable_dtype(dtype: str) -> str:
+    """Map a numpy integer dtype name (int8) to its pandas nullable variant (Int8)."""
+    return dtype[0].upper() + dtype[1:] if dtype.startswith(("int", "uint")) else dtype
+
+
+def _fits_dtype(series: pd.Series, dtype: str) -> bool:
+    """Check that an integer cast would neither truncate nor wrap any value."""
+    if not series.size or not pd.api.types.is_integer_dtype(np.dtype(dtype.lower())):
+        return True
+    if pd.api.types.is_float_dtype(series) and not (series.dropna() % 1 == 0).all():
+        return False
+    info = np.iinfo(dtype.lower())
+    return bool(series.min() >= info.min and series.max() <= info.max)
+
+
+def apply_schema_dtypes(df: pd.DataFrame, schema_config: dict) -> pd.DataFrame:
+    """Cast the schema columns of ``df`` to their compact dtypes.
+
+    Columns without missing values get the plain dtype (int8); columns with
+    missing values or "na" markers get the nullable variant (Int8).
+    Columns not described by the schema, or holding values that do not fit
+    the declared dtype, are left untouched so validation can report them.
+    """
+    try:
+        casts = {}
+        for col, dtype in get_schema_dtypes(schema_config).items():
+            if col not in df.columns:
+                continue
+            series = df[col]
+            if not pd.api.types.is_numeric_dtype(series):
+                try:
+                    series = pd.to_numeric(series.replace({"na": np.nan}))
+                except (TypeError, ValueError):
+                    continue
+            if not _fits_dtype(series, dtype):
+                continue
+            if series.isna().any():
+                casts[col] = series.astype(_nullable_dtype(dtype))
+            elif series.dtype != dtype:
+                casts[col] = series.astype(dtype)
+
+        if not casts:
+            return df
+        return df.assign(**casts)
+    except Exception as e:
+        raise NetworkSecurityException(e, sys)
+
+
+def read_csv_with_schema(file_path: str, schema_config: dict, chunksize: int = READ_CHUNK_SIZE, **kwargs) -> pd.DataFrame:
+    """Read a CSV file into the compact dtypes declared in the schema.
+
+    The file is parsed in chunks that are cast as they arrive, so the wide
+    int64 parse result only ever exists for one chunk. pandas wraps out-of-range
+    values silently when given a narrow dtype up front, hence the cast-after-parse.
+    """
+    try:
+        chunks = [
+            apply_schema_dtypes(chunk, schema_config)
+            for chunk in pd.read_csv(file_path, na_values=NA_VALUES, chunksize=chunksize, **kwargs)
+        ]
+        if not chunks:
+            return pd.read_csv(file_path, nrows=0)
+        if len(chunks) == 1:
+            return chunks[0]
+        return pd.concat(chunks, ignore_index=True)
+    except Exception as e:
+        raise NetworkSecurityException(e, sys)
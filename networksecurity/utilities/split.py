@@ -0,0 +1,120 @@
+from networksecurity.utilities.exception import NetworkSecurityException
+import sys
+import numpy as np
+import pandas as pd
+
+# Row hashes are mapped to [0, 1) through their top 53 bits (the precision of a float64)
+_UNIT_SCALE = 1.0 / (1 << 53)
+
+
+def _hash_key(seed: int) -> str:
+    """pandas row hashing takes a 16 character key; derive it from the split seed."""
+    return f"{seed & (2 ** 64 - 1):016x}"
+
+
+def _canonical_column(series: pd.Series) -> pd.Series:
+    """Numbers (plain or nullable, any width) as float64 and anything else as text, so that a
+    row hashes the same however its chunk was typed."""
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        return pd.Series(series.to_numpy(dtype=np.float64, na_value=np.nan), copy=False)
+    return pd.Series(series.astype(str).to_numpy(dtype=object), copy=False)
+
+
+def _mix64(x: np.ndarray) -> np.ndarray:
+    """splitmix64 finalizer: a cheap, well-spread bijection on uint64."""
+    with np.errstate(over="ignore"):
+        x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return x ^ (x >> np.uint64(31))
+
+
+def row_hashes(df: pd.DataFrame, seed: int = 0) -> np.ndarray:
+    """Deterministic uint64 per row derived from the row's contents.
+
+    Columns are hashed in name order and independently of their dtype, so a
+    row gets the same value in every file format. Identical rows get
+    identical values.
+    """
+    columns = sorted(df.columns, key=str)
+    canonical = pd.DataFrame({i: _canonical_column(df[col]) for i, col in enumerate(columns)}, copy=False)
+    return pd.util.hash_pandas_object(canonical, index=False, hash_key=_hash_key(seed)).to_numpy()
+
+
+def row_identities(df: pd.DataFrame, keys: np.ndarray = None, packable: np.ndarray = None,
+                   seed: int = 0) -> np.ndarray:
+    """uint64 identity of every row: its packed key (see ``RowCodec``) where it
+    has one, else its content hash with the top bit set, so the two never meet."""
+    if keys is None:
+        return row_hashes(df, seed) | np.uint64(1 << 63)
+    identities = keys.astype(np.uint64)
+    if not packable.all():
+        identities[~packable] = row_hashes(df[~packable], seed) | np.uint64(1 << 63)
+    return identities
+
+
+def occurrence_unit_hashes(identities: np.ndarray, salt: int, seed: int = 0) -> np.ndarray:
+    """Value in [0, 1) per row from its identity and its occurrence among the equal rows.
+
+    The n-th copy of a row within a chunk is salted with ``n`` (and the chunk
+    with ``salt``), so duplicates are placed independently of each other
+    instead of all landing on the same side of a threshold.
+    """
+    occurrence = pd.Series(identities, copy=False).groupby(identities, sort=False).cumcount().to_numpy()
+    salted = _mix64(occurrence.astype(np.uint64) | (np.uint64(salt & 0xFFFFFFFF) << np.uint64(32)))
+    base = np.uint64((seed * 0x9E3779B97F4A7C15) & (2 ** 64 - 1))
+    hashes = _mix64(_mix64(identities ^ base) ^ salted)
+    return (hashes >> np.uint64(11)).astype(np.float64) * _UNIT_SCALE
+
+
+class StratifiedHashSplit:
+    """Streaming, stratified train/test assignment driven by row hashes.
+
+    Chunks are fed in order to ``assign``. Within every class of
+    ``target_column`` the rows of a chunk are ranked by a hash of their
+    contents and their occurrence number among identical rows, and the
+    lowest-ranked ones go to test, as many as keep the class's running test
+    share at ``test_ratio``: after every chunk each class is split exactly
+    (to one row). Only per-class counters are kept, so the input can be of any
+    size. The same input in the same order and chunking gives the same split
+    on every run, and appending data never moves rows already assigned.
+    """
+
+    def __init__(self, test_ratio: float, target_column: str, seed: int = 0):
+        if not 0 < test_ratio < 1:
+            raise ValueError(f"test_ratio must be between 0 and 1, got {test_ratio}")
+        self.test_ratio = test_ratio
+        self.target_column = target_column
+        self.seed = seed
+        # {label: [train rows, test rows]}
+        self.counts = {}
+        self.chunks = 0
+
+    def _test_quota(self, rows: int) -> int:
+        return int(np.floor(self.test_ratio * rows + 0.5))
+
+    def assign(self, chunk: pd.DataFrame, keys: np.ndarray = None, packable: np.ndarray = None) -> np.ndarray:
+        """Boolean mask of the rows of ``chunk`` that belong to the test split.
+
+        ``keys``/``packable`` from ``RowCodec.encode`` let packed rows be
+        identified by their key; the other rows are hashed column by column.
+        """
+        try:
+            if self.target_column not in chunk.columns:
+                raise ValueError(f"Target column '{self.target_column}' not found")
+            identities = row_identities(chunk, keys, packable, self.seed)
+            hashes = occurrence_unit_hashes(identities, self.chunks, self.seed)
+            self.chunks += 1
+            codes, labels = pd.factorize(chunk[self.target_column], use_na_sentinel=False)
+            is_test = np.zeros(len(chunk), dtype=bool)
+
+            for code, label in enumerate(labels):
+                key = "null" if pd.isna(label) else label.item() if hasattr(label, "item") else label
+                positions = np.flatnonzero(codes == code)
+                train_rows, test_rows = self.counts.get(key, (0, 0))
+                quota = self._test_quota(train_rows + test_rows + len(positions)) - test_rows
+                chosen = positions[np.argsort(hashes[positions], kind="stable")[:quota]]
+                is_test[chosen] = True
+                self.counts[key] = [train_rows + len(positions) - quota, test_rows + quota]
+            return is_test
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
@@ -0,0 +1,157 @@
+from networksecurity.utilities.exception import NetworkSecurityException
+from networksecurity.utilities.logger import logger
+from contextlib import contextmanager
+import os, sys
+import json
+import time
+import resource
+import threading
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+# ru_maxrss is in kilobytes on Linux and in bytes on macOS
+MAXRSS_UNIT = 1 if sys.platform == "darwin" else 1024
+
+
+def current_rss() -> int:
+    """Resident set size of this process in bytes, or None where /proc is unavailable."""
+    try:
+        with open("/proc/self/statm") as file:
+            return int(file.read().split()[1]) * PAGE_SIZE
+    except OSError:
+        return None
+
+
+def peak_rss() -> int:
+    """High-water mark of this process's resident set size in bytes."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * MAXRSS_UNIT
+
+
+class Span:
+    """One timed step; ``set`` attaches counters such as ``rows`` and ``bytes``."""
+
+    def __init__(self, name: str, category: str, args: dict):
+        self.name = name
+        self.category = category
+        self.args = dict(args)
+
+    def set(self, **args):
+        self.args.update(args)
+
+    def record_output(self, result):
+        """Take ``rows`` and in-memory ``bytes`` from a DataFrame result."""
+        if hasattr(result, "memory_usage") and hasattr(result, "__len__"):
+            self.args.setdefault("rows", len(result))
+            self.args.setdefault("bytes", int(result.memory_usage(index=False).sum()))
+
+
+class Tracer:
+    """Collects spans of one pipeline run as Chrome trace events.
+
+    Every span records wall time, CPU time of its thread, the growth of the
+    process's peak RSS and of its current RSS, plus any counters set on it.
+    ``save`` writes a file that chrome://tracing and Perfetto open directly.
+    """
+
+    def __init__(self):
+        self.pid = os.getpid()
+        self._events = []
+        self._thread_names = {}
+        self._lock = threading.Lock()
+        # Anchor perf_counter to the epoch so traces of resumed runs line up
+        self._epoch_offset = time.time() - time.perf_counter()
+
+    def _now_us(self) -> float:
+        return (self._epoch_offset + time.perf_counter()) * 1e6
+
+    @contextmanager
+    def span(self, name: str, category: str = "step", **args):
+        span = Span(name, category, args)
+        start_us, start_cpu = self._now_us(), time.thread_time()
+        start_rss, start_peak = current_rss(), peak_rss()
+        try:
+            yield span
+        except BaseException as e:
+            span.set(error=repr(e))
+            raise
+        finally:
+            end_us, end_rss = self._now_us(), current_rss()
+            span.set(
+                cpu_ms=round((time.thread_time() - start_cpu) * 1000, 3),
+                peak_rss_delta_bytes=peak_rss() - start_peak,
+            )
+            if start_rss is not None and end_rss is not None:
+                span.set(rss_delta_bytes=end_rss - start_rss)
+            event = {
+                "name": span.name, "cat": span.category, "ph": "X",
+                "ts": round(start_us, 3), "dur": round(end_us - start_us, 3),
+                "pid": self.pid, "tid": threading.get_ident(), "args": span.args,
+            }
+            with self._lock:
+                self._events.append(event)
+                self._thread_names[event["tid"]] = threading.current_thread().name
+
+    def events(self) -> list:
+        with self._lock:
+            return list(self._events)
+
+    def summary(self) -> list:
+        """``(name, count, total wall ms, total cpu ms)`` per span name, slowest first."""
+        totals = {}
+        for event in self.events():
+            count, wall, cpu = totals.get(event["name"], (0, 0.0, 0.0))
+            totals[event["name"]] = (count + 1, wall + event["dur"] / 1000, cpu + event["args"]["cpu_ms"])
+        rows = [(name, count, round(wall, 3), round(cpu, 3)) for name, (count, wall, cpu) in totals.items()]
+        return sorted(rows, key=lambda row: row[2], reverse=True)
+
+    def save(self, file_path: str, append: bool = False):
+        """Write the trace as Chrome trace JSON; with ``append`` keep the events already in the file."""
+        try:
+            events = self.events()
+            if append and os.path.exists(file_path):
+                with open(file_path) as file:
+                    events = json.load(file).get("traceEvents", []) + events
+
+            with self._lock:
+                metadata = [
+                    {"name": "thread_name", "ph": "M", "pid": self.pid, "tid": tid, "args": {"name": name}}
+                    for tid, name in self._thread_names.items()
+                ]
+
+            os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+            temp_path = file_path + ".tmp"
+            with open(temp_path, "w") as file:
+                json.dump({"traceEvents": events + metadata, "displayTimeUnit": "ms"}, file)
+            os.replace(temp_path, file_path)
+            logger.info(f"Trace with {len(events)} events written to {file_path}")
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
+
+_active_tracer = None
+
+
+def start_tracing() -> Tracer:
+    """Install a new process-wide tracer; ``trace_span`` records into it until ``stop_tracing``."""
+    global _active_tracer
+    _active_tracer = Tracer()
+    return _active_tracer
+
+
+def stop_tracing():
+    global _active_tracer
+    _active_tracer = None
+
+
+def get_tracer():
+    return _active_tracer
+
+
+@contextmanager
+def trace_span(name: str, category: str = "step", **args):
+    """Span in the active tracer; without one the body just runs and the span is discarded."""
+    tracer = _active_tracer
+    if tracer is None:
+        yield Span(name, category, args)
+        return
+    with tracer.span(name, category, **args) as span:
+        yield span
@@ -3,10 +3,39 @@ import yaml
 from networksecurity.utilities.exception import NetworkSecurityException
 from networksecurity.utilities.logger import logger
 import os, sys
+import hashlib
 import pickle
+import shutil
+import threading
+from contextlib import contextmanager
 import numpy as np
 
 
+@contextmanager
+def atomic_output(file_path: str):
+    """Yield a temporary path next to ``file_path`` that replaces it once the block succeeds.
+
+    Artifact files may be hardlinks to a blob store or stage cache entry shared
+    with other runs; replacing the link, instead of truncating the file through
+    it, leaves those untouched. A failed write leaves ``file_path`` as it was.
+    """
+    root, extension = os.path.splitext(file_path)
+    temp_path = f"{root}.{os.getpid()}.{threading.get_ident()}.tmp{extension}"
+    try:
+        yield temp_path
+        os.replace(temp_path, file_path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+def link_or_copy_file(source: str, destination: str):
+    """Make ``destination`` a hardlink to ``source`` (a copy where linking fails), replacing what was there."""
+    with atomic_output(destination) as temp_path:
+        try:
+            os.link(source, temp_path)
+        except OSError:
+            shutil.copy2(source, temp_path)
+
 def read_yaml_file(file_path: str) -> dict:
     try:
         with open(file_path, 'r') as file:
@@ -16,10 +45,7 @@ def read_yaml_file(file_path: str) -> dict:
 
 def write_yaml_file(file_path: str, content: str, replace: bool=True):
     try:
-        if replace and os.path.exists(file_path):
-            os.remove(file_path)
-
-        with open(file_path, "w", encoding="utf-8") as file:
+        with atomic_output(file_path) as temp_path, open(temp_path, "w", encoding="utf-8") as file:
             yaml.safe_dump(
                 content,
                 file,
@@ -28,4 +54,42 @@ def write_yaml_file(file_path: str, content: str, replace: bool=True):
                 allow_unicode=True
             )
     except Exception as e:
-        raise NetworkSecurityException(e, sys) from e
\ No newline at end of file
+        raise NetworkSecurityException(e, sys) from e
+
+def compute_file_hash(path: str, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 of a file, or of every file under a directory (names and contents, in sorted order)."""
+    try:
+        digest = hashlib.sha256()
+        if os.path.isdir(path):
+            file_paths = sorted(
+                os.path.join(root, name) for root, _, names in os.walk(path) for name in names
+            )
+        else:
+            file_paths = [path]
+
+        for file_path in file_paths:
+            if file_path != path:
+                digest.update(os.path.relpath(file_path, path).encode())
+            with open(file_path, "rb") as file:
+                for block in iter(lambda: file.read(chunk_size), b""):
+                    digest.update(block)
+        return digest.hexdigest()
+    except Exception as e:
+        raise NetworkSecurityException(e, sys) from e
+
+def save_object(file_path: str, obj: object):
+    try:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with atomic_output(file_path) as temp_path, open(temp_path, "wb") as file:
+            pickle.dump(obj, file, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        raise NetworkSecurityException(e, sys) from e
+
+def load_object(file_path: str) -> object:
+    try:
+        if not os.path.exists(file_path):
+            raise FileNotFoundError(f"The file: {file_path} does not exist")
+        with open(file_path, "rb") as file:
+            return pickle.load(file)
+    except Exception as e:
+        raise NetworkSecurityException(e, sys) from e
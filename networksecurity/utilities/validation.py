@@ -0,0 +1,273 @@
+from networksecurity.utilities.exception import NetworkSecurityException
+from networksecurity.utilities.logger import logger
+from networksecurity.utilities.schema import get_schema_dtypes, get_schema_domains
+from networksecurity.utilities.feature_store import FeatureStoreBackend, CsvFeatureStore
+from networksecurity.utilities.data_profile import DataProfile
+from networksecurity.utilities.packed_rows import DedupIndex
+from networksecurity.utilities.utils import link_or_copy_file
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+import os, sys
+import numpy as np
+import pandas as pd
+
+VIOLATION_KINDS = ("null", "dtype", "domain")
+
+
+def _column_violations(series: pd.Series, dtype: str, domain: list) -> dict:
+    """Boolean masks of the rows of ``series`` that are null, not of ``dtype`` or outside ``domain``."""
+    null = series.isna().to_numpy()
+    if pd.api.types.is_numeric_dtype(series):
+        values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    else:
+        values = pd.to_numeric(series, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+
+    bad_dtype = ~null & np.isnan(values)
+    if dtype is not None and np.issubdtype(np.dtype(dtype.lower()), np.integer):
+        info = np.iinfo(dtype.lower())
+        with np.errstate(invalid="ignore"):
+            bad_dtype |= ~null & ((values != np.round(values)) | (values < info.min) | (values > info.max))
+
+    bad_domain = np.zeros(len(series), dtype=bool)
+    if domain is not None:
+        bad_domain = ~null & ~bad_dtype & ~np.isin(values, domain)
+    return {"null": null, "dtype": bad_dtype, "domain": bad_domain}
+
+
+def validate_chunk(df: pd.DataFrame, schema_config: dict):
+    """Check every value of the schema columns against its dtype and domain.
+
+    Missing schema columns count as null in every row. Returns ``(valid_df,
+    invalid_df, counts)``: the clean rows restricted to the schema columns and
+    cast to the schema dtypes, the offending rows as they came in, and
+    ``{column: {"null": n, "dtype": n, "domain": n}}``.
+    """
+    columns = list(schema_config["columns"])
+    dtypes = get_schema_dtypes(schema_config)
+    domains = get_schema_domains(schema_config)
+
+    invalid = np.zeros(len(df), dtype=bool)
+    counts = {}
+    for col in columns:
+        if col not in df.columns:
+            masks = {"null": np.ones(len(df), dtype=bool)}
+        else:
+            masks = _column_violations(df[col], dtypes.get(col), domains.get(col))
+        counts[col] = {kind: int(masks[kind].sum()) if kind in masks else 0 for kind in VIOLATION_KINDS}
+        for mask in masks.values():
+            invalid |= mask
+
+    present = [col for col in columns if col in df.columns]
+    valid_df = df.loc[~invalid, present] if invalid.any() else df[present]
+    casts = {col: dtypes[col] for col in valid_df.columns if col in dtypes and valid_df[col].dtype != dtypes[col]}
+    if casts:
+        valid_df = valid_df.astype(casts)
+    return valid_df.reset_index(drop=True), df.loc[invalid].reset_index(drop=True), counts
+
+
+def _validate_and_profile(df: pd.DataFrame, schema_config: dict, profile: bool = True):
+    valid_df, invalid_df, counts = validate_chunk(df, schema_config)
+    if not profile:
+        return valid_df, invalid_df, counts, None
+    profile = DataProfile.from_dataframe(valid_df, schema_config, columns=list(schema_config["columns"]))
+    return valid_df, invalid_df, counts, profile
+
+
+def _validate_chunks(chunks, schema_config: dict, write_valid, quarantine_path: str, workers: int = None,
+                     dedup_index: DedupIndex = None):
+    """Validate ``chunks`` in order, passing clean rows to ``write_valid`` and quarantining the rest.
+
+    ``write_valid`` is called as ``write_valid(valid_df, rows)`` with the
+    clean rows of each chunk and the chunk's row count.
+
+    Returns ``(report, profiles)``: one profile per chunk, or, given the
+    ``dedup_index`` of all input rows, a single profile computed from the index
+    minus the quarantined rows.
+    """
+    columns = list(schema_config["columns"])
+    workers = workers or os.cpu_count() or 1
+    report = {
+        "rows": 0, "valid_rows": 0, "quarantined_rows": 0,
+        "missing_columns": [], "extra_columns": [],
+        "columns": {col: dict.fromkeys(VIOLATION_KINDS, 0) for col in columns},
+    }
+    profiles = []
+    quarantined_keys = []
+    quarantine_writer = None
+
+    def _collect(valid_df, invalid_df, counts, profile):
+        nonlocal quarantine_writer
+        write_valid(valid_df, len(valid_df) + len(invalid_df))
+        if len(invalid_df):
+            if quarantine_writer is None:
+                os.makedirs(os.path.dirname(quarantine_path), exist_ok=True)
+                quarantine_writer = CsvFeatureStore(schema_config).open_writer(quarantine_path)
+            quarantine_writer.write(invalid_df)
+            if dedup_index is not None:
+                keys, packable = dedup_index.codec.encode(invalid_df)
+                quarantined_keys.append(keys[packable])
+        for col, col_counts in counts.items():
+            for kind, count in col_counts.items():
+                report["columns"][col][kind] += count
+        report["valid_rows"] += len(valid_df)
+        report["quarantined_rows"] += len(invalid_df)
+        if profile is not None:
+            profiles.append(profile)
+
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        in_flight = deque()
+        for chunk in chunks:
+            if not report["rows"]:
+                report["missing_columns"] = [col for col in columns if col not in chunk.columns]
+                report["extra_columns"] = [col for col in chunk.columns if col not in columns]
+            report["rows"] += len(chunk)
+
+            if pool is None:
+                _collect(*_validate_and_profile(chunk, schema_config, dedup_index is None))
+                continue
+            in_flight.append(pool.submit(_validate_and_profile, chunk, schema_config, dedup_index is None))
+            if len(in_flight) >= 2 * workers:
+                _collect(*in_flight.popleft().result())
+
+        while in_flight:
+            _collect(*in_flight.popleft().result())
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        if quarantine_writer is not None:
+            quarantine_writer.close()
+
+    if dedup_index is not None:
+        if dedup_index.rows + dedup_index.unpacked_rows != report["rows"]:
+            raise ValueError(f"Dedup index holds {dedup_index.rows + dedup_index.unpacked_rows} rows, "
+                             f"the data {report['rows']}")
+        valid_index = dedup_index.subtract(np.concatenate(quarantined_keys or [np.zeros(0, dtype=np.uint64)]))
+        profiles = [DataProfile.from_dedup_index(valid_index, schema_config)]
+    return report, profiles
+
+
+def _merged_profile(profiles: list, empty_frame: pd.DataFrame, schema_config: dict) -> DataProfile:
+    if not profiles:
+        profiles.append(DataProfile.from_dataframe(empty_frame, schema_config, list(empty_frame.columns)))
+    return DataProfile.merge_all(profiles)
+
+
+class _DeferredValidWriter:
+    """Clean rows of a file that already has the schema's columns and dtypes.
+
+    Nothing is written while every row is clean, as the file itself is then
+    the validated file. At the first chunk with an offending row, the clean
+    rows before it are copied from the input file and every chunk's clean
+    rows are written from then on.
+    """
+
+    def __init__(self, file_path: str, feature_store: FeatureStoreBackend, valid_path: str, columns: list,
+                 chunk_rows: int):
+        self.file_path = file_path
+        self.feature_store = feature_store
+        self.valid_path = valid_path
+        self.columns = columns
+        self.chunk_rows = chunk_rows
+        self.skipped_rows = 0
+        self.writer = None
+
+    def write(self, valid_df: pd.DataFrame, rows: int):
+        if self.writer is None:
+            if len(valid_df) == rows:
+                self.skipped_rows += rows
+                return
+            self.writer = self.feature_store.open_writer(self.valid_path, self.columns)
+            remaining = self.skipped_rows
+            for chunk in self.feature_store.iter_chunks(self.file_path, self.chunk_rows):
+                if remaining <= 0:
+                    break
+                self.writer.write(chunk.iloc[:remaining].reset_index(drop=True))
+                remaining -= len(chunk)
+        self.writer.write(valid_df)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if self.writer is not None:
+            self.writer.close()
+        elif exc_type is None:
+            link_or_copy_file(self.file_path, self.valid_path)
+
+
+def validate_file(file_path: str, feature_store: FeatureStoreBackend, schema_config: dict, valid_path: str,
+                  quarantine_path: str, chunk_rows: int, workers: int = None, dedup_index: DedupIndex = None,
+                  link_unchanged: bool = False):
+    """Stream ``file_path`` through ``validate_chunk`` and split it into two files.
+
+    Clean rows are written to ``valid_path`` in the format of ``feature_store``;
+    offending rows go unchanged to the CSV ``quarantine_path``, which is only
+    created if there are any. Chunks are validated on a pool of ``workers``
+    processes (all cores by default, inline for one worker) with at most two
+    chunks per worker in flight, and written in input order.
+
+    ``link_unchanged`` tells that the file already has the schema's columns
+    and dtypes: if no row is quarantined, ``valid_path`` becomes a link to
+    ``file_path`` and the clean rows are never written.
+
+    Returns ``(report, profile)``: row and per-column violation counts, and the
+    DataProfile of the clean rows. With ``dedup_index``, the index of the
+    file's rows, the profile is computed from its distinct rows instead of
+    from every chunk.
+    """
+    try:
+        columns = list(schema_config["columns"])
+        os.makedirs(os.path.dirname(valid_path), exist_ok=True)
+        if link_unchanged:
+            valid_writer = _DeferredValidWriter(file_path, feature_store, valid_path, columns, chunk_rows)
+            write_valid = valid_writer.write
+        else:
+            valid_writer = feature_store.open_writer(valid_path, columns)
+            write_valid = lambda valid_df, rows: valid_writer.write(valid_df)
+        with valid_writer:
+            report, profiles = _validate_chunks(
+                feature_store.iter_chunks(file_path, chunk_rows), schema_config,
+                write_valid, quarantine_path, workers, dedup_index
+            )
+        profile = _merged_profile(profiles, feature_store.empty_frame(columns), schema_config)
+        logger.info(f"Validated {report['rows']} rows of {file_path}: {report['valid_rows']} valid, "
+                    f"{report['quarantined_rows']} quarantined")
+        return report, profile
+    except Exception as e:
+        raise NetworkSecurityException(e, sys)
+
+
+def validate_frame(df: pd.DataFrame, schema_config: dict, quarantine_path: str, chunk_rows: int,
+                   workers: int = None, dedup_index: DedupIndex = None):
+    """``validate_file`` for a frame already in memory.
+
+    Returns ``(valid_df, report, profile)``. When no row is quarantined the
+    clean frame shares its data with ``df`` instead of being rebuilt from the
+    validated chunks.
+    """
+    try:
+        columns = list(schema_config["columns"])
+        valid_chunks = []
+        chunks = (df.iloc[start:start + chunk_rows] for start in range(0, len(df), chunk_rows))
+        report, profiles = _validate_chunks(chunks, schema_config, lambda valid_df, rows: valid_chunks.append(valid_df),
+                                            quarantine_path, workers, dedup_index)
+
+        present = [col for col in columns if col in df.columns]
+        if not report["quarantined_rows"]:
+            dtypes = get_schema_dtypes(schema_config)
+            casts = {col: dtypes[col] for col in present if col in dtypes and df[col].dtype != dtypes[col]}
+            valid_df = df[present].reset_index(drop=True)
+            if casts:
+                valid_df = valid_df.astype(casts)
+        elif valid_chunks:
+            valid_df = pd.concat(valid_chunks, ignore_index=True)
+        else:
+            valid_df = CsvFeatureStore(schema_config).empty_frame(present)
+
+        profile = _merged_profile(profiles, CsvFeatureStore(schema_config).empty_frame(columns), schema_config)
+        logger.info(f"Validated {report['rows']} rows in memory: {report['valid_rows']} valid, "
+                    f"{report['quarantined_rows']} quarantined")
+        return valid_df, report, profile
+    except Exception as e:
+        raise NetworkSecurityException(e, sys)
@@ -1,14 +1,9 @@
 import os
 import sys
 import json
-import certifi
-
-from dotenv import load_dotenv
-
-load_dotenv()
-
-MONGODB_URL = os.getenv("MONGODB_URL")
-ca = certifi.where()
+import time
+import argparse
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 
 import pandas as pd
 import numpy as np
@@ -16,39 +11,44 @@ import pymongo
 
 from networksecurity.utilities.logger import logger
 from networksecurity.utilities.exception import NetworkSecurityException
+from networksecurity.utilities.utils import read_yaml_file
+from networksecurity.utilities.mongo import get_mongo_client, close_mongo_clients
+from networksecurity.utilities.schema import read_csv_with_schema, apply_schema_dtypes, NA_VALUES
+from networksecurity.constants.train_pipeline import SCHEMA_FILE_PATH, DATA_INGESTION_ROW_HASH_FIELD
 
 class NetworkDataExtract:
     def __init__(self, database: str, collection: str, mongodb_uri:str = None):
-        self._MONGODB_URI = mongodb_uri or os.getenv("MONGODB_URI")
+        self._MONGODB_URI = mongodb_uri
         self.db_name = database
         self.collection_name = collection
-        self._client = None
         self._collection = None
         self._connect()
 
     def _connect(self):
-        """Establish MongoDB connection and get collection."""
+        """Get the collection on the process-wide pooled client (shared with every other extractor)."""
         try:
-            self._client = pymongo.MongoClient(
-                self._MONGODB_URI,
-                tlsCAFile=certifi.where()
-            )
-            self._client.admin.command('ping')
-            self._collection = self._client[self.db_name][self.collection_name]
+            self._collection = get_mongo_client(self._MONGODB_URI)[self.db_name][self.collection_name]
             logger.info(f"Successfully connected to MongoDB: {self.db_name}.{self.collection_name}")
         except Exception as e:
             error_msg = f"Failed to connect to MongoDB: {str(e)}"
             logger.error(error_msg)
             raise NetworkSecurityException(error_msg, sys)
 
+    @staticmethod
+    def _frame_to_records(data: pd.DataFrame) -> list:
+        if data.isna().any().any():
+            # pd.NA in nullable columns is not BSON-encodable
+            data = data.astype(object).where(data.notna(), None)
+        return data.to_dict('records')
+
     def _csv_to_records(self, filepath: str) -> list:
         """Convert CSV file to list of records."""
         try:
             if not os.path.exists(filepath):
                 raise FileNotFoundError(f"File not found: {filepath}")
                 
-            data = pd.read_csv(filepath)
-            records = data.to_dict('records')
+            data = read_csv_with_schema(filepath, read_yaml_file(SCHEMA_FILE_PATH))
+            records = self._frame_to_records(data)
             logger.info(f"Read {len(records)} records from {filepath}")
             return records
         except Exception as e:
@@ -82,15 +82,135 @@ class NetworkDataExtract:
             logger.error(error_msg)
             raise NetworkSecurityException(error_msg, sys)
 
-    def __del__(self):
-        """Clean up resources."""
-        if hasattr(self, '_client') and self._client:
-            self._client.close()
-            logger.info("MongoDB connection closed")
+    @staticmethod
+    def _row_hashes(chunk: pd.DataFrame) -> np.ndarray:
+        """64-bit hash per row that does not depend on the dtypes the chunk was read in.
+
+        Schema casts fall back to wider dtypes (int64, object) for a chunk holding
+        an out-of-range or non-numeric value, and ``hash_pandas_object`` hashes
+        int8, Int8 and int64 differently. Each value is hashed as a float64
+        number, or as a string where it is not numeric, and the column hashes
+        are combined in column order.
+        """
+        hashes = np.zeros(len(chunk), dtype=np.uint64)
+        for col in chunk.columns:
+            series = chunk[col]
+            numeric = pd.to_numeric(series, errors="coerce").astype("float64")
+            column_hashes = pd.util.hash_array(numeric.to_numpy())
+            if not pd.api.types.is_numeric_dtype(series):
+                text = (numeric.isna() & series.notna()).to_numpy()
+                column_hashes[text] = pd.util.hash_array(series[text].astype(str).to_numpy(dtype=object))
+            hashes = (hashes ^ column_hashes) * np.uint64(0x100000001B3)
+        return hashes
+
+    @staticmethod
+    def _row_keys(chunk: pd.DataFrame, seen: dict) -> np.ndarray:
+        """Content-hash key per row: ``<64-bit row hash>-<occurrence>``.
+
+        Rows hash the same whichever chunk they are read in (see ``_row_hashes``).
+        The occurrence number counts earlier identical rows in the file (``seen``
+        carries the counts across chunks), so legitimately repeated rows stay
+        distinct documents while a rerun of the same file maps onto the same keys.
+        """
+        hashes = NetworkDataExtract._row_hashes(chunk)
+        hash_series = pd.Series(hashes)
+        previous = hash_series.map(seen).fillna(0).to_numpy(dtype=np.int64)
+        occurrence = hash_series.groupby(hashes).cumcount().to_numpy() + previous
+        for value, count in hash_series.value_counts().items():
+            seen[value] = seen.get(value, 0) + count
+        return np.array([f"{h:016x}-{n}" for h, n in zip(hashes, occurrence)], dtype=object)
+
+    def _write_chunk(self, records: list, keys, upsert: bool, max_retries: int) -> dict:
+        """Write one chunk unordered, retrying transient connection errors."""
+        for attempt in range(1, max_retries + 1):
+            try:
+                if upsert:
+                    operations = [
+                        pymongo.UpdateOne({DATA_INGESTION_ROW_HASH_FIELD: key}, {"$setOnInsert": record}, upsert=True)
+                        for key, record in zip(keys, records)
+                    ]
+                    result = self._collection.bulk_write(operations, ordered=False)
+                    return {"inserted": result.upserted_count, "existing": result.matched_count}
+                result = self._collection.insert_many(records, ordered=False)
+                return {"inserted": len(result.inserted_ids), "existing": 0}
+            except pymongo.errors.AutoReconnect as e:
+                if attempt == max_retries:
+                    raise
+                logger.warning(f"Retrying chunk after connection error ({attempt}/{max_retries}): {e}")
+                time.sleep(2 ** attempt)
+
+    def bulk_load_from_csv(self, filepath: str, chunk_size: int = 10000, workers: int = 4,
+                           upsert: bool = True, max_retries: int = 3) -> dict:
+        """Stream a CSV into MongoDB in chunks written concurrently by a pool of workers.
+
+        Args:
+            filepath: Path to the CSV file
+            chunk_size: Rows per chunk (and per unordered bulk write)
+            workers: Number of concurrent writer threads
+            upsert: Key documents on a row content hash so reruns do not insert duplicates
+            max_retries: Attempts per chunk on transient connection errors
+        Returns:
+            dict: Rows read, documents inserted, rows already present, seconds and rows/s
+        """
+        try:
+            if not os.path.exists(filepath):
+                raise FileNotFoundError(f"File not found: {filepath}")
+
+            logger.info(f"Bulk loading {filepath} with {workers} workers (chunk size {chunk_size}, upsert={upsert})")
+            schema_config = read_yaml_file(SCHEMA_FILE_PATH)
+            if upsert:
+                self._collection.create_index(DATA_INGESTION_ROW_HASH_FIELD, unique=True)
+
+            stats = {"rows": 0, "inserted": 0, "existing": 0}
+            seen = {}
+            start = time.perf_counter()
+
+            def _collect(done):
+                for future in done:
+                    result = future.result()
+                    stats["inserted"] += result["inserted"]
+                    stats["existing"] += result["existing"]
+
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                in_flight = set()
+                for chunk in pd.read_csv(filepath, chunksize=chunk_size, na_values=NA_VALUES):
+                    chunk = apply_schema_dtypes(chunk, schema_config)
+                    keys = self._row_keys(chunk, seen) if upsert else None
+                    in_flight.add(pool.submit(self._write_chunk, self._frame_to_records(chunk), keys,
+                                              upsert, max_retries))
+                    stats["rows"] += len(chunk)
+
+                    # Bound memory: at most two chunks per worker are queued or in flight
+                    if len(in_flight) >= 2 * workers:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        _collect(done)
+                        elapsed = time.perf_counter() - start
+                        logger.info(f"Progress: {stats['rows']} rows read, {stats['inserted']} inserted "
+                                    f"({stats['rows'] / elapsed:,.0f} rows/s)")
+
+                done, _ = wait(in_flight)
+                _collect(done)
+
+            stats["seconds"] = round(time.perf_counter() - start, 3)
+            stats["rows_per_s"] = round(stats["rows"] / stats["seconds"], 1) if stats["seconds"] else None
+            logger.info(f"Bulk load finished: {stats}")
+            return stats
+
+        except Exception as e:
+            error_msg = f"Failed to bulk load records: {str(e)}"
+            logger.error(error_msg)
+            raise NetworkSecurityException(error_msg, sys)
 
 
 if __name__ == '__main__':
-    extractor = None
+    parser = argparse.ArgumentParser(description="Load the phishing dataset into MongoDB")
+    parser.add_argument("--csv", default="Network_Data/phisingData.csv", help="path of the CSV file")
+    parser.add_argument("--chunk-size", type=int, default=10000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--no-upsert", action="store_true",
+                        help="plain unordered inserts instead of idempotent content-hash upserts")
+    args = parser.parse_args()
+
     try:
         # Initialize the extractor
         extractor = NetworkDataExtract(
@@ -99,16 +219,17 @@ if __name__ == '__main__':
         )
         
         # Insert data from CSV
-        csv_path = "Network_Data/phisingData.csv"  # Update path if needed
-        count = extractor.insert_from_csv(csv_path)
+        stats = extractor.bulk_load_from_csv(
+            args.csv,
+            chunk_size=args.chunk_size,
+            workers=args.workers,
+            upsert=not args.no_upsert
+        )
         
-        logger.info(f"Successfully inserted {count} documents into MongoDB")
+        logger.info(f"Successfully inserted {stats['inserted']} documents into MongoDB")
         
     except Exception as e:
         logger.error(f"Error: {str(e)}")
         raise
     finally:
-        # Explicitly close the MongoDB connection
-        if extractor is not None and hasattr(extractor, '_client') and extractor._client:
-            extractor._client.close()
-            logger.info("MongoDB connection closed")
\ No newline at end of file
+        close_mongo_clients()
\ No newline at end of file
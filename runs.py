@@ -0,0 +1,110 @@
+from networksecurity.entity.config_entity import RunRegistryConfig, RetentionConfig
+from networksecurity.constants import train_pipeline
+from networksecurity.utilities.exception import NetworkSecurityException
+from networksecurity.utilities.logger import logger
+from datetime import datetime
+import argparse
+import json
+import sys
+
+
+def _time(value) -> str:
+    return datetime.fromtimestamp(value).strftime("%Y-%m-%d %H:%M:%S") if value else "-"
+
+
+def _print_runs(rows: list):
+    print(f"{'run':<21}{'started':<21}{'status':<12}{'valid':<7}{'drift':<7}{'model':<26}{'test f1':>8}")
+    for row in rows:
+        valid = {None: "-", 0: "no", 1: "yes"}[row["validation_status"]]
+        drift = {None: "-", 0: "no", 1: "yes"}[row["is_drift"]]
+        f1 = f"{row['test_f1_score']:.4f}" if row["test_f1_score"] is not None else "-"
+        print(f"{row['run_id']:<21}{_time(row['started_at']):<21}{row['status']:<12}{valid:<7}{drift:<7}"
+              f"{row['best_model_name'] or '-':<26}{f1:>8}")
+
+
+def _print_history(rows: list):
+    print(f"{'run':<21}{'started':<21}{'drift':<7}{'p_val':>12}{'psi':>10}{'js':>10}")
+    for row in rows:
+        print(f"{row['run_id']:<21}{_time(row['started_at']):<21}{'yes' if row['drift_detected'] else 'no':<7}"
+              f"{row['p_val']:>12.3g}{row['psi']:>10.4f}{row['js_divergence']:>10.4f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Network Security Run Registry")
+    parser.add_argument("--artifact-root", default=train_pipeline.ARTIFACT_DIR)
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    index = commands.add_parser("index", help="index new and changed runs (backfill)")
+    index.add_argument("--force", action="store_true", help="re-index every run")
+
+    runs = commands.add_parser("list", help="list runs, most recent first")
+    runs.add_argument("--status", choices=["completed", "failed", "incomplete"])
+    outcome = runs.add_mutually_exclusive_group()
+    outcome.add_argument("--passed", action="store_true", help="only runs that passed validation")
+    outcome.add_argument("--rejected", action="store_true", help="only runs that failed validation")
+    runs.add_argument("--limit", type=int, default=20)
+
+    show = commands.add_parser("show", help="one run with its stages, artifacts and drifted features")
+    show.add_argument("run_id")
+
+    drift = commands.add_parser("drift", help="drift history of a feature, or per-feature drift counts")
+    drift.add_argument("feature", nargs="?")
+    drift.add_argument("--first", action="store_true", help="only the earliest run in which it drifted")
+    drift.add_argument("--drifted", action="store_true", help="only runs in which it drifted")
+
+    artifact = commands.add_parser("artifact", help="runs that produced a file with this SHA-256 (or prefix)")
+    artifact.add_argument("sha256")
+
+    gc = commands.add_parser("gc", help="delete old runs and the blobs no remaining run uses")
+    gc.add_argument("--keep-last", type=int, default=train_pipeline.RETENTION_KEEP_LAST_RUNS,
+                    help="number of most recent runs to keep")
+    gc.add_argument("--keep-validated", type=int, default=train_pipeline.RETENTION_KEEP_VALIDATED_RUNS,
+                    help="number of most recent runs that passed validation to keep as well")
+    gc.add_argument("--drop-baseline", action="store_true",
+                    help="do not keep the run whose data profile is the drift baseline")
+    gc.add_argument("--dry-run", action="store_true", help="only report what would be deleted")
+    args = parser.parse_args()
+
+    try:
+        from networksecurity.pipelines.run_registry import RunRegistry
+
+        registry = RunRegistry(RunRegistryConfig(args.artifact_root))
+        if args.command == "index":
+            result, printer = registry.index_all(force=args.force), None
+        elif args.command == "list":
+            validation_status = True if args.passed else False if args.rejected else None
+            result, printer = registry.runs(args.status, validation_status, limit=args.limit), _print_runs
+        elif args.command == "show":
+            result, printer = registry.run(args.run_id), None
+            if result is None:
+                sys.exit(f"No run {args.run_id} in the registry")
+        elif args.command == "drift" and args.feature is None:
+            result, printer = registry.drift_counts(), None
+        elif args.command == "drift" and args.first:
+            result, printer = registry.first_drift(args.feature), None
+        elif args.command == "drift":
+            result, printer = registry.feature_history(args.feature, drifted_only=args.drifted), _print_history
+        elif args.command == "artifact":
+            result, printer = registry.find_artifact(args.sha256), None
+        else:
+            from networksecurity.pipelines.retention import collect_garbage
+
+            retention_config = RetentionConfig(args.artifact_root)
+            retention_config.keep_last_runs = args.keep_last
+            retention_config.keep_validated_runs = args.keep_validated
+            retention_config.keep_baseline_run = not args.drop_baseline
+            result, printer = collect_garbage(retention_config, dry_run=args.dry_run), None
+            if not args.dry_run:
+                registry.index_all()
+
+        if printer is None or args.json:
+            print(json.dumps(result, indent=2))
+        else:
+            printer(result)
+    except Exception as e:
+        logger.critical("!!! Run registry command failed !!!")
+        raise NetworkSecurityException(e, sys)
+
+if __name__ == '__main__':
+    main()
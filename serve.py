@@ -0,0 +1,37 @@
+from networksecurity.entity.config_entity import PredictionServerConfig
+from networksecurity.constants import train_pipeline
+from networksecurity.utilities.exception import NetworkSecurityException
+from networksecurity.utilities.logger import logger
+import argparse
+import sys
+
+def main():
+    parser = argparse.ArgumentParser(description="Network Security Prediction Server")
+    parser.add_argument("--model", help="pickled model to serve (default: the latest trained model)")
+    parser.add_argument("--host", default=train_pipeline.SERVING_HOST)
+    parser.add_argument("--port", type=int, default=train_pipeline.SERVING_PORT)
+    parser.add_argument("--batch-window-ms", type=float, default=train_pipeline.SERVING_BATCH_WINDOW_MS,
+                        help="how long a micro-batch waits for more requests")
+    parser.add_argument("--max-batch-size", type=int, default=train_pipeline.SERVING_MAX_BATCH_SIZE)
+    parser.add_argument("--max-queue", type=int, default=train_pipeline.SERVING_MAX_QUEUE,
+                        help="queued requests beyond this are refused with 503")
+    args = parser.parse_args()
+
+    try:
+        from networksecurity.serving.server import PredictionServer
+
+        config = PredictionServerConfig(
+            model_file_path=args.model,
+            host=args.host,
+            port=args.port,
+            batch_window_ms=args.batch_window_ms,
+            max_batch_size=args.max_batch_size,
+            max_queue=args.max_queue,
+        )
+        PredictionServer(config).run()
+    except Exception as e:
+        logger.critical("!!! Prediction server failed !!!")
+        raise NetworkSecurityException(e, sys)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+import os
+
+import mongomock
+import pandas as pd
+import pytest
+
+from networksecurity.components import data_ingestion
+from networksecurity.constants import train_pipeline
+from networksecurity.pipelines import training_pipeline
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_CSV = os.path.join(REPO_ROOT, "Network_Data", "phisingData.csv")
+
+
+@pytest.fixture(autouse=True)
+def repo_cwd(monkeypatch):
+    """Relative paths in the pipeline constants (schema.yaml) resolve against the repository root."""
+    monkeypatch.chdir(REPO_ROOT)
+
+
+@pytest.fixture
+def artifact_root(tmp_path, monkeypatch) -> str:
+    """Artifacts of the test's pipeline configs go to a temporary directory."""
+    root = str(tmp_path / "Artifacts")
+    monkeypatch.setattr(train_pipeline, "ARTIFACT_DIR", root)
+    monkeypatch.setattr(training_pipeline, "ARTIFACT_DIR", root)
+    return root
+
+
+@pytest.fixture
+def mongo_collection(monkeypatch):
+    """The configured collection on an in-memory mongomock client used by DataIngestion."""
+    client = mongomock.MongoClient()
+    monkeypatch.setattr(data_ingestion, "get_mongo_client", lambda *args, **kwargs: client)
+    return client[train_pipeline.DATA_INGESTION_DATABASE_NAME][train_pipeline.DATA_INGESTION_COLLECTION_NAME]
+
+
+@pytest.fixture(scope="session")
+def phishing_frame() -> pd.DataFrame:
+    return pd.read_csv(SOURCE_CSV)
+
+
+@pytest.fixture
+def phishing_records(phishing_frame) -> list:
+    return phishing_frame.to_dict("records")
@@ -0,0 +1,89 @@
+import os
+from datetime import datetime
+
+from networksecurity.constants.train_pipeline import ARTIFACT_TIMESTAMP_FORMAT, PIPELINE_STATE_FILE_NAME
+from networksecurity.entity.artifact_entity import DataIngestionArtifact
+from networksecurity.entity.config_entity import BlobStoreConfig, RetentionConfig
+from networksecurity.pipelines.blob_store import BlobStore
+from networksecurity.pipelines.retention import collect_garbage
+from networksecurity.pipelines.run_state import PipelineRunState
+from networksecurity.utilities.utils import compute_file_hash, load_object, save_object
+
+
+def test_rewriting_an_interned_file_leaves_its_blob_intact(tmp_path):
+    blob_store = BlobStore(BlobStoreConfig(str(tmp_path)))
+    model_path = str(tmp_path / "run" / "model.pkl")
+    save_object(model_path, list(range(100_000)))
+    digest = blob_store.put(model_path)
+    assert os.path.samefile(model_path, blob_store.blob_path(digest, ".pkl"))
+
+    save_object(model_path, "retrained")
+
+    assert load_object(model_path) == "retrained"
+    assert compute_file_hash(blob_store.blob_path(digest, ".pkl")) == digest
+
+
+def _make_run(artifact_root: str, day: int, payload: bytes, blob_store: BlobStore) -> str:
+    run_dir = os.path.join(artifact_root, datetime(2026, 1, day).strftime(ARTIFACT_TIMESTAMP_FORMAT))
+    paths = [os.path.join(run_dir, "DataIngestion", name) for name in ("train.parquet", "test.parquet")]
+    for i, path in enumerate(paths):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as file:
+            file.write(payload + bytes([i]) * (1 << 16))
+    artifact = DataIngestionArtifact(train_path=paths[0], test_path=paths[1])
+    artifact.blobs = blob_store.intern_artifact(artifact)
+    PipelineRunState(os.path.join(run_dir, PIPELINE_STATE_FILE_NAME)).mark_completed("data_ingestion", artifact)
+    return run_dir
+
+
+def _retention_config(artifact_root: str) -> RetentionConfig:
+    config = RetentionConfig(artifact_root)
+    config.keep_last_runs = 1
+    config.keep_validated_runs = 0
+    config.keep_baseline_run = False
+    return config
+
+
+def test_identical_files_of_runs_share_one_blob(tmp_path):
+    artifact_root = str(tmp_path)
+    blob_store = BlobStore(BlobStoreConfig(artifact_root))
+    first = _make_run(artifact_root, 1, b"a", blob_store)
+    second = _make_run(artifact_root, 2, b"a", blob_store)
+
+    assert len(blob_store.blobs()) == 2
+    assert os.path.samefile(os.path.join(first, "DataIngestion", "train.parquet"),
+                            os.path.join(second, "DataIngestion", "train.parquet"))
+
+
+def test_garbage_collection_removes_old_runs_and_their_blobs(tmp_path):
+    artifact_root = str(tmp_path)
+    blob_store = BlobStore(BlobStoreConfig(artifact_root))
+    old_runs = [_make_run(artifact_root, day, b"a", blob_store) for day in (1, 2)]
+    latest = _make_run(artifact_root, 3, b"b", blob_store)
+    latest_blobs = set(PipelineRunState(os.path.join(latest, PIPELINE_STATE_FILE_NAME))
+                       .stages["data_ingestion"]["artifact"]["blobs"].values())
+
+    dry_run = collect_garbage(_retention_config(artifact_root), dry_run=True)
+    assert dry_run["blobs_removed"] == 2 and len(blob_store.blobs()) == 4
+    assert all(os.path.isdir(run_dir) for run_dir in old_runs)
+
+    result = collect_garbage(_retention_config(artifact_root))
+    assert result["runs_kept"] == {os.path.basename(latest): ["recent"]}
+    assert sorted(result["runs_removed"]) == sorted(os.path.basename(run_dir) for run_dir in old_runs)
+    assert (result["blobs_removed"], result["bytes_freed"]) == (dry_run["blobs_removed"], dry_run["bytes_freed"])
+    assert {digest for digest, _, _ in blob_store.blobs()} == latest_blobs
+    assert not any(os.path.exists(run_dir) for run_dir in old_runs)
+
+
+def test_garbage_collection_keeps_blobs_linked_from_elsewhere(tmp_path):
+    artifact_root = str(tmp_path)
+    blob_store = BlobStore(BlobStoreConfig(artifact_root))
+    old_run = _make_run(artifact_root, 1, b"a", blob_store)
+    cached = str(tmp_path / "cache" / "train.parquet")
+    os.makedirs(os.path.dirname(cached))
+    os.link(os.path.join(old_run, "DataIngestion", "train.parquet"), cached)
+    _make_run(artifact_root, 2, b"b", blob_store)
+
+    result = collect_garbage(_retention_config(artifact_root))
+    assert result["blobs_removed"] == 1
+    assert compute_file_hash(cached) in {digest for digest, _, _ in blob_store.blobs()}
@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import pytest
+
+from networksecurity.components.data_ingestion import DataIngestion
+from networksecurity.components.data_validation import DataValidation
+from networksecurity.entity.config_entity import TrainingPipelineConfig, DataIngestionConfig, DataValidationConfig
+from networksecurity.utilities.feature_store import get_feature_store_for_path, FeatureStoreManifest
+
+
+def _object_id(seconds_ago: int, counter: int):
+    """An ObjectId generated ``seconds_ago``, as a concurrent writer would have made it."""
+    from bson import ObjectId
+
+    generated = ObjectId.from_datetime(datetime.now(timezone.utc) - timedelta(seconds=seconds_ago))
+    return ObjectId(generated.binary[:4] + counter.to_bytes(8, "big"))
+
+
+def _ingestion(scan_workers: int = 1) -> DataIngestion:
+    config = DataIngestionConfig(TrainingPipelineConfig())
+    config.batch_size = 7
+    config.scan_workers = scan_workers
+    ingestion = DataIngestion(config)
+    ingestion._partition_count = lambda documents: min(3, documents)
+    return ingestion
+
+
+@pytest.mark.parametrize("scan_workers", [1, 3])
+def test_incremental_ingestion_appends_only_new_documents(artifact_root, mongo_collection, phishing_records,
+                                                          scan_workers):
+    ingestion = _ingestion(scan_workers)
+    ids = [mongo_collection.insert_one(dict(record)).inserted_id for record in phishing_records[:40]]
+
+    manifest = ingestion.ingest_new_data()
+    assert manifest.total_rows == 40
+    assert manifest.high_water_mark == str(max(ids))
+
+    segments = len(manifest.segments)
+    assert len(ingestion.ingest_new_data().segments) == segments
+
+    mongo_collection.insert_many([dict(record) for record in phishing_records[40:55]])
+    manifest = ingestion.ingest_new_data()
+    assert manifest.total_rows == 55
+    stored = manifest.read_segments(ingestion._schema_config)
+    pd.testing.assert_frame_equal(
+        stored.reset_index(drop=True),
+        pd.DataFrame(phishing_records[:55]).astype(stored.dtypes.to_dict()),
+    )
+
+
+@pytest.mark.parametrize("scan_workers", [1, 3])
+def test_document_committed_late_below_the_high_water_mark_is_ingested_once(
+        artifact_root, mongo_collection, phishing_records, scan_workers):
+    ingestion = _ingestion(scan_workers)
+    # One writer's documents of 100 s and 5 s ago are ingested before another's of 50 s ago is committed
+    mongo_collection.insert_many([dict(record, _id=_object_id(100, i)) for i, record in enumerate(phishing_records[:20])])
+    mongo_collection.insert_many([dict(record, _id=_object_id(5, i)) for i, record in enumerate(phishing_records[20:40])])
+    high_water_mark = ingestion.ingest_new_data().high_water_mark
+
+    mongo_collection.insert_many([dict(record, _id=_object_id(50, i)) for i, record in enumerate(phishing_records[40:45])])
+    manifest = ingestion.ingest_new_data()
+    assert manifest.total_rows == 45
+    assert manifest.high_water_mark == high_water_mark
+
+    manifest = ingestion.ingest_new_data()
+    assert manifest.total_rows == 45
+    assert FeatureStoreManifest(manifest.store_dir).recent_ids == manifest.recent_ids
+
+
+def test_validation_shares_workers_by_the_configured_split(artifact_root, mongo_collection, phishing_records):
+    mongo_collection.insert_many(phishing_records[:2000])
+    training_pipeline_config = TrainingPipelineConfig()
+    config = DataIngestionConfig(training_pipeline_config)
+    config.train_test_split_ratio = 0.5
+    artifact = DataIngestion(config).initiate_data_ingestion()
+
+    splits = [get_feature_store_for_path(path).read(path) for path in (artifact.train_path, artifact.test_path)]
+    assert (artifact.train_rows, artifact.test_rows) == tuple(len(split) for split in splits)
+    validation = DataValidation(DataValidationConfig(training_pipeline_config), artifact)
+    assert validation._test_share() == pytest.approx(0.5, abs=0.01)
+
+    artifact.train_rows = artifact.test_rows = None
+    assert validation._test_share() == pytest.approx(0.5, abs=0.05)
+
+
+@pytest.mark.parametrize("incremental", [True, False])
+def test_malformed_row_after_first_batch_is_ingested_and_quarantined(
+        artifact_root, mongo_collection, phishing_records, incremental):
+    records = phishing_records[:6000]
+    records[5500]["URL_Length"] = "abc"
+    records[5600]["URL_Length"] = 300
+    mongo_collection.insert_many(records)
+
+    training_pipeline_config = TrainingPipelineConfig()
+    config = DataIngestionConfig(training_pipeline_config)
+    config.batch_size = 5000
+    config.incremental = incremental
+    artifact = DataIngestion(config).initiate_data_ingestion()
+
+    splits = [get_feature_store_for_path(path).read(path) for path in (artifact.train_path, artifact.test_path)]
+    assert sum(len(split) for split in splits) == 6000
+
+    validation = DataValidation(DataValidationConfig(training_pipeline_config), artifact).initiate_data_validation()
+    quarantined = [pd.read_csv(path) for path in (validation.invalid_train_file_path,
+                                                   validation.invalid_test_file_path) if path]
+    assert sorted(pd.concat(quarantined)["URL_Length"].astype(str)) == ["300", "abc"]
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+from scipy.spatial.distance import jensenshannon
+from scipy.stats import chi2_contingency, entropy
+
+from networksecurity.utilities.drift import (
+    chi_square_test, population_stability_index, jensen_shannon_divergence, compare_histograms
+)
+
+
+@pytest.fixture
+def histograms():
+    rng = np.random.default_rng(0)
+    base = rng.integers(1, 500, size=(6, 4))
+    current = rng.integers(1, 500, size=(6, 4))
+    current[0] = base[0] * 3  # same distribution as the base
+    return base, current
+
+
+def test_chi_square_matches_scipy(histograms):
+    base, current = histograms
+    statistic, p_value = chi_square_test(base, current)
+
+    for i in range(len(base)):
+        expected = chi2_contingency(np.vstack([base[i], current[i]]), correction=False)
+        assert statistic[i] == pytest.approx(expected.statistic)
+        assert p_value[i] == pytest.approx(expected.pvalue)
+    assert p_value[0] == pytest.approx(1.0)
+
+
+def test_chi_square_ignores_bins_empty_in_both_samples(histograms):
+    base, current = histograms
+    statistic, p_value = chi_square_test(np.c_[base, np.zeros(len(base))], np.c_[current, np.zeros(len(base))])
+
+    np.testing.assert_allclose((statistic, p_value), chi_square_test(base, current))
+    assert chi_square_test(np.array([[5, 0]]), np.array([[7, 0]]))[1][0] == 1.0
+
+
+def test_psi_matches_symmetric_kl_divergence(histograms):
+    base, current = histograms
+    psi = population_stability_index(base, current)
+
+    for i in range(len(base)):
+        assert psi[i] == pytest.approx(entropy(current[i], base[i]) + entropy(base[i], current[i]))
+
+
+def test_jensen_shannon_matches_scipy(histograms):
+    base, current = histograms
+    js = jensen_shannon_divergence(np.c_[base, np.zeros(len(base))], np.c_[current, np.arange(len(base))])
+
+    for i in range(len(base)):
+        expected = jensenshannon(np.r_[base[i], 0], np.r_[current[i], i], base=2) ** 2
+        assert js[i] == pytest.approx(expected, abs=1e-12)
+
+
+def test_compare_histograms_flags_drift_with_bonferroni_threshold(histograms):
+    base, current = histograms
+    columns = [f"feature_{i}" for i in range(len(base))]
+    is_drift, report = compare_histograms(columns, base, current, threshold=0.05)
+
+    _, p_value = chi_square_test(base, current)
+    assert is_drift == bool((p_value < 0.05 / len(columns)).any())
+    assert [report[col]["drift_detected"] for col in columns] == list(p_value < 0.05 / len(columns))
+    assert not report["feature_0"]["drift_detected"]
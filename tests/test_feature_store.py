@@ -0,0 +1,88 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from networksecurity.constants.train_pipeline import SCHEMA_FILE_PATH
+from networksecurity.utilities.feature_store import FEATURE_STORE_BACKENDS, get_feature_store, get_feature_store_for_path
+from networksecurity.utilities.schema import apply_schema_dtypes
+from networksecurity.utilities.utils import read_yaml_file
+
+
+@pytest.fixture
+def schema_config():
+    return read_yaml_file(SCHEMA_FILE_PATH)
+
+
+@pytest.fixture
+def typed_frame(phishing_frame, schema_config) -> pd.DataFrame:
+    df = phishing_frame.head(500).astype({col: "Int8" for col in phishing_frame.columns[:2]})
+    df.iloc[3, 0] = pd.NA
+    return apply_schema_dtypes(df, schema_config)
+
+
+@pytest.mark.parametrize("file_format", sorted(FEATURE_STORE_BACKENDS))
+def test_feature_store_round_trip(tmp_path, schema_config, typed_frame, file_format):
+    feature_store = get_feature_store(file_format, schema_config)
+    file_path = str(tmp_path / f"data{feature_store.extension}")
+    feature_store.write(typed_frame, file_path)
+
+    pd.testing.assert_frame_equal(feature_store.read(file_path), typed_frame)
+    columns = list(typed_frame.columns[:3])
+    pd.testing.assert_frame_equal(feature_store.read(file_path, columns=columns), typed_frame[columns])
+    assert get_feature_store_for_path(file_path, schema_config).name == file_format
+
+
+@pytest.mark.parametrize("file_format", sorted(FEATURE_STORE_BACKENDS))
+def test_feature_store_iter_chunks(tmp_path, schema_config, typed_frame, file_format):
+    feature_store = get_feature_store(file_format, schema_config)
+    file_path = str(tmp_path / f"data{feature_store.extension}")
+    feature_store.write(typed_frame, file_path)
+
+    chunks = list(feature_store.iter_chunks(file_path, 128))
+    assert [len(chunk) for chunk in chunks] == [128, 128, 128, 116]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True), typed_frame, check_dtype=False)
+
+
+@pytest.mark.parametrize("file_format", sorted(FEATURE_STORE_BACKENDS))
+def test_feature_store_writer_matches_single_write(tmp_path, schema_config, typed_frame, file_format):
+    feature_store = get_feature_store(file_format, schema_config)
+    file_path = str(tmp_path / f"data{feature_store.extension}")
+    with feature_store.open_writer(file_path, list(typed_frame.columns)) as writer:
+        for start in range(0, len(typed_frame), 200):
+            writer.write(typed_frame.iloc[start:start + 200])
+
+    assert writer.rows == len(typed_frame)
+    pd.testing.assert_frame_equal(feature_store.read(file_path), typed_frame)
+
+
+@pytest.mark.parametrize("file_format", sorted(FEATURE_STORE_BACKENDS))
+def test_feature_store_writer_without_chunks_writes_empty_frame(tmp_path, schema_config, file_format):
+    feature_store = get_feature_store(file_format, schema_config)
+    file_path = str(tmp_path / f"data{feature_store.extension}")
+    columns = list(schema_config["columns"])[:4]
+    feature_store.open_writer(file_path, columns).close()
+
+    result = feature_store.read(file_path)
+    assert list(result.columns) == columns and result.empty
+
+
+def test_parquet_writer_widens_schema_for_later_chunks(tmp_path):
+    feature_store = get_feature_store("parquet")
+    file_path = str(tmp_path / "data.parquet")
+    chunks = [
+        pd.DataFrame({"a": np.array([1, -1], dtype="int8"), "b": pd.array([1, None], dtype="Int8")}),
+        pd.DataFrame({"a": np.array([300, 1]), "b": pd.array([0, 1], dtype="Int8")}),
+        pd.DataFrame({"a": pd.Series(["abc", 1], dtype=object), "b": pd.array([1, 0], dtype="Int8")}),
+        pd.DataFrame({"a": np.array([0, 1], dtype="int8"), "b": pd.array([-1, 0], dtype="Int8")}),
+    ]
+    with feature_store.open_writer(file_path) as writer:
+        for chunk in chunks:
+            writer.write(chunk)
+
+    result = feature_store.read(file_path)
+    assert os.listdir(tmp_path) == ["data.parquet"]
+    assert list(result["a"].astype(str)) == ["1", "-1", "300", "1", "abc", "1", "0", "1"]
+    assert str(result["b"].dtype) == "Int8"
+    assert result["b"].isna().sum() == 1
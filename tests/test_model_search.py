@@ -0,0 +1,34 @@
+import os
+import time
+
+from networksecurity.utilities.model_search import CandidateCache
+
+
+def _put(cache: CandidateCache, key: str, days_ago: float):
+    cache.put(key, {"key": key, "cv_score": 0.5}, list(range(1000)))
+    last_used = time.time() - days_ago * 86400
+    for extension in (".pkl", ".json"):
+        os.utime(cache.path(key, extension), (last_used, last_used))
+
+
+def test_evict_drops_stale_then_least_recently_used_candidates(tmp_path):
+    cache = CandidateCache(str(tmp_path))
+    for key, days_ago in (("aa01", 40), ("ab02", 3), ("bc03", 2), ("cd04", 1)):
+        _put(cache, key, days_ago)
+    entry_bytes = sum(os.path.getsize(cache.path("cd04", extension)) for extension in (".pkl", ".json"))
+    # A lookup makes the oldest remaining entry the most recently used
+    assert cache.result("ab02")["key"] == "ab02"
+
+    assert cache.evict(max_bytes=2 * entry_bytes, max_age_days=30) == 2
+    assert [key for key in ("aa01", "ab02", "bc03", "cd04") if cache.result(key)] == ["ab02", "cd04"]
+    assert sorted(os.listdir(tmp_path)) == ["ab", "cd"]
+
+
+def test_evict_removes_leftovers_of_interrupted_writes(tmp_path):
+    cache = CandidateCache(str(tmp_path))
+    _put(cache, "aa01", 0)
+    os.remove(cache.path("aa01", ".json"))
+
+    assert cache.result("aa01") is None
+    assert cache.evict(max_bytes=0, max_age_days=30) == 1
+    assert not os.listdir(tmp_path)
@@ -0,0 +1,43 @@
+import os
+
+import pytest
+
+from networksecurity.components.model_trainer import ModelTrainer
+from networksecurity.entity.artifact_entity import DataValidationArtifact
+from networksecurity.entity.config_entity import TrainingPipelineConfig, ModelTrainerConfig
+from networksecurity.utilities.exception import NetworkSecurityException
+from networksecurity.utilities.feature_store import get_feature_store
+from networksecurity.utilities.utils import read_yaml_file
+
+
+def _validation_artifact(tmp_path, phishing_frame, **kwargs) -> DataValidationArtifact:
+    feature_store = get_feature_store("parquet")
+    paths = [str(tmp_path / f"{name}.parquet") for name in ("train", "test")]
+    feature_store.write(phishing_frame.iloc[:2000], paths[0])
+    feature_store.write(phishing_frame.iloc[2000:2500], paths[1])
+    return DataValidationArtifact(valid_train_file_path=paths[0], valid_test_file_path=paths[1],
+                                  invalid_train_file_path=None, invalid_test_file_path=None,
+                                  drift_report_file_path=str(tmp_path / "report.yaml"), **kwargs)
+
+
+def _trainer(artifact: DataValidationArtifact) -> ModelTrainer:
+    config = ModelTrainerConfig(TrainingPipelineConfig())
+    config.search_space = {"DecisionTreeClassifier": {"max_depth": [8]}}
+    config.workers = 1
+    return ModelTrainer(config, artifact)
+
+
+def test_drifted_dataset_is_trained_on(artifact_root, tmp_path, phishing_frame):
+    trainer = _trainer(_validation_artifact(tmp_path, phishing_frame, validation_status=True, drift_detected=True))
+    model_trainer_artifact = trainer.initiate_model_trainer()
+
+    assert os.path.exists(model_trainer_artifact.trained_model_file_path)
+    assert read_yaml_file(model_trainer_artifact.metrics_file_path)["drift_detected"] is True
+
+
+def test_dataset_failing_validation_is_refused(artifact_root, tmp_path, phishing_frame):
+    trainer = _trainer(_validation_artifact(tmp_path, phishing_frame, validation_status=False))
+
+    with pytest.raises(NetworkSecurityException, match="refusing to train"):
+        trainer.initiate_model_trainer()
+    assert not os.path.exists(trainer.model_trainer_config.trained_model_file_path)
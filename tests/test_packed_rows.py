@@ -0,0 +1,82 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from networksecurity.constants.train_pipeline import SCHEMA_FILE_PATH
+from networksecurity.utilities.drift import value_histograms
+from networksecurity.utilities.packed_rows import RowCodec, DedupIndex
+from networksecurity.utilities.schema import apply_schema_dtypes
+from networksecurity.utilities.utils import read_yaml_file
+
+
+@pytest.fixture
+def schema_config():
+    return read_yaml_file(SCHEMA_FILE_PATH)
+
+
+@pytest.fixture
+def codec(schema_config) -> RowCodec:
+    return RowCodec.from_schema(schema_config)
+
+
+@pytest.fixture
+def frame(phishing_frame, schema_config) -> pd.DataFrame:
+    return apply_schema_dtypes(phishing_frame.head(2000), schema_config)
+
+
+def test_row_codec_round_trip(codec, frame):
+    keys, packable = codec.encode(frame)
+
+    assert packable.all()
+    assert codec.bits == 2
+    pd.testing.assert_frame_equal(codec.decode(keys), frame[codec.columns].astype(np.int8))
+
+
+def test_row_codec_leaves_out_rows_it_cannot_pack(codec, frame):
+    df = frame.head(5).astype({codec.columns[0]: "float64", codec.columns[1]: "object"})
+    df.iloc[0, 0] = np.nan
+    df.iloc[1, 0] = 0.5
+    df.iloc[2, 0] = 2
+    df.iloc[3, 1] = "abc"
+
+    keys, packable = codec.encode(df)
+    assert packable.tolist() == [False, False, False, False, True]
+    assert (keys[~packable] == 0).all()
+    assert not codec.encode(df.drop(columns=codec.columns[-1]))[1].any()
+
+
+def test_row_codec_rejects_columns_beyond_key_bits():
+    with pytest.raises(ValueError):
+        RowCodec([f"c{i}" for i in range(33)], -1, 1)
+
+
+def test_dedup_index_counts_and_histograms(codec, frame):
+    index = DedupIndex.from_frame(frame, codec)
+
+    assert index.rows == len(frame)
+    assert index.unique_rows == len(frame[codec.columns].drop_duplicates())
+    assert (index.keys[1:] > index.keys[:-1]).all()
+    np.testing.assert_array_equal(index.value_histograms(), value_histograms(frame, codec.columns, -1, 1))
+
+    distinct = index.to_frame()
+    assert distinct["count"].sum() == len(frame)
+
+
+def test_dedup_index_merge_subtract_and_save(tmp_path, codec, frame):
+    first, second = frame.iloc[:1200], frame.iloc[1200:]
+    merged = DedupIndex.from_frame(first, codec).merge(DedupIndex.from_frame(second, codec))
+    whole = DedupIndex.from_frame(frame, codec)
+    np.testing.assert_array_equal(merged.keys, whole.keys)
+    np.testing.assert_array_equal(merged.counts, whole.counts)
+
+    remaining = whole.subtract(codec.encode(second)[0])
+    np.testing.assert_array_equal(remaining.value_histograms(), DedupIndex.from_frame(first, codec).value_histograms())
+    with pytest.raises(ValueError):
+        DedupIndex.from_frame(first.head(1), codec).subtract(codec.encode(first.head(2))[0])
+
+    path = str(tmp_path / "index.npz")
+    whole.save(path)
+    loaded = DedupIndex.load(path)
+    assert loaded.codec.columns == codec.columns
+    np.testing.assert_array_equal(loaded.keys, whole.keys)
+    np.testing.assert_array_equal(loaded.counts, whole.counts)
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from networksecurity.utilities.prediction_cache import PredictionCache
+
+
+def _keys(*values) -> np.ndarray:
+    return np.array(values, dtype=np.uint64)
+
+
+def _fill(cache: PredictionCache, *keys):
+    """Look up then insert ``keys`` one batch each, as a prediction batch would."""
+    for key in keys:
+        found, _ = cache.lookup(_keys(key))
+        if not found[0]:
+            cache.insert(_keys(key), np.array([key % 2]))
+
+
+def test_lookup_returns_inserted_values():
+    cache = PredictionCache(capacity=1000)
+    cache.insert(_keys(3, 5, 9), np.array([1, 0, 1]))
+
+    found, values = cache.lookup(_keys(2, 5, 9))
+    assert found.tolist() == [False, True, True]
+    assert values[found].tolist() == [0, 1]
+    assert cache.stats()["hits"] == 2 and cache.stats()["lookups"] == 3
+
+
+def test_buffered_entries_are_merged_into_the_sorted_table():
+    cache = PredictionCache(capacity=1000)
+    keys = np.random.default_rng(0).permutation(200).astype(np.uint64)
+    for batch in np.array_split(keys, 20):
+        batch = np.sort(batch)
+        cache.insert(batch, batch.astype(np.int64) * 2)
+
+    assert len(cache) == 200 and cache.evictions == 0
+    found, values = cache.lookup(np.arange(250, dtype=np.uint64))
+    assert found.sum() == 200
+    assert (values[:200] == np.arange(200) * 2).all()
+
+
+def test_lru_evicts_least_recently_used_down_to_low_water():
+    cache = PredictionCache(capacity=4, policy="lru")
+    _fill(cache, 1, 2, 3, 4, 1, 5)
+
+    assert cache.keys.tolist() == [1, 4, 5]
+    assert cache.evictions == 2
+
+
+def test_lfu_evicts_least_used_and_older_among_equals():
+    cache = PredictionCache(capacity=4, policy="lfu")
+    _fill(cache, 1, 1, 1, 2, 3, 3, 4, 5)
+
+    assert cache.keys.tolist() == [1, 3, 5]
+    assert len(cache) == cache.low_water
+
+
+def test_insert_beyond_capacity_in_one_batch_keeps_capacity():
+    cache = PredictionCache(capacity=4)
+    cache.insert(_keys(*range(10)), np.arange(10))
+
+    assert len(cache) == cache.low_water == 3
+    assert cache.evictions == 7
+
+
+@pytest.mark.parametrize("kwargs", [{"capacity": 0}, {"capacity": 5, "policy": "fifo"}])
+def test_invalid_configuration_is_rejected(kwargs):
+    with pytest.raises(ValueError):
+        PredictionCache(**kwargs)
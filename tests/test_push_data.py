@@ -0,0 +1,48 @@
+import mongomock
+import pytest
+
+import push_data
+from networksecurity.constants.train_pipeline import DATA_INGESTION_ROW_HASH_FIELD
+
+
+@pytest.fixture
+def extractor(monkeypatch) -> push_data.NetworkDataExtract:
+    client = mongomock.MongoClient()
+    monkeypatch.setattr(push_data, "get_mongo_client", lambda *args, **kwargs: client)
+    return push_data.NetworkDataExtract(database="network_security", collection="phishing_data")
+
+
+@pytest.fixture
+def csv_path(tmp_path, phishing_frame) -> str:
+    """Rows whose chunks infer different dtypes: out of int8 range, text, missing and repeated values."""
+    df = phishing_frame.head(300).astype(object)
+    df.loc[10, "URL_Length"] = 300
+    df.loc[150, "URL_Length"] = "abc"
+    df.loc[250, "SSLfinal_State"] = "na"
+    df.loc[299] = df.loc[0]
+    path = str(tmp_path / "data.csv")
+    df.to_csv(path, index=False)
+    return path
+
+
+def _keys(extractor: push_data.NetworkDataExtract) -> list:
+    return sorted(document[DATA_INGESTION_ROW_HASH_FIELD] for document in extractor._collection.find())
+
+
+def test_row_keys_do_not_depend_on_chunk_size(extractor, csv_path):
+    stats = extractor.bulk_load_from_csv(csv_path, chunk_size=100, workers=2)
+    keys = _keys(extractor)
+    assert stats["inserted"] == 300 and len(set(keys)) == 300
+
+    stats = extractor.bulk_load_from_csv(csv_path, chunk_size=77, workers=2)
+    assert stats["inserted"] == 0 and stats["existing"] == 300
+    assert _keys(extractor) == keys
+
+
+def test_row_hashes_do_not_depend_on_dtypes(phishing_frame):
+    frame = phishing_frame.head(50)
+    hashes = push_data.NetworkDataExtract._row_hashes(frame.astype("int8"))
+
+    for dtype in ("int64", "Int8", "float64", object, str):
+        assert (push_data.NetworkDataExtract._row_hashes(frame.astype(dtype)) == hashes).all(), dtype
+    assert len(set(hashes)) == len(frame.drop_duplicates())
@@ -0,0 +1,76 @@
+import os
+import shutil
+
+from networksecurity.entity.artifact_entity import DataIngestionArtifact
+from networksecurity.entity.config_entity import TrainingPipelineConfig, StageCacheConfig
+from networksecurity.pipelines.stage_cache import StageCache
+
+FILE_BYTES = 1 << 16
+
+
+def _stage_cache(max_bytes: int) -> StageCache:
+    config = StageCacheConfig(TrainingPipelineConfig())
+    config.max_bytes = max_bytes
+    return StageCache(config)
+
+
+def _put(stage_cache: StageCache, run_dir: str, fingerprint: str, payload: bytes = None) -> DataIngestionArtifact:
+    paths = [os.path.join(run_dir, "data_ingestion", name) for name in ("train.parquet", "test.parquet")]
+    for path in paths:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as file:
+            file.write(payload or os.urandom(FILE_BYTES))
+    artifact = DataIngestionArtifact(train_path=paths[0], test_path=paths[1])
+    stage_cache.put("data_ingestion", fingerprint, artifact, run_dir)
+    return artifact
+
+
+def _cached(stage_cache: StageCache) -> list:
+    return sorted(os.listdir(os.path.join(stage_cache.cache_dir, "data_ingestion")))
+
+
+def test_evict_does_not_count_files_still_linked_from_runs(artifact_root):
+    stage_cache = _stage_cache(max_bytes=3 * FILE_BYTES)
+    run_dirs = [os.path.join(artifact_root, f"run{i}") for i in range(3)]
+    for i, run_dir in enumerate(run_dirs):
+        _put(stage_cache, run_dir, f"{i:064x}")
+    assert len(_cached(stage_cache)) == 3
+
+    # Freed by eviction once the runs are gone: three entries of two files do not fit in three files
+    for run_dir in run_dirs:
+        shutil.rmtree(run_dir)
+    assert stage_cache.evict() == 2
+    assert _cached(stage_cache) == [f"{2:064x}"]
+
+
+def test_evict_counts_files_shared_by_entries_once(artifact_root):
+    stage_cache = _stage_cache(max_bytes=2 * FILE_BYTES + 4096)
+    payload = os.urandom(FILE_BYTES)
+    run_dir = os.path.join(artifact_root, "run")
+    first = _put(stage_cache, run_dir, f"{0:064x}", payload)
+    os.remove(first.train_path)
+    os.link(first.test_path, first.train_path)
+    stage_cache.put("data_ingestion", f"{1:064x}", first, run_dir)
+    shutil.rmtree(run_dir)
+
+    assert stage_cache.evict() == 0
+    assert len(_cached(stage_cache)) == 2
+
+
+def test_unreadable_entry_is_a_miss_and_evicted_first(artifact_root):
+    stage_cache = _stage_cache(max_bytes=1 << 30)
+    run_dir = os.path.join(artifact_root, "run")
+    _put(stage_cache, run_dir, f"{0:064x}")
+    _put(stage_cache, run_dir, f"{1:064x}")
+    entry_path = os.path.join(stage_cache.cache_dir, "data_ingestion", f"{0:064x}", StageCache.ENTRY_FILE_NAME)
+    with open(entry_path, "w") as file:
+        file.write('{"fields": ')
+
+    assert stage_cache.get("data_ingestion", f"{0:064x}", DataIngestionArtifact, run_dir) is None
+    assert stage_cache.get("data_ingestion", f"{1:064x}", DataIngestionArtifact, run_dir) is not None
+    assert [name for name in os.listdir(os.path.dirname(entry_path)) if name.endswith(".tmp")] == []
+
+    shutil.rmtree(run_dir)
+    stage_cache.stage_cache_config.max_bytes = 3 * FILE_BYTES
+    assert stage_cache.evict() == 1
+    assert _cached(stage_cache) == [f"{1:064x}"]
@@ -0,0 +1,70 @@
+import os
+import shutil
+from datetime import datetime
+
+from networksecurity.entity.artifact_entity import DataIngestionArtifact
+from networksecurity.entity.config_entity import TrainingPipelineConfig, DataIngestionConfig
+from networksecurity.pipelines.run_state import PipelineRunState
+from networksecurity.pipelines.training_pipeline import TrainingPipeline
+
+
+def _pipeline(timestamp: datetime = None, **kwargs) -> TrainingPipeline:
+    pipeline = TrainingPipeline(**kwargs)
+    if timestamp is not None:
+        # Runs started within one second would share a directory
+        pipeline.training_pipeline_config = TrainingPipelineConfig(timestamp=timestamp)
+        pipeline.run_state = PipelineRunState(pipeline.training_pipeline_config.pipeline_state_file_path)
+    return pipeline
+
+
+def _run_ingestion(pipeline: TrainingPipeline, calls: list) -> DataIngestionArtifact:
+    config = DataIngestionConfig(pipeline.training_pipeline_config)
+
+    def run():
+        calls.append(pipeline.training_pipeline_config.artifact_dir)
+        for path in (config.train_file_path, config.test_file_path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as file:
+                file.write(os.urandom(1 << 17))
+        return DataIngestionArtifact(train_path=config.train_file_path, test_path=config.test_file_path)
+
+    artifact = pipeline._run_stage("data_ingestion", DataIngestionArtifact, config, {"source": "fixed"}, run)
+    pipeline.wait_for_completions()
+    return artifact
+
+
+def test_stage_cache_hit_links_files_into_the_new_run(artifact_root):
+    calls = []
+    first = _run_ingestion(_pipeline(datetime(2026, 1, 1)), calls)
+    second_pipeline = _pipeline(datetime(2026, 1, 2))
+    second = _run_ingestion(second_pipeline, calls)
+
+    assert len(calls) == 1
+    run_dir = second_pipeline.training_pipeline_config.artifact_dir
+    for first_path, second_path in ((first.train_path, second.train_path), (first.test_path, second.test_path)):
+        assert second_path.startswith(run_dir + os.sep)
+        assert os.path.samefile(first_path, second_path)
+    assert second_pipeline.run_state.stages["data_ingestion"]["cached"]
+
+    # The run keeps its files when the cache entry goes away
+    shutil.rmtree(second_pipeline.stage_cache.cache_dir)
+    assert os.path.getsize(second.train_path) == 1 << 17
+
+
+def test_stage_cache_miss_without_cache(artifact_root):
+    calls = []
+    _run_ingestion(_pipeline(datetime(2026, 1, 1), use_cache=False), calls)
+    _run_ingestion(_pipeline(datetime(2026, 1, 2), use_cache=False), calls)
+
+    assert len(calls) == 2
+
+
+def test_resume_skips_stages_completed_in_the_run(artifact_root):
+    calls = []
+    first = _run_ingestion(_pipeline(datetime(2026, 1, 1), use_cache=False), calls)
+
+    resumed = _pipeline(resume=True, use_cache=False)
+    assert resumed.resumed
+    assert resumed.training_pipeline_config.artifact_dir == os.path.dirname(os.path.dirname(first.train_path))
+    assert _run_ingestion(resumed, calls) == DataIngestionArtifact(**resumed.run_state.stages["data_ingestion"]["artifact"])
+    assert len(calls) == 1
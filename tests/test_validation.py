@@ -0,0 +1,48 @@
+import os
+
+import pandas as pd
+import pytest
+
+from networksecurity.constants.train_pipeline import SCHEMA_FILE_PATH
+from networksecurity.utilities.feature_store import get_feature_store
+from networksecurity.utilities.schema import apply_schema_dtypes
+from networksecurity.utilities.utils import read_yaml_file
+from networksecurity.utilities.validation import validate_file
+
+
+@pytest.fixture
+def schema_config():
+    return read_yaml_file(SCHEMA_FILE_PATH)
+
+
+def _validate(tmp_path, schema_config, df: pd.DataFrame, name: str, link_unchanged: bool):
+    feature_store = get_feature_store("parquet", schema_config)
+    file_path = str(tmp_path / "input.parquet")
+    if not os.path.exists(file_path):
+        feature_store.write(df, file_path)
+    valid_path = str(tmp_path / name / "valid.parquet")
+    report, _ = validate_file(file_path, feature_store, schema_config, valid_path,
+                              str(tmp_path / name / "quarantine.csv"), chunk_rows=100, workers=1,
+                              link_unchanged=link_unchanged)
+    return report, file_path, valid_path, feature_store
+
+
+def test_clean_file_in_schema_layout_is_linked_not_written(tmp_path, schema_config, phishing_frame):
+    df = apply_schema_dtypes(phishing_frame.head(500), schema_config)
+    report, file_path, valid_path, _ = _validate(tmp_path, schema_config, df, "linked", link_unchanged=True)
+
+    assert report["quarantined_rows"] == 0
+    assert os.path.samefile(file_path, valid_path)
+
+
+def test_quarantine_after_clean_chunks_writes_every_clean_row(tmp_path, schema_config, phishing_frame):
+    df = apply_schema_dtypes(phishing_frame.head(500), schema_config)
+    df.loc[[250, 480], "URL_Length"] = 5
+    report, file_path, valid_path, feature_store = _validate(tmp_path, schema_config, df, "deferred",
+                                                             link_unchanged=True)
+    _, _, written_path, _ = _validate(tmp_path, schema_config, df, "written", link_unchanged=False)
+
+    assert report["quarantined_rows"] == 2
+    assert not os.path.samefile(file_path, valid_path)
+    pd.testing.assert_frame_equal(feature_store.read(valid_path), feature_store.read(written_path))
+    assert len(feature_store.read(valid_path)) == 498